@@ -0,0 +1,60 @@
+# times the per-key dispatch path against the implementations it replaced, run from the
+# repository root with the extension built: python benchmark/key_dispatch.py
+
+from timeit import repeat
+from weakref import WeakSet
+
+from eplatform import KeyboardKeyLocation
+from eplatform import Platform
+from eplatform import get_keyboard
+from eplatform._input_frame import change_input_frame_input
+from eplatform._keyboard import _KEY_LOCATION_TO_SDL_SCANCODE
+from eplatform._keyboard import _SDL_SCANCODE_TO_KEY_LOCATION
+from eplatform._keyboard import change_key
+
+
+def _time_ns(f, number=200000):
+    return min(repeat(f, number=number, repeat=7)) / number * 1e9
+
+
+def main():
+    with Platform():
+        keyboard = get_keyboard()
+        sdl_scancode = _KEY_LOCATION_TO_SDL_SCANCODE[KeyboardKeyLocation.LEFT_SHIFT]
+        key = keyboard.get_key_by_location(KeyboardKeyLocation.LEFT_SHIFT)
+        keys_by_location = keyboard._keys_by_location
+        keys_by_sdl_scancode = keyboard._keys_by_sdl_scancode
+
+        def location_lookup():
+            try:
+                location = _SDL_SCANCODE_TO_KEY_LOCATION[sdl_scancode]
+            except KeyError:
+                return None
+            return keys_by_location[location]
+
+        def scancode_lookup():
+            if not 0 <= sdl_scancode < len(keys_by_sdl_scancode):
+                return None
+            return keys_by_sdl_scancode[sdl_scancode]
+
+        input_frames = WeakSet()
+
+        def weak_set_change():
+            for input_frame in input_frames:
+                input_frame._change(key, True)
+
+        def registry_change():
+            change_input_frame_input(key, True)
+
+        for name, f in (
+            ("location lookup", location_lookup),
+            ("scancode lookup", scancode_lookup),
+            ("WeakSet change", weak_set_change),
+            ("registry change", registry_change),
+            ("change_key", lambda: change_key(keyboard, sdl_scancode, True, True, 0, 0)),
+        ):
+            print(f"{name}: {_time_ns(f):.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
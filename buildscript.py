@@ -26,7 +26,7 @@ if os.environ.get("EPLATFORM_BUILD_WITH_COVERAGE", "0") == "1":
 _eplatform = Extension(
     "eplatform._eplatform",
     library_dirs=["vendor/SDL"],
-    libraries=["SDL3"],
+    libraries=["SDL3", *(["ws2_32"] if system() == "Windows" else [])],
     include_dirs=["src/eplatform", "vendor/SDL/include", "vendor/emath/include"],
     sources=["src/eplatform/_eplatform.c"],
     extra_compile_args=_coverage_compile_args,
@@ -31,20 +31,43 @@ __all__ = [
     "DisplayRefreshRateChanged",
     "DisplayResized",
     "EventLoop",
+    "EventLoopStats",
+    "InputFrame",
+    "InputKind",
     "Keyboard",
     "KeyboardKey",
     "KeyboardKeyChanged",
     "KeyboardKeyLocation",
     "KeyboardModifier",
+    "KeyboardShortcut",
+    "KeyboardShortcutActivated",
+    "KeyboardShortcutStroke",
+    "KeyboardState",
     "Mouse",
     "MouseButton",
     "MouseButtonChanged",
     "MouseButtonLocation",
+    "MouseCursor",
+    "MouseCursorImage",
+    "MouseCursorShape",
+    "MouseMotionHistory",
     "MouseMoved",
+    "MouseRegion",
+    "MouseRegionButtonChanged",
+    "MouseRegionGrid",
+    "MouseRegionHovered",
     "MouseScrolled",
     "MouseScrolledDirection",
     "OpenGlWindow",
+    "Pen",
+    "PenAxis",
+    "PenAxisChanged",
+    "PenMoved",
+    "PenPressChanged",
+    "PenProximityChanged",
     "Platform",
+    "Touch",
+    "TouchFingerChanged",
     "VulkanWindow",
     "Window",
     "WindowBufferSynchronization",
@@ -52,16 +75,22 @@ __all__ = [
     "WindowIcon",
     "WindowMoved",
     "WindowResized",
+    "WindowTextEdited",
     "WindowTextInputted",
     "WindowVisibilityChanged",
     "get_clipboard",
     "get_controllers",
+    "get_disabled_input",
     "get_displays",
     "get_keyboard",
     "get_mouse",
+    "get_pen",
+    "get_touch",
     "get_window",
     "idle",
+    "install",
     "set_clipboard",
+    "set_disabled_input",
 ]
 
 from ._controller import Controller
@@ -94,27 +123,55 @@ from ._display import DisplayOrientationChanged
 from ._display import DisplayRefreshRateChanged
 from ._display import DisplayResized
 from ._event_loop import EventLoop
+from ._event_loop import EventLoopStats
 from ._event_loop import idle
+from ._event_loop import install
+from ._input_frame import InputFrame
 from ._keyboard import Keyboard
 from ._keyboard import KeyboardKey
 from ._keyboard import KeyboardKeyChanged
 from ._keyboard import KeyboardKeyLocation
 from ._keyboard import KeyboardModifier
+from ._keyboard import KeyboardShortcut
+from ._keyboard import KeyboardShortcutActivated
+from ._keyboard import KeyboardShortcutStroke
+from ._keyboard import KeyboardState
 from ._mouse import Mouse
 from ._mouse import MouseButton
 from ._mouse import MouseButtonChanged
 from ._mouse import MouseButtonLocation
+from ._mouse import MouseCursor
+from ._mouse import MouseCursorImage
+from ._mouse import MouseCursorShape
+from ._mouse import MouseMotionHistory
 from ._mouse import MouseMoved
 from ._mouse import MouseScrolled
 from ._mouse import MouseScrolledDirection
+from ._mouse_region import MouseRegion
+from ._mouse_region import MouseRegionButtonChanged
+from ._mouse_region import MouseRegionGrid
+from ._mouse_region import MouseRegionHovered
+from ._pen import Pen
+from ._pen import PenAxis
+from ._pen import PenAxisChanged
+from ._pen import PenMoved
+from ._pen import PenPressChanged
+from ._pen import PenProximityChanged
+from ._platform import InputKind
 from ._platform import Platform
 from ._platform import get_clipboard
 from ._platform import get_controllers
+from ._platform import get_disabled_input
 from ._platform import get_displays
 from ._platform import get_keyboard
 from ._platform import get_mouse
+from ._platform import get_pen
+from ._platform import get_touch
 from ._platform import get_window
 from ._platform import set_clipboard
+from ._platform import set_disabled_input
+from ._touch import Touch
+from ._touch import TouchFingerChanged
 from ._window import OpenGlWindow
 from ._window import VulkanWindow
 from ._window import Window
@@ -122,6 +179,7 @@ from ._window import WindowBufferSynchronization
 from ._window import WindowDestroyedError
 from ._window import WindowMoved
 from ._window import WindowResized
+from ._window import WindowTextEdited
 from ._window import WindowTextInputted
 from ._window import WindowVisibilityChanged
 from ._window_icon import WindowIcon
@@ -29,6 +29,7 @@ __all__ = [
     "get_controllers",
 ]
 
+from array import array
 from enum import IntFlag
 from enum import StrEnum
 from logging import getLogger
@@ -39,6 +40,7 @@ from typing import Generator
 from typing import Generic
 from typing import Literal
 from typing import Mapping
+from typing import NotRequired
 from typing import TypeAlias
 from typing import TypedDict
 from typing import TypeVar
@@ -51,9 +53,13 @@ from . import _eplatform
 from ._eplatform import SDL_GAMEPAD_BINDTYPE_AXIS
 from ._eplatform import SDL_GAMEPAD_BINDTYPE_BUTTON
 from ._eplatform import SDL_GAMEPAD_BINDTYPE_HAT
+from ._eplatform import check_controller_mapping_plan
 from ._eplatform import close_sdl_joystick
 from ._eplatform import get_sdl_joysticks
+from ._eplatform import map_controller_button
+from ._eplatform import map_controller_input
 from ._eplatform import open_sdl_joystick
+from ._input_frame import change_input_frame_input
 from ._type import SdlGamepadAxis
 from ._type import SdlGamepadButton
 from ._type import SdlGamepadButtonLabel
@@ -73,6 +79,7 @@ class ControllerDisconnectedError(RuntimeError):
 
 class _ControllerInput(Generic[_N]):
     _controller: "Controller | None"
+    _mapping_index: int = 0
 
     def __init__(self, name: _N):
         self._controller = None
@@ -103,6 +110,8 @@ class _ControllerInput(Generic[_N]):
 class ControllerAnalogInputChanged(TypedDict):
     analog_input: "ControllerAnalogInput"
     value: float
+    timestamp: int
+    sample_count: NotRequired[int]
 
 
 class ControllerAnalogInput(_ControllerInput[str]):
@@ -120,34 +129,29 @@ class ControllerAnalogInput(_ControllerInput[str]):
             raise ControllerDisconnectedError()
         return self._value
 
-    def _set_value(self, value: float) -> bool:
+    def _set_value(self, value: float, timestamp: int, sample_count: int | None = None) -> bool:
         if self._value == value:
             return False
 
         self._value = value
 
-        data: ControllerAnalogInputChanged = {"analog_input": self, "value": value}
+        data: ControllerAnalogInputChanged = {
+            "analog_input": self,
+            "value": value,
+            "timestamp": timestamp,
+        }
+        if sample_count is not None:
+            data["sample_count"] = sample_count
         ControllerAnalogInput.changed(data)
         self.changed(data)
 
         return True
 
-    def _calculate_mapping_value(
-        self, input_min: float, input_max: float, output_min: float, output_max: float
-    ) -> float | None:
-        cmp_min = input_min
-        cmp_max = input_max
-        if cmp_max < cmp_min:
-            cmp_min, cmp_max = cmp_max, cmp_min
-        if self._value >= cmp_min and self._value <= cmp_max:
-            v = (self._value - input_min) / (input_max - input_min)
-            return output_min + v * (output_max - output_min)
-        return None
-
 
 class ControllerBinaryInputChanged(TypedDict):
     binary_input: "ControllerBinaryInput"
     value: bool
+    timestamp: int
 
 
 class ControllerBinaryInput(_ControllerInput[str]):
@@ -165,13 +169,17 @@ class ControllerBinaryInput(_ControllerInput[str]):
             raise ControllerDisconnectedError()
         return self._value
 
-    def _set_value(self, value: bool) -> bool:
+    def _set_value(self, value: bool, timestamp: int) -> bool:
         if self._value == value:
             return False
 
         self._value = value
 
-        data: ControllerBinaryInputChanged = {"binary_input": self, "value": value}
+        data: ControllerBinaryInputChanged = {
+            "binary_input": self,
+            "value": value,
+            "timestamp": timestamp,
+        }
         ControllerBinaryInput.changed(data)
         self.changed(data)
 
@@ -201,6 +209,7 @@ class ControllerDirectionalInputValue(IntFlag):
 class ControllerDirectionalInputChanged(TypedDict):
     directional_input: "ControllerDirectionalInput"
     value: ControllerDirectionalInputValue
+    timestamp: int
 
 
 class ControllerDirectionalInput(_ControllerInput[str]):
@@ -218,13 +227,17 @@ class ControllerDirectionalInput(_ControllerInput[str]):
             raise ControllerDisconnectedError()
         return self._value
 
-    def _set_value(self, value: ControllerDirectionalInputValue) -> bool:
+    def _set_value(self, value: ControllerDirectionalInputValue, timestamp: int) -> bool:
         if self._value == value:
             return False
 
         self._value = value
 
-        data: ControllerDirectionalInputChanged = {"directional_input": self, "value": self._value}
+        data: ControllerDirectionalInputChanged = {
+            "directional_input": self,
+            "value": self._value,
+            "timestamp": timestamp,
+        }
         ControllerDirectionalInput.changed(data)
         self.changed(data)
 
@@ -234,6 +247,7 @@ class ControllerDirectionalInput(_ControllerInput[str]):
 class ControllerButtonChanged(TypedDict):
     button: "ControllerButton"
     is_pressed: bool
+    timestamp: int
 
 
 class ControllerButtonName(StrEnum):
@@ -270,11 +284,8 @@ class ControllerButtonName(StrEnum):
 class ControllerButton(_ControllerInput[ControllerButtonName]):
     _is_pressed: bool = False
 
-    _analog_input_affectors: tuple[tuple[ControllerAnalogInput, float, float], ...] = ()
-    _binary_input_affectors: tuple[ControllerBinaryInput, ...] = ()
-    _directional_input_affectors: tuple[
-        tuple[ControllerDirectionalInput, ControllerDirectionalInputValue], ...
-    ] = ()
+    _mapping_plan: array[float]
+    _mapping_values: array[float]
 
     changed: Event[ControllerButtonChanged] = Event()
     pressed: Event[ControllerButtonChanged] = Event()
@@ -284,36 +295,31 @@ class ControllerButton(_ControllerInput[ControllerButtonName]):
 
     def __init__(self, name: ControllerButtonName) -> None:
         super().__init__(name)
+        self._mapping_plan = array("d")
+        self._mapping_values = array("d")
         self.changed = Event()
         self.pressed = Event()
         self.released = Event()
 
     def _get_mapped_is_pressed(self) -> bool:
-        for analog_input, input_min, input_max in self._analog_input_affectors:
-            v = analog_input._calculate_mapping_value(input_min, input_max, -1.0, 1.0)
-            if v is not None:
-                v = abs(v)
-                if v > (1.0 - self.analog_mapping_threshold):
-                    return True
-                elif v < self.analog_mapping_threshold:
-                    return False
-        for binary_input in self._binary_input_affectors:
-            if binary_input.value:
-                return True
-        for directional_input, directional_input_mask in self._directional_input_affectors:
-            if (directional_input.value & directional_input_mask) != 0:
-                return True
-        return False
-
-    def _map(self) -> None:
+        return map_controller_button(
+            self._mapping_plan, self._mapping_values, self.analog_mapping_threshold
+        )
+
+    def _map(self, timestamp: int) -> None:
         is_pressed = self._get_mapped_is_pressed()
 
         if is_pressed == self._is_pressed:
             return
 
         self._is_pressed = is_pressed
+        change_input_frame_input(self, is_pressed)
 
-        data: ControllerButtonChanged = {"button": self, "is_pressed": is_pressed}
+        data: ControllerButtonChanged = {
+            "button": self,
+            "is_pressed": is_pressed,
+            "timestamp": timestamp,
+        }
         ControllerButton.changed(data)
         self.changed(data)
         if is_pressed:
@@ -338,58 +344,36 @@ class ControllerStickName(StrEnum):
 class ControllerStickChanged(TypedDict):
     stick: "ControllerStick"
     vector: DVector2
+    timestamp: int
 
 
 class ControllerStick(_ControllerInput[ControllerStickName]):
     _vector: DVector2 = DVector2(0)
 
-    _analog_input_affectors: tuple[
-        tuple[ControllerAnalogInput, float, float, float, float, int], ...
-    ] = ()
-    _binary_input_affectors: tuple[tuple[ControllerBinaryInput, float, float, int], ...] = ()
-    _directional_input_affectors: tuple[
-        tuple[ControllerDirectionalInput, ControllerDirectionalInputValue, float, float, int], ...
-    ] = ()
+    _mapping_plan: array[float]
+    _mapping_values: array[float]
 
     changed: Event[ControllerStickChanged] = Event()
 
     def __init__(self, name: ControllerStickName) -> None:
         super().__init__(name)
+        self._mapping_plan = array("d")
+        self._mapping_values = array("d")
         self.changed = Event()
 
-    def _get_mapped_vector(self) -> DVector2:
-        value = [0.0, 0.0]
-        for analog_input, *calc_args, component in self._analog_input_affectors:
-            v = analog_input._calculate_mapping_value(*calc_args)
-            if v is not None:
-                value[component] += v
-        for (
-            directional_input,
-            directional_input_mask,
-            output_min,
-            output_max,
-            component,
-        ) in self._directional_input_affectors:
-            if (directional_input.value & directional_input_mask) != 0:
-                value[component] += output_max
-            else:
-                value[component] += output_min
-        for binary_input, output_min, output_max, component in self._binary_input_affectors:
-            if binary_input.value:
-                value[component] += output_max
-            else:
-                value[component] += output_min
-        return DVector2(max(-1.0, min(value[0], 1.0)), max(-1.0, min(value[1], 1.0)))
+    def _get_mapped_vector(self) -> tuple[float, float]:
+        return map_controller_input(self._mapping_plan, self._mapping_values, -1.0, 1.0)
 
-    def _map(self) -> None:
-        vector = self._get_mapped_vector()
+    def _map(self, timestamp: int) -> None:
+        x, y = self._get_mapped_vector()
 
-        if vector == self._vector:
+        # only build a vector when the stick actually moved
+        if x == self._vector.x and y == self._vector.y:
             return
 
-        self._vector = vector
+        self._vector = vector = DVector2(x, y)
 
-        data: ControllerStickChanged = {"stick": self, "vector": vector}
+        data: ControllerStickChanged = {"stick": self, "vector": vector, "timestamp": timestamp}
         ControllerStick.changed(data)
         self.changed(data)
 
@@ -408,56 +392,39 @@ class ControllerTriggerName(StrEnum):
 class ControllerTriggerChanged(TypedDict):
     trigger: "ControllerTrigger"
     position: float
+    timestamp: int
 
 
 class ControllerTrigger(_ControllerInput[ControllerTriggerName]):
     _position: float = 0.0
 
-    _analog_input_affectors: tuple[
-        tuple[ControllerAnalogInput, float, float, float, float], ...
-    ] = ()
-    _binary_input_affectors: tuple[tuple[ControllerBinaryInput, float, float], ...] = ()
-    _directional_input_affectors: tuple[
-        tuple[ControllerDirectionalInput, ControllerDirectionalInputValue, float, float], ...
-    ] = ()
+    _mapping_plan: array[float]
+    _mapping_values: array[float]
 
     changed: Event[ControllerTriggerChanged] = Event()
 
     def __init__(self, name: ControllerTriggerName) -> None:
         super().__init__(name)
+        self._mapping_plan = array("d")
+        self._mapping_values = array("d")
         self.changed = Event()
 
     def _get_mapped_position(self) -> float:
-        value = 0.0
-        for analog_input, *calc_args in self._analog_input_affectors:
-            v = analog_input._calculate_mapping_value(*calc_args)
-            if v is not None:
-                value += v
-        for (
-            directional_input,
-            directional_input_mask,
-            output_min,
-            output_max,
-        ) in self._directional_input_affectors:
-            if (directional_input.value & directional_input_mask) != 0:
-                value += output_max
-            else:
-                value += output_min
-        for binary_input, output_min, output_max in self._binary_input_affectors:
-            if binary_input.value:
-                value += output_max
-            else:
-                value += output_min
-        return max(0.0, min(value, 1.0))
+        position, _ = map_controller_input(self._mapping_plan, self._mapping_values, 0.0, 1.0)
+        return position
 
-    def _map(self) -> None:
+    def _map(self, timestamp: int) -> None:
         position = self._get_mapped_position()
         if position == self._position:
             return
 
         self._position = position
 
-        data: ControllerTriggerChanged = {"trigger": self, "position": position}
+        data: ControllerTriggerChanged = {
+            "trigger": self,
+            "position": position,
+            "timestamp": timestamp,
+        }
         ControllerTrigger.changed(data)
         self.changed(data)
 
@@ -503,6 +470,8 @@ class Controller:
 
     _input_affects: dict[_AffectorInput, tuple[_AffecteeInput, ...]] = {}
     _input_affected_by: dict[_AffecteeInput, tuple[_AffectorInput, ...]] = {}
+    # the value of every analog, binary and directional input, indexed by their mapping index
+    _mapping_values: array[float] = array("d")
 
     _inputs: dict[
         str,
@@ -538,13 +507,14 @@ class Controller:
             id = f"(Player {self._player_index}) {id}"
         return f"<Controller {self._name!r} {id}>"
 
-    def _update_mapped_inputs(self, affector: _AffectorInput) -> None:
+    def _update_mapped_inputs(self, affector: _AffectorInput, timestamp: int) -> None:
+        self._mapping_values[affector._mapping_index] = affector._value
         try:
             affectees = self._input_affects[affector]
         except KeyError:
             return
         for affectee in affectees:
-            affectee._map()
+            affectee._map(timestamp)
 
     def get_input(
         self, name: str
@@ -743,12 +713,15 @@ def connect_controller(sdl_joystick: SdlJoystickId) -> None:
     analog_inputs: list[ControllerAnalogInput] = []
     binary_inputs: list[ControllerBinaryInput] = []
     directional_inputs: list[ControllerDirectionalInput] = []
+    mapping_values: list[float] = []
 
     for i, (value,) in enumerate(axis_details):
         name = f"analog {i}"
         input = ControllerAnalogInput(name)
         input._controller = controller
         input._value = value
+        input._mapping_index = len(mapping_values)
+        mapping_values.append(input._value)
         analog_inputs.append(input)
         if name in controller._inputs:
             raise RuntimeError(f"{name} already in inputs")
@@ -759,6 +732,8 @@ def connect_controller(sdl_joystick: SdlJoystickId) -> None:
         input = ControllerBinaryInput(name)
         input._controller = controller
         input._value = value
+        input._mapping_index = len(mapping_values)
+        mapping_values.append(input._value)
         binary_inputs.append(input)
         if name in controller._inputs:
             raise RuntimeError(f"{name} already in inputs")
@@ -769,6 +744,8 @@ def connect_controller(sdl_joystick: SdlJoystickId) -> None:
         input = ControllerDirectionalInput(name)
         input._controller = controller
         input._value = ControllerDirectionalInputValue(value)
+        input._mapping_index = len(mapping_values)
+        mapping_values.append(input._value)
         directional_inputs.append(input)
         if name in controller._inputs:
             raise RuntimeError(f"{name} already in inputs")
@@ -777,6 +754,7 @@ def connect_controller(sdl_joystick: SdlJoystickId) -> None:
     controller._analog_inputs = tuple(analog_inputs)
     controller._binary_inputs = tuple(binary_inputs)
     controller._directional_inputs = tuple(directional_inputs)
+    controller._mapping_values = array("d", mapping_values)
 
     if gamepad_info:
         mapping_details, sdl_gamepad_type = gamepad_info
@@ -848,17 +826,37 @@ def connect_controller(sdl_joystick: SdlJoystickId) -> None:
                 output._controller = controller
 
                 if input_type == SDL_GAMEPAD_BINDTYPE_BUTTON:
-                    output._binary_input_affectors += (input,)
+                    output._mapping_plan.extend(
+                        (input_type, input._mapping_index, 0.0, 0.0, 0.0, 0.0, 0)
+                    )
                 elif input_type == SDL_GAMEPAD_BINDTYPE_HAT:
                     assert input_directional_mask is not None
-                    output._directional_input_affectors += (
-                        (input, ControllerDirectionalInputValue(input_directional_mask)),
+                    output._mapping_plan.extend(
+                        (
+                            input_type,
+                            input._mapping_index,
+                            input_directional_mask,
+                            0.0,
+                            0.0,
+                            0.0,
+                            0,
+                        )
                     )
                 elif input_type == SDL_GAMEPAD_BINDTYPE_AXIS:
                     assert isinstance(input, ControllerAnalogInput)
                     assert input_axis_min is not None
                     assert input_axis_max is not None
-                    output._analog_input_affectors += ((input, input_axis_min, input_axis_max),)
+                    output._mapping_plan.extend(
+                        (
+                            input_type,
+                            input._mapping_index,
+                            input_axis_min,
+                            input_axis_max,
+                            -1.0,
+                            1.0,
+                            0,
+                        )
+                    )
                 else:
                     log.warning(f"unexpected input type {input_type!r}, skipping mapping")
                     continue
@@ -890,30 +888,41 @@ def connect_controller(sdl_joystick: SdlJoystickId) -> None:
                         assert isinstance(input, ControllerAnalogInput)
                         assert input_axis_min is not None
                         assert input_axis_max is not None
-                        output._analog_input_affectors += (
+                        output._mapping_plan.extend(
                             (
-                                input,
+                                input_type,
+                                input._mapping_index,
                                 input_axis_min,
                                 input_axis_max,
                                 output_axis_min,
                                 output_axis_max,
                                 stick_component,
-                            ),
+                            )
                         )
                     elif input_type == SDL_GAMEPAD_BINDTYPE_HAT:
                         assert input_directional_mask is not None
-                        output._directional_input_affectors += (
+                        output._mapping_plan.extend(
                             (
-                                input,
-                                ControllerDirectionalInputValue(input_directional_mask),
+                                input_type,
+                                input._mapping_index,
+                                input_directional_mask,
+                                0.0,
                                 output_axis_min,
                                 output_axis_max,
                                 stick_component,
-                            ),
+                            )
                         )
                     elif input_type == SDL_GAMEPAD_BINDTYPE_BUTTON:
-                        output._binary_input_affectors += (
-                            (input, output_axis_min, output_axis_max, stick_component),
+                        output._mapping_plan.extend(
+                            (
+                                input_type,
+                                input._mapping_index,
+                                0.0,
+                                0.0,
+                                output_axis_min,
+                                output_axis_max,
+                                stick_component,
+                            )
                         )
                     else:
                         log.warning(f"unexpected input type {input_type!r}, skipping mapping")
@@ -932,28 +941,41 @@ def connect_controller(sdl_joystick: SdlJoystickId) -> None:
                         assert isinstance(input, ControllerAnalogInput)
                         assert input_axis_min is not None
                         assert input_axis_max is not None
-                        output._analog_input_affectors += (
+                        output._mapping_plan.extend(
                             (
-                                input,
+                                input_type,
+                                input._mapping_index,
                                 input_axis_min,
                                 input_axis_max,
                                 output_axis_min,
                                 output_axis_max,
-                            ),
+                                0,
+                            )
                         )
                     elif input_type == SDL_GAMEPAD_BINDTYPE_HAT:
                         assert input_directional_mask is not None
-                        output._directional_input_affectors += (
+                        output._mapping_plan.extend(
                             (
-                                input,
-                                ControllerDirectionalInputValue(input_directional_mask),
+                                input_type,
+                                input._mapping_index,
+                                input_directional_mask,
+                                0.0,
                                 output_axis_min,
                                 output_axis_max,
-                            ),
+                                0,
+                            )
                         )
                     elif input_type == SDL_GAMEPAD_BINDTYPE_BUTTON:
-                        output._binary_input_affectors += (
-                            (input, output_axis_min, output_axis_max),
+                        output._mapping_plan.extend(
+                            (
+                                input_type,
+                                input._mapping_index,
+                                0.0,
+                                0.0,
+                                output_axis_min,
+                                output_axis_max,
+                                0,
+                            )
                         )
                     else:
                         log.warning(f"unexpected input type {input_type!r}, skipping mapping")
@@ -971,6 +993,8 @@ def connect_controller(sdl_joystick: SdlJoystickId) -> None:
             if name in controller._inputs:
                 raise RuntimeError(f"{name} already in inputs")
             controller._inputs[str(name)] = input
+            input._mapping_values = controller._mapping_values
+            check_controller_mapping_plan(input._mapping_plan, input._mapping_values)
 
         controller._input_affects = {k: tuple(v) for k, v in input_affects.items()}
         controller._input_affected_by = {k: tuple(v) for k, v in input_affected_by.items()}
@@ -988,6 +1012,9 @@ def disconnect_controller(sdl_joystick: SdlJoystickId) -> None:
     controller._sdl_joystick = None
     for input in controller._inputs.values():
         input._controller = None
+        # the button can no longer be released by an event
+        if isinstance(input, ControllerButton) and input._is_pressed:
+            change_input_frame_input(input, False)
 
     close_sdl_joystick(sdl_joystick)
 
@@ -1008,30 +1035,36 @@ def forget_controllers() -> None:
         disconnect_controller(sdl_joystick)
 
 
-def controller_change_axis(sdl_joystick: SdlJoystickId, axis_index: int, value: float) -> bool:
+def controller_change_axis(
+    sdl_joystick: SdlJoystickId,
+    axis_index: int,
+    value: float,
+    timestamp: int,
+    sample_count: int | None = None,
+) -> bool:
     controller = _controllers[sdl_joystick]
     input = controller._analog_inputs[axis_index]
-    if input._set_value(value):
-        controller._update_mapped_inputs(input)
+    if input._set_value(value, timestamp, sample_count):
+        controller._update_mapped_inputs(input, timestamp)
         return True
     return False
 
 
 def controller_change_button(
-    sdl_joystick: SdlJoystickId, button_index: int, is_pressed: bool
+    sdl_joystick: SdlJoystickId, button_index: int, is_pressed: bool, timestamp: int
 ) -> bool:
     controller = _controllers[sdl_joystick]
     input = controller._binary_inputs[button_index]
-    if input._set_value(is_pressed):
-        controller._update_mapped_inputs(input)
+    if input._set_value(is_pressed, timestamp):
+        controller._update_mapped_inputs(input, timestamp)
         return True
     return False
 
 
-def controller_change_hat(sdl_joystick, hat_index, value: SdlHat) -> bool:
+def controller_change_hat(sdl_joystick, hat_index, value: SdlHat, timestamp: int) -> bool:
     controller = _controllers[sdl_joystick]
     input = controller._directional_inputs[hat_index]
-    if input._set_value(ControllerDirectionalInputValue(value)):
-        controller._update_mapped_inputs(input)
+    if input._set_value(ControllerDirectionalInputValue(value), timestamp):
+        controller._update_mapped_inputs(input, timestamp)
         return True
     return False
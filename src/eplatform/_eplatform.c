@@ -1,6 +1,12 @@
 
 #define PY_SSIZE_T_CLEAN
 #include <Python.h>
+#ifdef _WIN32
+#include <winsock2.h>
+#else
+#include <errno.h>
+#include <unistd.h>
+#endif
 #include <SDL3/SDL.h>
 #include <SDL3/SDL_vulkan.h>
 #define VK_NO_PROTOTYPES
@@ -65,6 +71,11 @@ typedef struct ModuleState
 {
     int vulkan_ref_count;
     PFN_vkGetInstanceProcAddr vkGetInstanceProcAddr;
+    // the event filter that the key repeat filter replaced, it is chained to and restored once
+    // key repeats are enabled again
+    bool is_key_repeat_filter_set;
+    SDL_EventFilter key_repeat_next_filter;
+    void *key_repeat_next_filter_userdata;
 } ModuleState;
 
 static int
@@ -458,6 +469,21 @@ error:
     return 0;
 }
 
+static PyObject *
+set_sdl_window_relative_mouse_mode(PyObject *module, PyObject **args, Py_ssize_t nargs)
+{
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(2);
+
+    SDL_Window *sdl_window = PyCapsule_GetPointer(args[0], "_eplatform.SDL_Window");
+    if (!sdl_window){ goto error; }
+
+    if (!SDL_SetWindowRelativeMouseMode(sdl_window, args[1] == Py_True)){ RAISE_SDL_ERROR(); }
+
+    Py_RETURN_NONE;
+error:
+    return 0;
+}
+
 static PyObject *
 set_sdl_window_fullscreen(PyObject *module, PyObject **args, Py_ssize_t nargs)
 {
@@ -718,19 +744,21 @@ push_sdl_event(PyObject *module, PyObject **args, Py_ssize_t nargs)
     SDL_Event event;
     event.type = PyLong_AsLong(args[0]);
     CHECK_UNEXPECTED_PYTHON_ERROR();
+    // SDL stamps the event with the current time when it is pushed
+    event.common.timestamp = 0;
 
     switch(event.type)
     {
         case SDL_EVENT_MOUSE_MOTION:
         {
             CHECK_UNEXPECTED_ARG_COUNT_ERROR(5);
-            event.motion.x = (float)PyLong_AsLong(args[1]);
+            event.motion.x = (float)PyFloat_AsDouble(args[1]);
             CHECK_UNEXPECTED_PYTHON_ERROR();
-            event.motion.y = (float)PyLong_AsLong(args[2]);
+            event.motion.y = (float)PyFloat_AsDouble(args[2]);
             CHECK_UNEXPECTED_PYTHON_ERROR();
-            event.motion.xrel = (float)PyLong_AsLong(args[3]);
+            event.motion.xrel = (float)PyFloat_AsDouble(args[3]);
             CHECK_UNEXPECTED_PYTHON_ERROR();
-            event.motion.yrel = (float)PyLong_AsLong(args[4]);
+            event.motion.yrel = (float)PyFloat_AsDouble(args[4]);
             CHECK_UNEXPECTED_PYTHON_ERROR();
             break;
         }
@@ -742,9 +770,9 @@ push_sdl_event(PyObject *module, PyObject **args, Py_ssize_t nargs)
             {
                 event.wheel.direction = SDL_MOUSEWHEEL_FLIPPED;
             }
-            event.wheel.x = (float)PyLong_AsLong(args[2]);
+            event.wheel.x = (float)PyFloat_AsDouble(args[2]);
             CHECK_UNEXPECTED_PYTHON_ERROR();
-            event.wheel.y = (float)PyLong_AsLong(args[3]);
+            event.wheel.y = (float)PyFloat_AsDouble(args[3]);
             CHECK_UNEXPECTED_PYTHON_ERROR();
             break;
         }
@@ -760,11 +788,13 @@ push_sdl_event(PyObject *module, PyObject **args, Py_ssize_t nargs)
         case SDL_EVENT_KEY_DOWN:
         case SDL_EVENT_KEY_UP:
         {
-            CHECK_UNEXPECTED_ARG_COUNT_ERROR(4);
+            CHECK_UNEXPECTED_ARG_COUNT_ERROR(5);
             event.key.scancode = PyLong_AsLong(args[1]);
             CHECK_UNEXPECTED_PYTHON_ERROR();
             event.key.down = args[2] == Py_True;
             event.key.repeat = args[3] == Py_True;
+            event.key.mod = (SDL_Keymod)PyLong_AsLong(args[4]);
+            CHECK_UNEXPECTED_PYTHON_ERROR();
             break;
         }
         case SDL_EVENT_TEXT_INPUT:
@@ -774,6 +804,95 @@ push_sdl_event(PyObject *module, PyObject **args, Py_ssize_t nargs)
             CHECK_UNEXPECTED_PYTHON_ERROR();
             break;
         }
+        case SDL_EVENT_TEXT_EDITING:
+        {
+            CHECK_UNEXPECTED_ARG_COUNT_ERROR(4);
+            event.edit.text = PyUnicode_AsUTF8(args[1]);
+            CHECK_UNEXPECTED_PYTHON_ERROR();
+            event.edit.start = PyLong_AsLong(args[2]);
+            CHECK_UNEXPECTED_PYTHON_ERROR();
+            event.edit.length = PyLong_AsLong(args[3]);
+            CHECK_UNEXPECTED_PYTHON_ERROR();
+            break;
+        }
+        case SDL_EVENT_FINGER_DOWN:
+        case SDL_EVENT_FINGER_UP:
+        case SDL_EVENT_FINGER_MOTION:
+        case SDL_EVENT_FINGER_CANCELED:
+        {
+            CHECK_UNEXPECTED_ARG_COUNT_ERROR(8);
+            event.tfinger.touchID = PyLong_AsUnsignedLongLong(args[1]);
+            CHECK_UNEXPECTED_PYTHON_ERROR();
+            event.tfinger.fingerID = PyLong_AsUnsignedLongLong(args[2]);
+            CHECK_UNEXPECTED_PYTHON_ERROR();
+            event.tfinger.x = (float)PyFloat_AsDouble(args[3]);
+            CHECK_UNEXPECTED_PYTHON_ERROR();
+            event.tfinger.y = (float)PyFloat_AsDouble(args[4]);
+            CHECK_UNEXPECTED_PYTHON_ERROR();
+            event.tfinger.dx = (float)PyFloat_AsDouble(args[5]);
+            CHECK_UNEXPECTED_PYTHON_ERROR();
+            event.tfinger.dy = (float)PyFloat_AsDouble(args[6]);
+            CHECK_UNEXPECTED_PYTHON_ERROR();
+            event.tfinger.pressure = (float)PyFloat_AsDouble(args[7]);
+            CHECK_UNEXPECTED_PYTHON_ERROR();
+            event.tfinger.windowID = 0;
+            break;
+        }
+        case SDL_EVENT_PEN_PROXIMITY_IN:
+        case SDL_EVENT_PEN_PROXIMITY_OUT:
+        {
+            CHECK_UNEXPECTED_ARG_COUNT_ERROR(2);
+            event.pproximity.which = PyLong_AsUnsignedLong(args[1]);
+            CHECK_UNEXPECTED_PYTHON_ERROR();
+            event.pproximity.windowID = 0;
+            break;
+        }
+        case SDL_EVENT_PEN_DOWN:
+        case SDL_EVENT_PEN_UP:
+        {
+            CHECK_UNEXPECTED_ARG_COUNT_ERROR(5);
+            event.ptouch.which = PyLong_AsUnsignedLong(args[1]);
+            CHECK_UNEXPECTED_PYTHON_ERROR();
+            event.ptouch.x = (float)PyFloat_AsDouble(args[2]);
+            CHECK_UNEXPECTED_PYTHON_ERROR();
+            event.ptouch.y = (float)PyFloat_AsDouble(args[3]);
+            CHECK_UNEXPECTED_PYTHON_ERROR();
+            event.ptouch.eraser = args[4] == Py_True;
+            event.ptouch.down = event.type == SDL_EVENT_PEN_DOWN;
+            event.ptouch.pen_state = 0;
+            event.ptouch.windowID = 0;
+            break;
+        }
+        case SDL_EVENT_PEN_MOTION:
+        {
+            CHECK_UNEXPECTED_ARG_COUNT_ERROR(4);
+            event.pmotion.which = PyLong_AsUnsignedLong(args[1]);
+            CHECK_UNEXPECTED_PYTHON_ERROR();
+            event.pmotion.x = (float)PyFloat_AsDouble(args[2]);
+            CHECK_UNEXPECTED_PYTHON_ERROR();
+            event.pmotion.y = (float)PyFloat_AsDouble(args[3]);
+            CHECK_UNEXPECTED_PYTHON_ERROR();
+            event.pmotion.pen_state = 0;
+            event.pmotion.windowID = 0;
+            break;
+        }
+        case SDL_EVENT_PEN_AXIS:
+        {
+            CHECK_UNEXPECTED_ARG_COUNT_ERROR(6);
+            event.paxis.which = PyLong_AsUnsignedLong(args[1]);
+            CHECK_UNEXPECTED_PYTHON_ERROR();
+            event.paxis.x = (float)PyFloat_AsDouble(args[2]);
+            CHECK_UNEXPECTED_PYTHON_ERROR();
+            event.paxis.y = (float)PyFloat_AsDouble(args[3]);
+            CHECK_UNEXPECTED_PYTHON_ERROR();
+            event.paxis.axis = PyLong_AsLong(args[4]);
+            CHECK_UNEXPECTED_PYTHON_ERROR();
+            event.paxis.value = (float)PyFloat_AsDouble(args[5]);
+            CHECK_UNEXPECTED_PYTHON_ERROR();
+            event.paxis.pen_state = 0;
+            event.paxis.windowID = 0;
+            break;
+        }
         case SDL_EVENT_WINDOW_RESIZED:
         case SDL_EVENT_WINDOW_MOVED:
         {
@@ -827,216 +946,302 @@ push_sdl_event(PyObject *module, PyObject **args, Py_ssize_t nargs)
         }
     }
 
-    if (!SDL_PushEvent(&event)){ RAISE_SDL_ERROR(); }
+    // disabled events and events rejected by the event filter (such as key repeats) are dropped
+    // by SDL, which isn't an error, SDL only leaves an error set when the push actually failed
+    SDL_ClearError();
+    if (!SDL_PushEvent(&event) && SDL_EventEnabled(event.type) && *SDL_GetError())
+    {
+        RAISE_SDL_ERROR();
+    }
 
     Py_RETURN_NONE;
 error:
     return 0;
 }
 
-static PyObject *
-get_sdl_event(PyObject *module, PyObject *unused)
+static struct EMathApi *
+get_emath_api_(struct EMathApi **emath_api)
 {
-    PyObject *ex = 0;
-    struct EMathApi *emath_api = 0;
-
-    SDL_Event event;
-    int result = SDL_PollEvent(&event);
-    if (result == 0)
+    if (!*emath_api)
     {
-        Py_RETURN_NONE;
+        *emath_api = EMathApi_Get();
     }
+    return *emath_api;
+}
 
-    switch(event.type)
-    {
-        case SDL_EVENT_MOUSE_MOTION:
-        {
-            emath_api = EMathApi_Get();
-            CHECK_UNEXPECTED_PYTHON_ERROR();
-
-            const int position[2] = {(int)event.motion.x, (int)event.motion.y};
-            PyObject *py_position = emath_api->IVector2_Create(position);
-            CHECK_UNEXPECTED_PYTHON_ERROR();
+static PyObject *
+create_ivector2_(struct EMathApi **emath_api, int x, int y)
+{
+    struct EMathApi *api = get_emath_api_(emath_api);
+    if (!api){ return 0; }
+    const int value[2] = {x, y};
+    return api->IVector2_Create(value);
+}
 
-            const int delta[2] = {(int)event.motion.xrel, (int)event.motion.yrel};
-            PyObject *py_delta = emath_api->IVector2_Create(delta);
-            CHECK_UNEXPECTED_PYTHON_ERROR();
+static PyObject *
+create_dvector2_(struct EMathApi **emath_api, double x, double y)
+{
+    struct EMathApi *api = get_emath_api_(emath_api);
+    if (!api){ return 0; }
+    const double value[2] = {x, y};
+    return api->DVector2_Create(value);
+}
 
-            EMathApi_Release();
-            emath_api = 0;
+static PyObject *
+sdl_event_to_python_(const SDL_Event *event, struct EMathApi **emath_api)
+{
+    PyObject *py_a = 0;
+    PyObject *py_b = 0;
+    const unsigned long long timestamp = event->common.timestamp;
 
-            return Py_BuildValue("(iOO)", event.type, py_position, py_delta);
+    switch(event->type)
+    {
+        case SDL_EVENT_MOUSE_MOTION:
+        {
+            py_a = create_dvector2_(emath_api, event->motion.x, event->motion.y);
+            if (!py_a){ goto error; }
+            py_b = create_dvector2_(emath_api, event->motion.xrel, event->motion.yrel);
+            if (!py_b){ goto error; }
+            return Py_BuildValue("(iKNN)", event->type, timestamp, py_a, py_b);
         }
         case SDL_EVENT_MOUSE_WHEEL:
         {
-            emath_api = EMathApi_Get();
-            CHECK_UNEXPECTED_PYTHON_ERROR();
-
-            int c = 1;
-            if (event.wheel.direction == SDL_MOUSEWHEEL_FLIPPED)
+            double c = 1.0;
+            if (event->wheel.direction == SDL_MOUSEWHEEL_FLIPPED)
             {
-                c = -1;
+                c = -1.0;
             }
-
-            const int delta[2] = {(int)event.wheel.x * c, (int)event.wheel.y * c};
-            PyObject *py_delta = emath_api->IVector2_Create(delta);
-            CHECK_UNEXPECTED_PYTHON_ERROR();
-
-            EMathApi_Release();
-            emath_api = 0;
-
-            return Py_BuildValue("(iO)", event.type, py_delta);
+            py_a = create_dvector2_(emath_api, event->wheel.x * c, event->wheel.y * c);
+            if (!py_a){ goto error; }
+            return Py_BuildValue("(iKN)", event->type, timestamp, py_a);
         }
         case SDL_EVENT_MOUSE_BUTTON_DOWN:
         case SDL_EVENT_MOUSE_BUTTON_UP:
         {
             return Py_BuildValue(
-                "(iBO)",
-                event.type,
-                event.button.button,
-                event.button.down ? Py_True : Py_False
+                "(iKBO)",
+                event->type,
+                timestamp,
+                event->button.button,
+                event->button.down ? Py_True : Py_False
             );
         }
         case SDL_EVENT_KEY_DOWN:
         case SDL_EVENT_KEY_UP:
         {
             return Py_BuildValue(
-                "(iiOO)",
-                event.type,
-                event.key.scancode,
-                event.key.down ? Py_True : Py_False,
-                event.key.repeat ? Py_True: Py_False
+                "(iKiOOH)",
+                event->type,
+                timestamp,
+                event->key.scancode,
+                event->key.down ? Py_True : Py_False,
+                event->key.repeat ? Py_True: Py_False,
+                event->key.mod
             );
         }
         case SDL_EVENT_TEXT_INPUT:
         {
-            return Py_BuildValue("(is)", event.type, event.text.text);
+            return Py_BuildValue("(iKs)", event->type, timestamp, event->text.text);
         }
-        case SDL_EVENT_WINDOW_RESIZED:
+        case SDL_EVENT_TEXT_EDITING:
         {
-            emath_api = EMathApi_Get();
-            CHECK_UNEXPECTED_PYTHON_ERROR();
-
-            const int size[2] = {(int)event.window.data1, (int)event.window.data2};
-            PyObject *py_size = emath_api->IVector2_Create(size);
-            CHECK_UNEXPECTED_PYTHON_ERROR();
-
-            EMathApi_Release();
-            emath_api = 0;
-
-            return Py_BuildValue("(iO)", event.type, py_size);
+            return Py_BuildValue(
+                "(iKsii)",
+                event->type,
+                timestamp,
+                event->edit.text,
+                (int)event->edit.start,
+                (int)event->edit.length
+            );
+        }
+        case SDL_EVENT_FINGER_DOWN:
+        case SDL_EVENT_FINGER_UP:
+        case SDL_EVENT_FINGER_MOTION:
+        case SDL_EVENT_FINGER_CANCELED:
+        {
+            return Py_BuildValue(
+                "(iKKKddddd)",
+                event->type,
+                timestamp,
+                (unsigned long long)event->tfinger.touchID,
+                (unsigned long long)event->tfinger.fingerID,
+                (double)event->tfinger.x,
+                (double)event->tfinger.y,
+                (double)event->tfinger.dx,
+                (double)event->tfinger.dy,
+                (double)event->tfinger.pressure
+            );
+        }
+        case SDL_EVENT_PEN_PROXIMITY_IN:
+        case SDL_EVENT_PEN_PROXIMITY_OUT:
+        {
+            return Py_BuildValue(
+                "(iKIO)",
+                event->type,
+                timestamp,
+                (unsigned int)event->pproximity.which,
+                event->type == SDL_EVENT_PEN_PROXIMITY_IN ? Py_True : Py_False
+            );
+        }
+        case SDL_EVENT_PEN_DOWN:
+        case SDL_EVENT_PEN_UP:
+        {
+            return Py_BuildValue(
+                "(iKIddOO)",
+                event->type,
+                timestamp,
+                (unsigned int)event->ptouch.which,
+                (double)event->ptouch.x,
+                (double)event->ptouch.y,
+                event->ptouch.down ? Py_True : Py_False,
+                event->ptouch.eraser ? Py_True : Py_False
+            );
+        }
+        case SDL_EVENT_PEN_MOTION:
+        {
+            return Py_BuildValue(
+                "(iKIdd)",
+                event->type,
+                timestamp,
+                (unsigned int)event->pmotion.which,
+                (double)event->pmotion.x,
+                (double)event->pmotion.y
+            );
         }
+        case SDL_EVENT_PEN_AXIS:
+        {
+            return Py_BuildValue(
+                "(iKIddid)",
+                event->type,
+                timestamp,
+                (unsigned int)event->paxis.which,
+                (double)event->paxis.x,
+                (double)event->paxis.y,
+                (int)event->paxis.axis,
+                (double)event->paxis.value
+            );
+        }
+        case SDL_EVENT_WINDOW_RESIZED:
         case SDL_EVENT_WINDOW_MOVED:
         {
-            emath_api = EMathApi_Get();
-            CHECK_UNEXPECTED_PYTHON_ERROR();
-
-            const int position[2] = {(int)event.window.data1, (int)event.window.data2};
-            PyObject *py_position = emath_api->IVector2_Create(position);
-            CHECK_UNEXPECTED_PYTHON_ERROR();
-
-            EMathApi_Release();
-            emath_api = 0;
-
-            return Py_BuildValue("(iO)", event.type, py_position);
+            py_a = create_ivector2_(emath_api, (int)event->window.data1, (int)event->window.data2);
+            if (!py_a){ goto error; }
+            return Py_BuildValue("(iKN)", event->type, timestamp, py_a);
         }
         case SDL_EVENT_DISPLAY_ADDED:
         case SDL_EVENT_DISPLAY_REMOVED:
         {
-            return Py_BuildValue("(ii)", event.type, event.display.displayID);
+            return Py_BuildValue("(iKi)", event->type, timestamp, event->display.displayID);
         }
         case SDL_EVENT_DISPLAY_ORIENTATION:
         {
             return Py_BuildValue(
-                "(iii)",
-                event.type,
-                event.display.displayID,
-                event.display.data1
+                "(iKii)",
+                event->type,
+                timestamp,
+                event->display.displayID,
+                event->display.data1
             );
         }
         case SDL_EVENT_DISPLAY_MOVED:
         {
             SDL_Rect display_bounds;
-            if (!SDL_GetDisplayBounds(event.display.displayID, &display_bounds))
+            if (!SDL_GetDisplayBounds(event->display.displayID, &display_bounds))
             {
                 RAISE_SDL_ERROR();
             }
-
-            emath_api = EMathApi_Get();
-            CHECK_UNEXPECTED_PYTHON_ERROR();
-
-            const int position[2] = {display_bounds.x, display_bounds.y};
-            PyObject *py_position = emath_api->IVector2_Create(position);
-            CHECK_UNEXPECTED_PYTHON_ERROR();
-
-            EMathApi_Release();
-            emath_api = 0;
-
-            return Py_BuildValue("(iiO)", event.type, event.display.displayID, py_position);
+            py_a = create_ivector2_(emath_api, display_bounds.x, display_bounds.y);
+            if (!py_a){ goto error; }
+            return Py_BuildValue("(iKiN)", event->type, timestamp, event->display.displayID, py_a);
         }
         case SDL_EVENT_DISPLAY_CURRENT_MODE_CHANGED:
         {
             SDL_Rect display_bounds;
-            if (!SDL_GetDisplayBounds(event.display.displayID, &display_bounds))
+            if (!SDL_GetDisplayBounds(event->display.displayID, &display_bounds))
             {
                 RAISE_SDL_ERROR();
             }
             const SDL_DisplayMode *display_mode = SDL_GetCurrentDisplayMode(
-                event.display.displayID
+                event->display.displayID
             );
             if (!display_mode){ RAISE_SDL_ERROR(); }
 
-            emath_api = EMathApi_Get();
-            CHECK_UNEXPECTED_PYTHON_ERROR();
-
-            const int size[2] = {display_bounds.w, display_bounds.h};
-            PyObject *py_size = emath_api->IVector2_Create(size);
-            CHECK_UNEXPECTED_PYTHON_ERROR();
-
-            EMathApi_Release();
-            emath_api = 0;
-
+            py_a = create_ivector2_(emath_api, display_bounds.w, display_bounds.h);
+            if (!py_a){ goto error; }
             return Py_BuildValue(
-                "(iiOf)",
-                event.type,
-                event.display.displayID,
-                py_size,
+                "(iKiNf)",
+                event->type,
+                timestamp,
+                event->display.displayID,
+                py_a,
                 display_mode->refresh_rate
             );
         }
         case SDL_EVENT_JOYSTICK_ADDED:
         case SDL_EVENT_JOYSTICK_REMOVED:
         {
-            return Py_BuildValue("(ii)", event.type, event.jdevice.which);
+            return Py_BuildValue("(iKi)", event->type, timestamp, event->jdevice.which);
         }
         case SDL_EVENT_JOYSTICK_AXIS_MOTION:
         {
             return Py_BuildValue(
-                "(iiid)",
-                event.type,
-                event.jaxis.which,
-                event.jaxis.axis,
-                normalize_sdl_joystick_axis_value_(event.jaxis.value)
+                "(iKiid)",
+                event->type,
+                timestamp,
+                event->jaxis.which,
+                event->jaxis.axis,
+                normalize_sdl_joystick_axis_value_(event->jaxis.value)
             );
         }
         case SDL_EVENT_JOYSTICK_BUTTON_DOWN:
         case SDL_EVENT_JOYSTICK_BUTTON_UP:
         {
-            return Py_BuildValue("(iii)", event.type, event.jbutton.which, event.jbutton.button);
+            return Py_BuildValue(
+                "(iKii)",
+                event->type,
+                timestamp,
+                event->jbutton.which,
+                event->jbutton.button
+            );
         }
         case SDL_EVENT_JOYSTICK_HAT_MOTION:
         {
             return Py_BuildValue(
-                "(iiii)",
-                event.type,
-                event.jhat.which,
-                event.jhat.hat,
-                (int)event.jhat.value
+                "(iKiii)",
+                event->type,
+                timestamp,
+                event->jhat.which,
+                event->jhat.hat,
+                (int)event->jhat.value
             );
         }
     }
 
-    return Py_BuildValue("(i)", event.type);
+    return Py_BuildValue("(iK)", event->type, timestamp);
+error:
+    Py_XDECREF(py_a);
+    Py_XDECREF(py_b);
+    return 0;
+}
+
+static PyObject *
+get_sdl_event(PyObject *module, PyObject *unused)
+{
+    PyObject *ex = 0;
+    struct EMathApi *emath_api = 0;
+
+    SDL_Event event;
+    int result = SDL_PollEvent(&event);
+    if (result == 0)
+    {
+        Py_RETURN_NONE;
+    }
+
+    PyObject *py_event = sdl_event_to_python_(&event, &emath_api);
+    if (!py_event){ goto error; }
+
+    if (emath_api){ EMathApi_Release(); }
+    return py_event;
 error:
     ex = PyErr_GetRaisedException();
     if (emath_api){ EMathApi_Release(); }
@@ -1044,6 +1249,274 @@ error:
     return 0;
 }
 
+#define SDL_EVENT_BUFFER_SIZE 64
+
+static PyObject *
+get_sdl_events(PyObject *module, PyObject *py_max_count)
+{
+    PyObject *ex = 0;
+    struct EMathApi *emath_api = 0;
+    PyObject *py_events = 0;
+
+    Py_ssize_t max_count = PyLong_AsSsize_t(py_max_count);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+    if (max_count < 0)
+    {
+        PyErr_Format(PyExc_ValueError, "max_count must not be negative, got %zi", max_count);
+        goto error;
+    }
+
+    py_events = PyList_New(0);
+    if (!py_events){ goto error; }
+
+    SDL_PumpEvents();
+
+    SDL_Event events[SDL_EVENT_BUFFER_SIZE];
+    while (max_count > 0)
+    {
+        int request_count = (
+            max_count < SDL_EVENT_BUFFER_SIZE ? (int)max_count : SDL_EVENT_BUFFER_SIZE
+        );
+        int count = SDL_PeepEvents(
+            events,
+            request_count,
+            SDL_GETEVENT,
+            SDL_EVENT_FIRST,
+            SDL_EVENT_LAST
+        );
+        // a negative count means the event queue isn't active, which SDL_PollEvent also treats
+        // as there being no events
+        if (count <= 0){ break; }
+
+        for (int i = 0; i < count; i++)
+        {
+            PyObject *py_event = sdl_event_to_python_(&events[i], &emath_api);
+            if (!py_event){ goto error; }
+            if (PyList_Append(py_events, py_event) != 0)
+            {
+                Py_DECREF(py_event);
+                goto error;
+            }
+            Py_DECREF(py_event);
+        }
+
+        if (count < request_count){ break; }
+        max_count -= count;
+    }
+
+    if (emath_api){ EMathApi_Release(); }
+    return py_events;
+error:
+    ex = PyErr_GetRaisedException();
+    Py_XDECREF(py_events);
+    if (emath_api){ EMathApi_Release(); }
+    PyErr_SetRaisedException(ex);
+    return 0;
+}
+
+static PyObject *
+get_sdl_event_count(PyObject *module, PyObject *unused)
+{
+    SDL_PumpEvents();
+    int count = SDL_PeepEvents(0, 0, SDL_PEEKEVENT, SDL_EVENT_FIRST, SDL_EVENT_LAST);
+    // a negative count means the event queue isn't active
+    if (count < 0){ count = 0; }
+    return PyLong_FromLong(count);
+}
+
+static PyObject *
+wait_sdl_event(PyObject *module, PyObject *py_timeout)
+{
+    Sint32 timeout = PyLong_AsLong(py_timeout);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    bool result = false;
+    if (SDL_WasInit(SDL_INIT_EVENTS))
+    {
+        Py_BEGIN_ALLOW_THREADS
+        result = SDL_WaitEventTimeout(0, timeout);
+        Py_END_ALLOW_THREADS
+    }
+    else
+    {
+        // no event can arrive without the event subsystem, so just wait out the timeout
+        Py_BEGIN_ALLOW_THREADS
+        SDL_Delay(timeout);
+        Py_END_ALLOW_THREADS
+    }
+
+    return PyBool_FromLong(result);
+error:
+    return 0;
+}
+
+struct SdlEventWakeup
+{
+#ifdef _WIN32
+    SOCKET fd;
+#else
+    int fd;
+#endif
+    SDL_AtomicInt is_pending;
+};
+
+static bool SDLCALL
+sdl_event_wakeup_watch_(void *userdata, SDL_Event *event)
+{
+    struct SdlEventWakeup *wakeup = userdata;
+    // only write to the fd once per reset so that a burst of events (which may be pushed from
+    // any thread) results in a single write
+    if (SDL_CompareAndSwapAtomicInt(&wakeup->is_pending, 0, 1))
+    {
+        char byte = 0;
+#ifdef _WIN32
+        int result = send(wakeup->fd, &byte, 1, 0);
+        // a full socket already has a wakeup waiting to be read
+        bool is_woken = result == 1 || (
+            result == SOCKET_ERROR && WSAGetLastError() == WSAEWOULDBLOCK
+        );
+#else
+        ssize_t result;
+        do
+        {
+            result = write(wakeup->fd, &byte, 1);
+        }
+        while (result < 0 && errno == EINTR);
+        // a full socket already has a wakeup waiting to be read
+        bool is_woken = result == 1 || (result < 0 && (errno == EAGAIN || errno == EWOULDBLOCK));
+#endif
+        // if the write failed the next event tries again, rather than the selector never being
+        // woken for the rest of this reset
+        if (!is_woken){ SDL_SetAtomicInt(&wakeup->is_pending, 0); }
+    }
+    return true;
+}
+
+static void
+sdl_event_wakeup_capsule_destructor_(PyObject *py_wakeup)
+{
+    struct SdlEventWakeup *wakeup = PyCapsule_GetPointer(py_wakeup, "_eplatform.SdlEventWakeup");
+    SDL_RemoveEventWatch(sdl_event_wakeup_watch_, wakeup);
+    PyMem_Free(wakeup);
+}
+
+static PyObject *
+create_sdl_event_wakeup(PyObject *module, PyObject *py_fd)
+{
+    struct SdlEventWakeup *wakeup = 0;
+
+#ifdef _WIN32
+    SOCKET fd = (SOCKET)PyLong_AsUnsignedLongLong(py_fd);
+#else
+    int fd = PyLong_AsLong(py_fd);
+#endif
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    wakeup = PyMem_Malloc(sizeof(struct SdlEventWakeup));
+    if (!wakeup)
+    {
+        PyErr_NoMemory();
+        goto error;
+    }
+    wakeup->fd = fd;
+    SDL_SetAtomicInt(&wakeup->is_pending, 0);
+
+    if (!SDL_AddEventWatch(sdl_event_wakeup_watch_, wakeup)){ RAISE_SDL_ERROR(); }
+
+    PyObject *py_wakeup = PyCapsule_New(
+        wakeup,
+        "_eplatform.SdlEventWakeup",
+        sdl_event_wakeup_capsule_destructor_
+    );
+    if (!py_wakeup)
+    {
+        SDL_RemoveEventWatch(sdl_event_wakeup_watch_, wakeup);
+        goto error;
+    }
+    return py_wakeup;
+error:
+    PyMem_Free(wakeup);
+    return 0;
+}
+
+static PyObject *
+reset_sdl_event_wakeup(PyObject *module, PyObject *py_wakeup)
+{
+    struct SdlEventWakeup *wakeup = PyCapsule_GetPointer(py_wakeup, "_eplatform.SdlEventWakeup");
+    if (!wakeup){ goto error; }
+    SDL_SetAtomicInt(&wakeup->is_pending, 0);
+    Py_RETURN_NONE;
+error:
+    return 0;
+}
+
+static PyObject *
+set_sdl_event_enabled(PyObject *module, PyObject **args, Py_ssize_t nargs)
+{
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(2);
+
+    Uint32 event_type = PyLong_AsUnsignedLong(args[0]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    SDL_SetEventEnabled(event_type, args[1] == Py_True);
+    Py_RETURN_NONE;
+error:
+    return 0;
+}
+
+static bool SDLCALL
+sdl_key_repeat_filter_(void *userdata, SDL_Event *event)
+{
+    ModuleState *state = userdata;
+    // repeated key presses are dropped before they are queued, which also means they never wake
+    // the event loop
+    if (event->type == SDL_EVENT_KEY_DOWN && event->key.repeat){ return false; }
+    if (state->key_repeat_next_filter)
+    {
+        return state->key_repeat_next_filter(state->key_repeat_next_filter_userdata, event);
+    }
+    return true;
+}
+
+static PyObject *
+set_sdl_key_repeat_enabled(PyObject *module, PyObject *py_enabled)
+{
+    ModuleState *state = (ModuleState *)PyModule_GetState(module);
+    if (py_enabled == Py_True)
+    {
+        if (state->is_key_repeat_filter_set)
+        {
+            SDL_SetEventFilter(
+                state->key_repeat_next_filter,
+                state->key_repeat_next_filter_userdata
+            );
+            state->key_repeat_next_filter = 0;
+            state->key_repeat_next_filter_userdata = 0;
+            state->is_key_repeat_filter_set = false;
+        }
+    }
+    else if (!state->is_key_repeat_filter_set)
+    {
+        if (!SDL_GetEventFilter(
+            &state->key_repeat_next_filter,
+            &state->key_repeat_next_filter_userdata
+        ))
+        {
+            state->key_repeat_next_filter = 0;
+            state->key_repeat_next_filter_userdata = 0;
+        }
+        SDL_SetEventFilter(sdl_key_repeat_filter_, state);
+        state->is_key_repeat_filter_set = true;
+    }
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+get_sdl_ticks_ns(PyObject *module, PyObject *unused)
+{
+    return PyLong_FromUnsignedLongLong(SDL_GetTicksNS());
+}
+
 static PyObject *
 show_cursor(PyObject *module, PyObject *unused)
 {
@@ -1062,6 +1535,144 @@ error:
     return 0;
 }
 
+static PyObject *
+create_sdl_cursor(PyObject *module, PyObject **args, Py_ssize_t nargs)
+{
+    PyObject *ex = 0;
+    struct EMathApi *emath_api = 0;
+    SDL_Surface *surface = 0;
+    SDL_Cursor *sdl_cursor = 0;
+
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(3);
+
+    emath_api = EMathApi_Get();
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    const uint8_t *pixels = emath_api->U8Vector4Array_GetValuePointer(args[0]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+    const int *size = emath_api->IVector2_GetValuePointer(args[1]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+    const int *hotspot = emath_api->IVector2_GetValuePointer(args[2]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    // sdl reads size.x * size.y pixels from the buffer without knowing its length
+    size_t pixel_count = emath_api->U8Vector4Array_GetSize(args[0]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+    if (size[0] < 0 || size[1] < 0 || pixel_count != (size_t)size[0] * (size_t)size[1])
+    {
+        PyErr_Format(
+            PyExc_ValueError, "expected %i x %i pixels, got %zu", size[0], size[1], pixel_count
+        );
+        goto error;
+    }
+
+    surface = SDL_CreateSurfaceFrom(size[0], size[1], SDL_PIXELFORMAT_RGBA32, (void *)pixels, size[0] * 4);
+    if (!surface){ RAISE_SDL_ERROR(); }
+
+    // the cursor keeps its own copy of the pixels
+    sdl_cursor = SDL_CreateColorCursor(surface, hotspot[0], hotspot[1]);
+    if (!sdl_cursor){ RAISE_SDL_ERROR(); }
+
+    SDL_DestroySurface(surface);
+    surface = 0;
+    EMathApi_Release();
+    emath_api = 0;
+
+    PyObject *py_sdl_cursor = PyCapsule_New(sdl_cursor, "_eplatform.SDL_Cursor", 0);
+    if (!py_sdl_cursor){ goto error; }
+    return py_sdl_cursor;
+error:
+    if (sdl_cursor){ SDL_DestroyCursor(sdl_cursor); }
+    if (surface){ SDL_DestroySurface(surface); }
+    ex = PyErr_GetRaisedException();
+    if (emath_api){ EMathApi_Release(); }
+    PyErr_SetRaisedException(ex);
+    return 0;
+}
+
+static PyObject *
+create_sdl_system_cursor(PyObject *module, PyObject *py_sdl_system_cursor)
+{
+    SDL_Cursor *sdl_cursor = 0;
+
+    SDL_SystemCursor sdl_system_cursor = PyLong_AsLong(py_sdl_system_cursor);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    sdl_cursor = SDL_CreateSystemCursor(sdl_system_cursor);
+    if (!sdl_cursor){ RAISE_SDL_ERROR(); }
+
+    PyObject *py_sdl_cursor = PyCapsule_New(sdl_cursor, "_eplatform.SDL_Cursor", 0);
+    if (!py_sdl_cursor){ goto error; }
+    return py_sdl_cursor;
+error:
+    if (sdl_cursor){ SDL_DestroyCursor(sdl_cursor); }
+    return 0;
+}
+
+static PyObject *
+delete_sdl_cursor(PyObject *module, PyObject *py_sdl_cursor)
+{
+    SDL_Cursor *sdl_cursor = PyCapsule_GetPointer(py_sdl_cursor, "_eplatform.SDL_Cursor");
+    if (!sdl_cursor){ goto error; }
+    SDL_DestroyCursor(sdl_cursor);
+    Py_RETURN_NONE;
+error:
+    return 0;
+}
+
+static PyObject *
+set_sdl_cursor(PyObject *module, PyObject *py_sdl_cursor)
+{
+    SDL_Cursor *sdl_cursor = 0;
+    if (py_sdl_cursor == Py_None)
+    {
+        sdl_cursor = SDL_GetDefaultCursor();
+    }
+    else
+    {
+        sdl_cursor = PyCapsule_GetPointer(py_sdl_cursor, "_eplatform.SDL_Cursor");
+        if (!sdl_cursor){ goto error; }
+    }
+    if (!SDL_SetCursor(sdl_cursor)){ RAISE_SDL_ERROR(); }
+    Py_RETURN_NONE;
+error:
+    return 0;
+}
+
+static PyObject *
+get_sdl_keyboard_state(PyObject *module, PyObject *unused)
+{
+    int count = 0;
+    // the state is owned by SDL and stays valid for the lifetime of the application, it is
+    // updated whenever SDL pumps events
+    const bool *state = SDL_GetKeyboardState(&count);
+    return PyMemoryView_FromMemory((char *)state, count * sizeof(bool), PyBUF_READ);
+}
+
+static PyObject *
+get_sdl_keycodes(PyObject *module, PyObject *unused)
+{
+    PyObject *py_keycodes = PyTuple_New(SDL_SCANCODE_COUNT);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+    for (int i = 0; i < SDL_SCANCODE_COUNT; i++)
+    {
+        SDL_Keycode keycode = SDL_GetKeyFromScancode((SDL_Scancode)i, SDL_KMOD_NONE, true);
+        PyObject *py_keycode = PyLong_FromUnsignedLong(keycode);
+        CHECK_UNEXPECTED_PYTHON_ERROR();
+        PyTuple_SET_ITEM(py_keycodes, i, py_keycode);
+    }
+    return py_keycodes;
+error:
+    Py_XDECREF(py_keycodes);
+    return 0;
+}
+
+static PyObject *
+get_sdl_mod_state(PyObject *module, PyObject *unused)
+{
+    return PyLong_FromUnsignedLong(SDL_GetModState());
+}
+
 static PyObject *
 get_sdl_joysticks(PyObject *module, PyObject *unused)
 {
@@ -1358,6 +1969,219 @@ error:
     return 0;
 }
 
+// a controller mapping plan is a flat array of doubles, each term being:
+// binding type, value index, input min or hat mask, input max, output min, output max, component
+#define CONTROLLER_MAPPING_TERM_SIZE 7
+
+static int
+get_controller_mapping_buffers_(
+    PyObject *py_plan,
+    Py_buffer *plan,
+    PyObject *py_values,
+    Py_buffer *values
+)
+{
+    if (PyObject_GetBuffer(py_plan, plan, PyBUF_SIMPLE) != 0){ return -1; }
+    if (PyObject_GetBuffer(py_values, values, PyBUF_SIMPLE) != 0)
+    {
+        PyBuffer_Release(plan);
+        return -1;
+    }
+
+    if (plan->len % (sizeof(double) * CONTROLLER_MAPPING_TERM_SIZE) != 0)
+    {
+        PyErr_Format(PyExc_ValueError, "invalid mapping plan size: %zi", plan->len);
+        PyBuffer_Release(values);
+        PyBuffer_Release(plan);
+        return -1;
+    }
+    return 0;
+}
+
+static PyObject *
+check_controller_mapping_plan(PyObject *module, PyObject **args, Py_ssize_t nargs)
+{
+    Py_buffer plan;
+    Py_buffer values;
+
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(2);
+
+    if (get_controller_mapping_buffers_(args[0], &plan, args[1], &values) != 0){ goto error; }
+    const double *terms = plan.buf;
+    Py_ssize_t term_count = plan.len / (sizeof(double) * CONTROLLER_MAPPING_TERM_SIZE);
+    Py_ssize_t value_count = values.len / sizeof(double);
+    for (Py_ssize_t i = 0; i < term_count; i++)
+    {
+        const double *term = terms + (i * CONTROLLER_MAPPING_TERM_SIZE);
+        if (term[1] < 0 || term[1] >= value_count)
+        {
+            PyErr_Format(PyExc_ValueError, "invalid mapping value index: %i", (int)term[1]);
+            goto release;
+        }
+        if (term[6] != 0 && term[6] != 1)
+        {
+            PyErr_Format(PyExc_ValueError, "invalid mapping component: %i", (int)term[6]);
+            goto release;
+        }
+    }
+    PyBuffer_Release(&values);
+    PyBuffer_Release(&plan);
+    Py_RETURN_NONE;
+release:
+    PyBuffer_Release(&values);
+    PyBuffer_Release(&plan);
+error:
+    return 0;
+}
+
+static int
+map_controller_axis_(const double *term, double value, double *result)
+{
+    double input_min = term[2];
+    double input_max = term[3];
+    double cmp_min = input_min;
+    double cmp_max = input_max;
+    if (cmp_max < cmp_min)
+    {
+        cmp_min = input_max;
+        cmp_max = input_min;
+    }
+    if (!(value >= cmp_min && value <= cmp_max)){ return 0; }
+    double v = (value - input_min) / (input_max - input_min);
+    *result = term[4] + v * (term[5] - term[4]);
+    return 1;
+}
+
+static PyObject *
+map_controller_input(PyObject *module, PyObject **args, Py_ssize_t nargs)
+{
+    Py_buffer plan;
+    Py_buffer values;
+    double result[2] = {0.0, 0.0};
+
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(4);
+
+    double output_min = PyFloat_AsDouble(args[2]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+    double output_max = PyFloat_AsDouble(args[3]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    if (get_controller_mapping_buffers_(args[0], &plan, args[1], &values) != 0){ goto error; }
+    const double *terms = plan.buf;
+    const double *input_values = values.buf;
+    Py_ssize_t term_count = plan.len / (sizeof(double) * CONTROLLER_MAPPING_TERM_SIZE);
+    for (Py_ssize_t i = 0; i < term_count; i++)
+    {
+        const double *term = terms + (i * CONTROLLER_MAPPING_TERM_SIZE);
+        double value = input_values[(Py_ssize_t)term[1]];
+        double *component = &result[(int)term[6]];
+        switch ((int)term[0])
+        {
+            case SDL_GAMEPAD_BINDTYPE_AXIS:
+            {
+                double v;
+                if (map_controller_axis_(term, value, &v))
+                {
+                    *component += v;
+                }
+                break;
+            }
+            case SDL_GAMEPAD_BINDTYPE_BUTTON:
+            {
+                *component += value != 0 ? term[5] : term[4];
+                break;
+            }
+            case SDL_GAMEPAD_BINDTYPE_HAT:
+            {
+                *component += ((int)value & (int)term[2]) != 0 ? term[5] : term[4];
+                break;
+            }
+        }
+    }
+    PyBuffer_Release(&values);
+    PyBuffer_Release(&plan);
+
+    for (int i = 0; i < 2; i++)
+    {
+        if (result[i] > output_max){ result[i] = output_max; }
+        if (result[i] < output_min){ result[i] = output_min; }
+    }
+    return Py_BuildValue("(dd)", result[0], result[1]);
+error:
+    return 0;
+}
+
+static PyObject *
+map_controller_button(PyObject *module, PyObject **args, Py_ssize_t nargs)
+{
+    Py_buffer plan;
+    Py_buffer values;
+
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(3);
+
+    double threshold = PyFloat_AsDouble(args[2]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    if (get_controller_mapping_buffers_(args[0], &plan, args[1], &values) != 0){ goto error; }
+    const double *terms = plan.buf;
+    const double *input_values = values.buf;
+    Py_ssize_t term_count = plan.len / (sizeof(double) * CONTROLLER_MAPPING_TERM_SIZE);
+    int is_pressed = 0;
+    // the first analog input that is past either threshold decides, otherwise any pressed
+    // binary input or matching directional input presses the button
+    for (Py_ssize_t i = 0; i < term_count; i++)
+    {
+        const double *term = terms + (i * CONTROLLER_MAPPING_TERM_SIZE);
+        if ((int)term[0] != SDL_GAMEPAD_BINDTYPE_AXIS){ continue; }
+        double v;
+        if (map_controller_axis_(term, input_values[(Py_ssize_t)term[1]], &v))
+        {
+            v = SDL_fabs(v);
+            if (v > (1.0 - threshold))
+            {
+                is_pressed = 1;
+                goto done;
+            }
+            else if (v < threshold)
+            {
+                goto done;
+            }
+        }
+    }
+    for (Py_ssize_t i = 0; i < term_count; i++)
+    {
+        const double *term = terms + (i * CONTROLLER_MAPPING_TERM_SIZE);
+        double value = input_values[(Py_ssize_t)term[1]];
+        switch ((int)term[0])
+        {
+            case SDL_GAMEPAD_BINDTYPE_BUTTON:
+            {
+                if (value != 0)
+                {
+                    is_pressed = 1;
+                    goto done;
+                }
+                break;
+            }
+            case SDL_GAMEPAD_BINDTYPE_HAT:
+            {
+                if (((int)value & (int)term[2]) != 0)
+                {
+                    is_pressed = 1;
+                    goto done;
+                }
+                break;
+            }
+        }
+    }
+done:
+    PyBuffer_Release(&values);
+    PyBuffer_Release(&plan);
+    return PyBool_FromLong(is_pressed);
+error:
+    return 0;
+}
+
 static PyObject *
 connect_virtual_joystick(PyObject *module, PyObject **args, Py_ssize_t nargs)
 {
@@ -1963,6 +2787,7 @@ static PyMethodDef module_PyMethodDef[] = {
     {"set_sdl_window_border", (PyCFunction)set_sdl_window_border, METH_FASTCALL, 0},
     {"set_sdl_window_resizeable", (PyCFunction)set_sdl_window_resizeable, METH_FASTCALL, 0},
     {"set_sdl_window_always_on_top", (PyCFunction)set_sdl_window_always_on_top, METH_FASTCALL, 0},
+    {"set_sdl_window_relative_mouse_mode", (PyCFunction)set_sdl_window_relative_mouse_mode, METH_FASTCALL, 0},
     {"set_sdl_window_fullscreen", (PyCFunction)set_sdl_window_fullscreen, METH_FASTCALL, 0},
     {"set_sdl_window_not_fullscreen", set_sdl_window_not_fullscreen, METH_O, 0},
     {"set_sdl_window_icon", (PyCFunction)set_sdl_window_icon, METH_FASTCALL, 0},
@@ -1981,11 +2806,29 @@ static PyMethodDef module_PyMethodDef[] = {
     {"clear_sdl_events", clear_sdl_events, METH_NOARGS, 0},
     {"push_sdl_event", (PyCFunction)push_sdl_event, METH_FASTCALL, 0},
     {"get_sdl_event", get_sdl_event, METH_NOARGS, 0},
+    {"get_sdl_events", get_sdl_events, METH_O, 0},
+    {"get_sdl_event_count", get_sdl_event_count, METH_NOARGS, 0},
+    {"wait_sdl_event", wait_sdl_event, METH_O, 0},
+    {"set_sdl_event_enabled", (PyCFunction)set_sdl_event_enabled, METH_FASTCALL, 0},
+    {"set_sdl_key_repeat_enabled", set_sdl_key_repeat_enabled, METH_O, 0},
+    {"get_sdl_ticks_ns", get_sdl_ticks_ns, METH_NOARGS, 0},
+    {"create_sdl_event_wakeup", create_sdl_event_wakeup, METH_O, 0},
+    {"reset_sdl_event_wakeup", reset_sdl_event_wakeup, METH_O, 0},
     {"show_cursor", show_cursor, METH_NOARGS, 0},
     {"hide_cursor", hide_cursor, METH_NOARGS, 0},
+    {"create_sdl_cursor", (PyCFunction)create_sdl_cursor, METH_FASTCALL, 0},
+    {"create_sdl_system_cursor", create_sdl_system_cursor, METH_O, 0},
+    {"delete_sdl_cursor", delete_sdl_cursor, METH_O, 0},
+    {"set_sdl_cursor", set_sdl_cursor, METH_O, 0},
+    {"get_sdl_keyboard_state", get_sdl_keyboard_state, METH_NOARGS, 0},
+    {"get_sdl_mod_state", get_sdl_mod_state, METH_NOARGS, 0},
+    {"get_sdl_keycodes", get_sdl_keycodes, METH_NOARGS, 0},
     {"get_sdl_joysticks", get_sdl_joysticks, METH_NOARGS, 0},
     {"open_sdl_joystick", open_sdl_joystick, METH_O, 0},
     {"close_sdl_joystick", close_sdl_joystick, METH_O, 0},
+    {"check_controller_mapping_plan", (PyCFunction)check_controller_mapping_plan, METH_FASTCALL, 0},
+    {"map_controller_input", (PyCFunction)map_controller_input, METH_FASTCALL, 0},
+    {"map_controller_button", (PyCFunction)map_controller_button, METH_FASTCALL, 0},
     {"connect_virtual_joystick", (PyCFunction)connect_virtual_joystick, METH_FASTCALL, 0},
     {"disconnect_virtual_joystick", disconnect_virtual_joystick, METH_O, 0},
     {"set_virtual_joystick_axis_position", (PyCFunction)set_virtual_joystick_axis_position, METH_FASTCALL, 0},
@@ -2049,6 +2892,8 @@ PyInit__eplatform()
     ADD_CONSTANT(SDL_EVENT_KEY_DOWN);
     ADD_CONSTANT(SDL_EVENT_KEY_UP);
     ADD_CONSTANT(SDL_EVENT_TEXT_INPUT);
+    ADD_CONSTANT(SDL_EVENT_TEXT_EDITING);
+    ADD_CONSTANT(SDL_EVENT_KEYMAP_CHANGED);
     ADD_CONSTANT(SDL_EVENT_WINDOW_RESIZED);
     ADD_CONSTANT(SDL_EVENT_WINDOW_SHOWN);
     ADD_CONSTANT(SDL_EVENT_WINDOW_HIDDEN);
@@ -2066,6 +2911,24 @@ PyInit__eplatform()
     ADD_CONSTANT(SDL_EVENT_JOYSTICK_BUTTON_DOWN);
     ADD_CONSTANT(SDL_EVENT_JOYSTICK_BUTTON_UP);
     ADD_CONSTANT(SDL_EVENT_JOYSTICK_HAT_MOTION);
+    ADD_CONSTANT(SDL_EVENT_FINGER_DOWN);
+    ADD_CONSTANT(SDL_EVENT_FINGER_UP);
+    ADD_CONSTANT(SDL_EVENT_FINGER_MOTION);
+    ADD_CONSTANT(SDL_EVENT_FINGER_CANCELED);
+    ADD_CONSTANT(SDL_EVENT_PEN_PROXIMITY_IN);
+    ADD_CONSTANT(SDL_EVENT_PEN_PROXIMITY_OUT);
+    ADD_CONSTANT(SDL_EVENT_PEN_DOWN);
+    ADD_CONSTANT(SDL_EVENT_PEN_UP);
+    ADD_CONSTANT(SDL_EVENT_PEN_MOTION);
+    ADD_CONSTANT(SDL_EVENT_PEN_AXIS);
+    ADD_CONSTANT(SDL_PEN_AXIS_PRESSURE);
+    ADD_CONSTANT(SDL_PEN_AXIS_XTILT);
+    ADD_CONSTANT(SDL_PEN_AXIS_YTILT);
+    ADD_CONSTANT(SDL_PEN_AXIS_DISTANCE);
+    ADD_CONSTANT(SDL_PEN_AXIS_ROTATION);
+    ADD_CONSTANT(SDL_PEN_AXIS_SLIDER);
+    ADD_CONSTANT(SDL_PEN_AXIS_TANGENTIAL_PRESSURE);
+    ADD_CONSTANT(SDL_PEN_AXIS_COUNT);
     ADD_CONSTANT(SDL_EVENT_WINDOW_MAXIMIZED);
     ADD_CONSTANT(SDL_EVENT_WINDOW_RESTORED);
 
@@ -2080,6 +2943,44 @@ PyInit__eplatform()
     ADD_CONSTANT(SDL_BUTTON_RIGHT);
     ADD_CONSTANT(SDL_BUTTON_X1);
     ADD_CONSTANT(SDL_BUTTON_X2);
+    ADD_CONSTANT(SDL_SYSTEM_CURSOR_DEFAULT);
+    ADD_CONSTANT(SDL_SYSTEM_CURSOR_TEXT);
+    ADD_CONSTANT(SDL_SYSTEM_CURSOR_WAIT);
+    ADD_CONSTANT(SDL_SYSTEM_CURSOR_CROSSHAIR);
+    ADD_CONSTANT(SDL_SYSTEM_CURSOR_PROGRESS);
+    ADD_CONSTANT(SDL_SYSTEM_CURSOR_NWSE_RESIZE);
+    ADD_CONSTANT(SDL_SYSTEM_CURSOR_NESW_RESIZE);
+    ADD_CONSTANT(SDL_SYSTEM_CURSOR_EW_RESIZE);
+    ADD_CONSTANT(SDL_SYSTEM_CURSOR_NS_RESIZE);
+    ADD_CONSTANT(SDL_SYSTEM_CURSOR_MOVE);
+    ADD_CONSTANT(SDL_SYSTEM_CURSOR_NOT_ALLOWED);
+    ADD_CONSTANT(SDL_SYSTEM_CURSOR_POINTER);
+    ADD_CONSTANT(SDL_SYSTEM_CURSOR_NW_RESIZE);
+    ADD_CONSTANT(SDL_SYSTEM_CURSOR_N_RESIZE);
+    ADD_CONSTANT(SDL_SYSTEM_CURSOR_NE_RESIZE);
+    ADD_CONSTANT(SDL_SYSTEM_CURSOR_E_RESIZE);
+    ADD_CONSTANT(SDL_SYSTEM_CURSOR_SE_RESIZE);
+    ADD_CONSTANT(SDL_SYSTEM_CURSOR_S_RESIZE);
+    ADD_CONSTANT(SDL_SYSTEM_CURSOR_SW_RESIZE);
+    ADD_CONSTANT(SDL_SYSTEM_CURSOR_W_RESIZE);
+
+    ADD_CONSTANT(SDL_KMOD_NONE);
+    ADD_CONSTANT(SDL_KMOD_LSHIFT);
+    ADD_CONSTANT(SDL_KMOD_RSHIFT);
+    ADD_CONSTANT(SDL_KMOD_LCTRL);
+    ADD_CONSTANT(SDL_KMOD_RCTRL);
+    ADD_CONSTANT(SDL_KMOD_LALT);
+    ADD_CONSTANT(SDL_KMOD_RALT);
+    ADD_CONSTANT(SDL_KMOD_LGUI);
+    ADD_CONSTANT(SDL_KMOD_RGUI);
+    ADD_CONSTANT(SDL_KMOD_NUM);
+    ADD_CONSTANT(SDL_KMOD_CAPS);
+    ADD_CONSTANT(SDL_KMOD_CTRL);
+    ADD_CONSTANT(SDL_KMOD_SHIFT);
+    ADD_CONSTANT(SDL_KMOD_ALT);
+    ADD_CONSTANT(SDL_KMOD_GUI);
+
+    ADD_CONSTANT(SDLK_SCANCODE_MASK);
 
     ADD_CONSTANT(SDL_GAMEPAD_BINDTYPE_BUTTON);
     ADD_CONSTANT(SDL_GAMEPAD_BINDTYPE_AXIS);
@@ -1,13 +1,17 @@
 __all__ = []
 
+from array import array
 from typing import Callable
 from typing import Collection
 
 from emath import IVector2
+from emath import U8Vector4Array
 
+from ._type import SdlCursor
 from ._type import SdlDisplayId
 from ._type import SdlDisplayOrientation
 from ._type import SdlEventType
+from ._type import SdlEventWakeup
 from ._type import SdlGamepadAxis
 from ._type import SdlGamepadBindingType
 from ._type import SdlGamepadButton
@@ -16,8 +20,12 @@ from ._type import SdlGamepadType
 from ._type import SdlGlContext
 from ._type import SdlHat
 from ._type import SdlJoystickId
+from ._type import SdlKeycode
+from ._type import SdlKeymod
 from ._type import SdlMouseButton
+from ._type import SdlPenAxis
 from ._type import SdlScancode
+from ._type import SdlSystemCursor
 from ._type import SdlWindow
 from ._type import VkDebugUtilsMessenger
 from ._type import VkInstance
@@ -45,6 +53,7 @@ def swap_sdl_window(sdl_window: SdlWindow, synchronization: int, /) -> None: ...
 def set_sdl_window_border(sdl_window: SdlWindow, is_bordered: bool, /) -> None: ...
 def set_sdl_window_resizeable(sdl_window: SdlWindow, is_resizeable: bool, /) -> None: ...
 def set_sdl_window_always_on_top(sdl_window: SdlWindow, is_always_on_top: bool, /) -> None: ...
+def set_sdl_window_relative_mouse_mode(sdl_window: SdlWindow, is_relative: bool, /) -> None: ...
 def set_sdl_window_fullscreen(
     sdl_window: SdlWindow,
     sdl_display_id: SdlDisplayId,
@@ -94,6 +103,15 @@ GRAPHICS_LIBRARY_NONE: int
 
 # mouse
 def hide_cursor() -> None: ...
+def create_sdl_cursor(
+    pixels: U8Vector4Array, size: IVector2, hotspot: IVector2, /
+) -> SdlCursor: ...
+def create_sdl_system_cursor(sdl_system_cursor: SdlSystemCursor, /) -> SdlCursor: ...
+def delete_sdl_cursor(sdl_cursor: SdlCursor, /) -> None: ...
+def set_sdl_cursor(sdl_cursor: SdlCursor | None, /) -> None: ...
+def get_sdl_keyboard_state() -> memoryview: ...
+def get_sdl_mod_state() -> SdlKeymod: ...
+def get_sdl_keycodes() -> tuple[SdlKeycode, ...]: ...
 def show_cursor() -> None: ...
 
 SDL_BUTTON_LEFT: SdlMouseButton
@@ -101,9 +119,65 @@ SDL_BUTTON_MIDDLE: SdlMouseButton
 SDL_BUTTON_RIGHT: SdlMouseButton
 SDL_BUTTON_X1: SdlMouseButton
 SDL_BUTTON_X2: SdlMouseButton
+SDL_SYSTEM_CURSOR_DEFAULT: SdlSystemCursor
+SDL_SYSTEM_CURSOR_TEXT: SdlSystemCursor
+SDL_SYSTEM_CURSOR_WAIT: SdlSystemCursor
+SDL_SYSTEM_CURSOR_CROSSHAIR: SdlSystemCursor
+SDL_SYSTEM_CURSOR_PROGRESS: SdlSystemCursor
+SDL_SYSTEM_CURSOR_NWSE_RESIZE: SdlSystemCursor
+SDL_SYSTEM_CURSOR_NESW_RESIZE: SdlSystemCursor
+SDL_SYSTEM_CURSOR_EW_RESIZE: SdlSystemCursor
+SDL_SYSTEM_CURSOR_NS_RESIZE: SdlSystemCursor
+SDL_SYSTEM_CURSOR_MOVE: SdlSystemCursor
+SDL_SYSTEM_CURSOR_NOT_ALLOWED: SdlSystemCursor
+SDL_SYSTEM_CURSOR_POINTER: SdlSystemCursor
+SDL_SYSTEM_CURSOR_NW_RESIZE: SdlSystemCursor
+SDL_SYSTEM_CURSOR_N_RESIZE: SdlSystemCursor
+SDL_SYSTEM_CURSOR_NE_RESIZE: SdlSystemCursor
+SDL_SYSTEM_CURSOR_E_RESIZE: SdlSystemCursor
+SDL_SYSTEM_CURSOR_SE_RESIZE: SdlSystemCursor
+SDL_SYSTEM_CURSOR_S_RESIZE: SdlSystemCursor
+SDL_SYSTEM_CURSOR_SW_RESIZE: SdlSystemCursor
+SDL_SYSTEM_CURSOR_W_RESIZE: SdlSystemCursor
+
+# pen
+SDL_PEN_AXIS_PRESSURE: SdlPenAxis
+SDL_PEN_AXIS_XTILT: SdlPenAxis
+SDL_PEN_AXIS_YTILT: SdlPenAxis
+SDL_PEN_AXIS_DISTANCE: SdlPenAxis
+SDL_PEN_AXIS_ROTATION: SdlPenAxis
+SDL_PEN_AXIS_SLIDER: SdlPenAxis
+SDL_PEN_AXIS_TANGENTIAL_PRESSURE: SdlPenAxis
+SDL_PEN_AXIS_COUNT: SdlPenAxis
+
+SDL_KMOD_NONE: SdlKeymod
+SDL_KMOD_LSHIFT: SdlKeymod
+SDL_KMOD_RSHIFT: SdlKeymod
+SDL_KMOD_LCTRL: SdlKeymod
+SDL_KMOD_RCTRL: SdlKeymod
+SDL_KMOD_LALT: SdlKeymod
+SDL_KMOD_RALT: SdlKeymod
+SDL_KMOD_LGUI: SdlKeymod
+SDL_KMOD_RGUI: SdlKeymod
+SDL_KMOD_NUM: SdlKeymod
+SDL_KMOD_CAPS: SdlKeymod
+SDL_KMOD_CTRL: SdlKeymod
+SDL_KMOD_SHIFT: SdlKeymod
+SDL_KMOD_ALT: SdlKeymod
+SDL_KMOD_GUI: SdlKeymod
+
+SDLK_SCANCODE_MASK: SdlKeycode
 
 # event
 def get_sdl_event() -> tuple | None: ...
+def get_sdl_events(max_count: int, /) -> list[tuple]: ...
+def get_sdl_event_count() -> int: ...
+def wait_sdl_event(timeout: int, /) -> bool: ...
+def set_sdl_event_enabled(event_type: SdlEventType, enabled: bool, /) -> None: ...
+def set_sdl_key_repeat_enabled(enabled: bool, /) -> None: ...
+def get_sdl_ticks_ns() -> int: ...
+def create_sdl_event_wakeup(fd: int, /) -> SdlEventWakeup: ...
+def reset_sdl_event_wakeup(sdl_event_wakeup: SdlEventWakeup, /) -> None: ...
 def clear_sdl_events() -> None: ...
 
 SDL_EVENT_QUIT: SdlEventType
@@ -114,6 +188,8 @@ SDL_EVENT_MOUSE_BUTTON_UP: SdlEventType
 SDL_EVENT_KEY_DOWN: SdlEventType
 SDL_EVENT_KEY_UP: SdlEventType
 SDL_EVENT_TEXT_INPUT: SdlEventType
+SDL_EVENT_TEXT_EDITING: SdlEventType
+SDL_EVENT_KEYMAP_CHANGED: SdlEventType
 SDL_EVENT_WINDOW_RESIZED: SdlEventType
 SDL_EVENT_WINDOW_SHOWN: SdlEventType
 SDL_EVENT_WINDOW_HIDDEN: SdlEventType
@@ -131,6 +207,16 @@ SDL_EVENT_JOYSTICK_AXIS_MOTION: SdlEventType
 SDL_EVENT_JOYSTICK_BUTTON_DOWN: SdlEventType
 SDL_EVENT_JOYSTICK_BUTTON_UP: SdlEventType
 SDL_EVENT_JOYSTICK_HAT_MOTION: SdlEventType
+SDL_EVENT_FINGER_DOWN: SdlEventType
+SDL_EVENT_FINGER_UP: SdlEventType
+SDL_EVENT_FINGER_MOTION: SdlEventType
+SDL_EVENT_FINGER_CANCELED: SdlEventType
+SDL_EVENT_PEN_PROXIMITY_IN: SdlEventType
+SDL_EVENT_PEN_PROXIMITY_OUT: SdlEventType
+SDL_EVENT_PEN_DOWN: SdlEventType
+SDL_EVENT_PEN_UP: SdlEventType
+SDL_EVENT_PEN_MOTION: SdlEventType
+SDL_EVENT_PEN_AXIS: SdlEventType
 SDL_EVENT_WINDOW_MAXIMIZED: SdlEventType
 SDL_EVENT_WINDOW_RESTORED: SdlEventType
 
@@ -395,6 +481,13 @@ def open_sdl_joystick(
     tuple[tuple[tuple[tuple, tuple], ...], SdlGamepadType] | None,
 ]: ...
 def close_sdl_joystick(sdl_joystick: SdlJoystickId, /) -> None: ...
+def check_controller_mapping_plan(plan: array[float], values: array[float], /) -> None: ...
+def map_controller_input(
+    plan: array[float], values: array[float], output_min: float, output_max: float, /
+) -> tuple[float, float]: ...
+def map_controller_button(
+    plan: array[float], values: array[float], threshold: float, /
+) -> bool: ...
 def connect_virtual_joystick(name: str, /) -> SdlJoystickId: ...
 def disconnect_virtual_joystick(sdl_joystick: SdlJoystickId, /) -> None: ...
 
@@ -1,7 +1,15 @@
-__all__ = ["EventLoop", "idle"]
+__all__ = ["EventLoop", "EventLoopStats", "idle", "install"]
 
+from asyncio import AbstractEventLoop
+from asyncio import Handle
 from asyncio import SelectorEventLoop
-from selectors import SelectSelector
+from collections import deque
+from math import ceil
+from selectors import EVENT_READ
+from selectors import DefaultSelector
+from selectors import SelectorKey
+from socket import socketpair
+from time import perf_counter_ns
 from time import time
 from typing import Any
 from typing import Callable
@@ -9,6 +17,8 @@ from typing import Final
 from typing import Mapping
 
 from eevent import Event
+from emath import DVector2
+from emath import DVector2Array
 from emath import IVector2
 
 from . import _eplatform
@@ -23,23 +33,44 @@ from ._display import change_display_refresh_rate
 from ._display import change_display_size
 from ._display import connect_display
 from ._display import disconnect_display
-from ._eplatform import get_sdl_event
+from ._eplatform import create_sdl_event_wakeup
+from ._eplatform import get_sdl_event_count
+from ._eplatform import get_sdl_events
+from ._eplatform import reset_sdl_event_wakeup
+from ._eplatform import wait_sdl_event
 from ._keyboard import change_key
+from ._keyboard import remap_keyboard
 from ._mouse import change_mouse_button
 from ._mouse import change_mouse_position
 from ._mouse import scroll_mouse_wheel
+from ._pen import change_pen_axis
+from ._pen import change_pen_press
+from ._pen import change_pen_proximity
+from ._pen import move_pen
 from ._platform import get_keyboard
 from ._platform import get_mouse
+from ._platform import get_pen
+from ._platform import get_touch
 from ._platform import get_window
+from ._touch import move_touch_finger
+from ._touch import press_touch_finger
+from ._touch import release_touch_finger
 from ._type import SdlDisplayId
 from ._type import SdlDisplayOrientation
 from ._type import SdlEventType
+from ._type import SdlEventWakeup
+from ._type import SdlFingerId
 from ._type import SdlHat
 from ._type import SdlJoystickId
+from ._type import SdlKeymod
 from ._type import SdlMouseButton
+from ._type import SdlPenAxis
+from ._type import SdlPenId
 from ._type import SdlScancode
+from ._type import SdlTouchId
 from ._window import blur_window
 from ._window import close_window
+from ._window import edit_window_text
 from ._window import focus_window
 from ._window import hide_window
 from ._window import input_window_text
@@ -51,16 +82,177 @@ from ._window import unmaximize_window
 
 idle: Event[None] = Event()
 
+_SDL_EVENT_BATCH_SIZE: Final = 64
+_SDL_JOYSTICK_EVENT_TYPES: Final = frozenset(
+    (
+        _eplatform.SDL_EVENT_JOYSTICK_BUTTON_DOWN,
+        _eplatform.SDL_EVENT_JOYSTICK_BUTTON_UP,
+        _eplatform.SDL_EVENT_JOYSTICK_HAT_MOTION,
+        _eplatform.SDL_EVENT_JOYSTICK_REMOVED,
+    )
+)
+# events whose order relative to the wheel is observable by a wheel handler, either through what
+# is under the cursor or through the keyboard's modifier
+_SDL_MOUSE_WHEEL_ORDERED_EVENT_TYPES: Final = frozenset(
+    (
+        _eplatform.SDL_EVENT_MOUSE_MOTION,
+        _eplatform.SDL_EVENT_MOUSE_BUTTON_DOWN,
+        _eplatform.SDL_EVENT_MOUSE_BUTTON_UP,
+        _eplatform.SDL_EVENT_KEY_DOWN,
+        _eplatform.SDL_EVENT_KEY_UP,
+    )
+)
+# the longest the selector will sleep before pumping the window system's events
+_SLEEP_SLICE: Final = 0.01
+# handler times are bucketed by their bit length in nanoseconds
+_HANDLER_TIME_HISTOGRAM_SIZE: Final = 64
+
 
 def _noop_poll() -> bool:
     return False
 
 
+class EventLoopStats:
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self._idle_count = 0
+        self._drain_count = 0
+        self._max_queue_depth = 0
+        self._total_queue_depth = 0
+        self._event_counts: dict[SdlEventType, int] = {}
+        self._handler_times: dict[SdlEventType, int] = {}
+        self._handler_time_histograms: dict[SdlEventType, list[int]] = {}
+
+    @property
+    def idle_count(self) -> int:
+        return self._idle_count
+
+    @property
+    def drain_count(self) -> int:
+        return self._drain_count
+
+    @property
+    def max_queue_depth(self) -> int:
+        return self._max_queue_depth
+
+    @property
+    def mean_queue_depth(self) -> float:
+        if not self._drain_count:
+            return 0.0
+        return self._total_queue_depth / self._drain_count
+
+    @property
+    def event_types(self) -> tuple[SdlEventType, ...]:
+        return tuple(self._event_counts)
+
+    def get_event_count(self, event_type: SdlEventType) -> int:
+        return self._event_counts.get(event_type, 0)
+
+    def get_handler_time(self, event_type: SdlEventType) -> int:
+        return self._handler_times.get(event_type, 0)
+
+    def get_handler_time_percentile(self, event_type: SdlEventType, percentile: float) -> int:
+        if percentile < 0 or percentile > 100:
+            raise ValueError("percentile must be between 0 and 100")
+        try:
+            histogram = self._handler_time_histograms[event_type]
+        except KeyError:
+            return 0
+        rank = max(1, ceil(self._event_counts[event_type] * percentile / 100))
+        for i, count in enumerate(histogram):
+            rank -= count
+            if rank <= 0:
+                # the upper bound of the bucket the percentile falls in
+                return (1 << i) - 1
+        # the bucket counts add up to the event count, so this is only reached if they disagree
+        return (1 << (_HANDLER_TIME_HISTOGRAM_SIZE - 1)) - 1
+
+    def _record_idle(self) -> None:
+        self._idle_count += 1
+
+    def _record_drain(self, queue_depth: int) -> None:
+        self._drain_count += 1
+        self._total_queue_depth += queue_depth
+        if queue_depth > self._max_queue_depth:
+            self._max_queue_depth = queue_depth
+
+    def _dispatch_sdl_event(self, handle: Callable[..., bool], event: tuple) -> bool:
+        start = perf_counter_ns()
+        try:
+            return handle(*event)
+        finally:
+            handler_time = perf_counter_ns() - start
+            event_type = event[0]
+            self._event_counts[event_type] = self._event_counts.get(event_type, 0) + 1
+            self._handler_times[event_type] = self._handler_times.get(event_type, 0) + handler_time
+            histogram = self._handler_time_histograms.get(event_type)
+            if histogram is None:
+                histogram = [0] * _HANDLER_TIME_HISTOGRAM_SIZE
+                self._handler_time_histograms[event_type] = histogram
+            histogram[min(handler_time.bit_length(), _HANDLER_TIME_HISTOGRAM_SIZE - 1)] += 1
+
+
+def install(
+    loop: AbstractEventLoop,
+    *,
+    poll: Callable[[], bool] | None = None,
+    sdl_event_budget: int | None = 1,
+    # without sleeping the driver reschedules itself with call_soon as soon as each tick ends, so
+    # an idle loop would spin a whole core
+    sleep_when_idle: bool = True,
+    coalesce_mouse_motion: bool = False,
+    coalesce_controller_axis_motion: bool = False,
+    coalesce_text_input: bool = False,
+    coalesce_mouse_wheel: bool = False,
+    stats: EventLoopStats | None = None,
+) -> Callable[[], None]:
+    if poll is None:
+        poll = _noop_poll
+    if sdl_event_budget is not None and sdl_event_budget < 1:
+        raise ValueError("sdl_event_budget must be at least 1")
+    driver = _LoopDriver(
+        loop,
+        poll,
+        sdl_event_budget,
+        sleep_when_idle,
+        coalesce_mouse_motion,
+        coalesce_controller_axis_motion,
+        coalesce_text_input,
+        coalesce_mouse_wheel,
+        stats,
+    )
+    return driver.close
+
+
 class EventLoop(SelectorEventLoop):
-    def __init__(self, *, poll: Callable[[], bool] | None = None) -> None:
+    def __init__(
+        self,
+        *,
+        poll: Callable[[], bool] | None = None,
+        sdl_event_budget: int | None = None,
+        sleep_when_idle: bool = False,
+        coalesce_mouse_motion: bool = False,
+        coalesce_controller_axis_motion: bool = False,
+        coalesce_text_input: bool = False,
+        coalesce_mouse_wheel: bool = False,
+        stats: EventLoopStats | None = None,
+    ) -> None:
         if poll is None:
             poll = _noop_poll
-        selector = _Selector(poll)
+        if sdl_event_budget is not None and sdl_event_budget < 1:
+            raise ValueError("sdl_event_budget must be at least 1")
+        selector = _Selector(
+            poll,
+            sdl_event_budget,
+            sleep_when_idle,
+            coalesce_mouse_motion,
+            coalesce_controller_axis_motion,
+            coalesce_text_input,
+            coalesce_mouse_wheel,
+            stats,
+        )
         super().__init__(selector)
         # _ready is an implementation detail of asyncio.base_events.BaseEventLoop
         # it's the only way of determining if there are callbacks ready to be processed or if
@@ -68,34 +260,198 @@ class EventLoop(SelectorEventLoop):
         selector._EPlatformSelector_ready_callbacks = self._ready  # type: ignore
 
 
-class _Selector(SelectSelector):
+class _SdlEventDispatcher:
     _EPlatformSelector_ready_callbacks: Any = None
 
-    def __init__(self, poll: Callable[[], bool]):
-        self.__poll = poll
-        super().__init__()
-
-    def select(self, timeout: float | None = None) -> Any:
-        start = time()
-        if self._EPlatformSelector__poll_sdl_events():
-            return []
-        result = super().select(-1)
-        if (
-            not self._EPlatformSelector_ready_callbacks
-            and not result
-            and not (timeout is not None and time() - start > timeout)
-            and not self.__poll()
-        ):
-            idle(None)
-        return result
+    def __init__(
+        self,
+        sdl_event_budget: int | None = None,
+        coalesce_mouse_motion: bool = False,
+        coalesce_controller_axis_motion: bool = False,
+        coalesce_text_input: bool = False,
+        coalesce_mouse_wheel: bool = False,
+        stats: EventLoopStats | None = None,
+    ):
+        self._EPlatformSelector_stats = stats
+        self.__sdl_event_budget = sdl_event_budget
+        self.__coalesce_mouse_motion = coalesce_mouse_motion
+        self.__coalesce_controller_axis_motion = coalesce_controller_axis_motion
+        self.__coalesce_text_input = coalesce_text_input
+        self.__coalesce_mouse_wheel = coalesce_mouse_wheel
+        self.__sdl_events: deque[tuple] = deque()
+        # the latest value, its timestamp and the number of samples seen for each
+        # (joystick, axis) in a drain
+        self.__pending_axis_motion: dict[tuple[SdlJoystickId, int], tuple[float, int, int]] = {}
+        self.__pending_text_input: list[str] = []
+        self.__pending_text_input_timestamp = 0
+        # the summed delta, the latest timestamp and the number of samples seen in a drain
+        self.__pending_mouse_wheel: tuple[DVector2, int, int] | None = None
 
     def _EPlatformSelector__poll_sdl_events(self) -> bool:
+        ready_callbacks = self._EPlatformSelector_ready_callbacks
+        ready_callback_count = 0 if ready_callbacks is None else len(ready_callbacks)
+        budget = self.__sdl_event_budget
+        sdl_events = self.__sdl_events
+        pending_axis_motion = self.__pending_axis_motion
+        coalesce_controller_axis_motion = self.__coalesce_controller_axis_motion
+        pending_text_input = self.__pending_text_input
+        coalesce_text_input = self.__coalesce_text_input
+        coalesce_mouse_wheel = self.__coalesce_mouse_wheel
+        stats = self._EPlatformSelector_stats
+        if stats is not None:
+            stats._record_drain(len(sdl_events) + get_sdl_event_count())
+        handled = False
+        while budget is None or budget > 0:
+            if not sdl_events:
+                sdl_events.extend(
+                    get_sdl_events(_SDL_EVENT_BATCH_SIZE if budget is None else budget)
+                )
+                if not sdl_events:
+                    break
+            event = sdl_events.popleft()
+            event_type = event[0]
+            if coalesce_controller_axis_motion:
+                if event_type == _eplatform.SDL_EVENT_JOYSTICK_AXIS_MOTION:
+                    _, timestamp, sdl_joystick, axis_index, value = event
+                    key = (sdl_joystick, axis_index)
+                    _, _, sample_count = pending_axis_motion.get(key, (None, None, 0))
+                    pending_axis_motion[key] = (value, timestamp, sample_count + 1)
+                    continue
+                # keep the order of a joystick's events
+                if pending_axis_motion and event_type in _SDL_JOYSTICK_EVENT_TYPES:
+                    if self._EPlatformSelector__flush_controller_axis_motion():
+                        handled = True
+            if coalesce_text_input:
+                if event_type == _eplatform.SDL_EVENT_TEXT_INPUT:
+                    pending_text_input.append(event[2])
+                    self.__pending_text_input_timestamp = event[1]
+                    continue
+                # released and repeating keys can't change where the text goes, anything else
+                # must observe the text that came before it
+                if pending_text_input and not (
+                    event_type == _eplatform.SDL_EVENT_KEY_UP
+                    or (event_type == _eplatform.SDL_EVENT_KEY_DOWN and event[4])
+                ):
+                    if self._EPlatformSelector__flush_text_input():
+                        handled = True
+            if coalesce_mouse_wheel:
+                if event_type == _eplatform.SDL_EVENT_MOUSE_WHEEL:
+                    _, timestamp, delta = event
+                    pending_mouse_wheel = self.__pending_mouse_wheel
+                    if pending_mouse_wheel is None:
+                        self.__pending_mouse_wheel = (delta, timestamp, 1)
+                    else:
+                        pending_delta, _, sample_count = pending_mouse_wheel
+                        self.__pending_mouse_wheel = (
+                            pending_delta + delta,
+                            timestamp,
+                            sample_count + 1,
+                        )
+                    continue
+                # the wheel scrolls whatever is under the cursor with whatever modifier is held
+                # when it is turned
+                if (
+                    self.__pending_mouse_wheel is not None
+                    and event_type in _SDL_MOUSE_WHEEL_ORDERED_EVENT_TYPES
+                ):
+                    if self._EPlatformSelector__flush_mouse_wheel():
+                        handled = True
+            if self.__coalesce_mouse_motion and event_type == _eplatform.SDL_EVENT_MOUSE_MOTION:
+                event = self._EPlatformSelector__coalesce_mouse_motion(event)
+            if stats is None:
+                is_handled = self._EPlatformSelector__handle_sdl_event(*event)
+            else:
+                is_handled = stats._dispatch_sdl_event(
+                    self._EPlatformSelector__handle_sdl_event, event
+                )
+            if is_handled:
+                handled = True
+                if budget is not None:
+                    budget -= 1
+                # an event woke something that is awaiting it, give control back to the loop so
+                # that it can observe the event before any other event is dispatched
+                if ready_callbacks is not None and len(ready_callbacks) > ready_callback_count:
+                    break
+        if pending_axis_motion and self._EPlatformSelector__flush_controller_axis_motion():
+            handled = True
+        if pending_text_input and self._EPlatformSelector__flush_text_input():
+            handled = True
+        if self.__pending_mouse_wheel is not None and self._EPlatformSelector__flush_mouse_wheel():
+            handled = True
+        return handled
+
+    def _EPlatformSelector__flush_controller_axis_motion(self) -> bool:
+        pending_axis_motion = self.__pending_axis_motion
+        stats = self._EPlatformSelector_stats
+        handled = False
+        for (sdl_joystick, axis_index), pending in pending_axis_motion.items():
+            value, timestamp, sample_count = pending
+            event = (
+                _eplatform.SDL_EVENT_JOYSTICK_AXIS_MOTION,
+                timestamp,
+                sdl_joystick,
+                axis_index,
+                value,
+                sample_count,
+            )
+            if stats is None:
+                is_handled = self._EPlatformSelector__handle_sdl_event(*event)
+            else:
+                is_handled = stats._dispatch_sdl_event(
+                    self._EPlatformSelector__handle_sdl_event, event
+                )
+            if is_handled:
+                handled = True
+        pending_axis_motion.clear()
+        return handled
+
+    def _EPlatformSelector__flush_text_input(self) -> bool:
+        pending_text_input = self.__pending_text_input
+        stats = self._EPlatformSelector_stats
+        event = (
+            _eplatform.SDL_EVENT_TEXT_INPUT,
+            self.__pending_text_input_timestamp,
+            "".join(pending_text_input),
+        )
+        pending_text_input.clear()
+        if stats is None:
+            return self._EPlatformSelector__handle_sdl_event(*event)
+        return stats._dispatch_sdl_event(self._EPlatformSelector__handle_sdl_event, event)
+
+    def _EPlatformSelector__flush_mouse_wheel(self) -> bool:
+        assert self.__pending_mouse_wheel is not None
+        delta, timestamp, sample_count = self.__pending_mouse_wheel
+        self.__pending_mouse_wheel = None
+        stats = self._EPlatformSelector_stats
+        event = (_eplatform.SDL_EVENT_MOUSE_WHEEL, timestamp, delta, sample_count)
+        if stats is None:
+            return self._EPlatformSelector__handle_sdl_event(*event)
+        return stats._dispatch_sdl_event(self._EPlatformSelector__handle_sdl_event, event)
+
+    def _EPlatformSelector__coalesce_mouse_motion(self, event: tuple) -> tuple:
+        event_type, timestamp, position, delta = event
+        samples = [position]
+        sample_timestamps = [timestamp]
+        sdl_events = self.__sdl_events
         while True:
-            event = get_sdl_event()
-            if event is None:
-                return False
-            if self._EPlatformSelector__handle_sdl_event(*event):
-                return True
+            if not sdl_events:
+                sdl_events.extend(get_sdl_events(_SDL_EVENT_BATCH_SIZE))
+                if not sdl_events:
+                    break
+            if sdl_events[0][0] != event_type:
+                break
+            _, timestamp, position, sample_delta = sdl_events.popleft()
+            delta += sample_delta
+            samples.append(position)
+            sample_timestamps.append(timestamp)
+        return (
+            event_type,
+            timestamp,
+            position,
+            delta,
+            DVector2Array(*samples),
+            tuple(sample_timestamps),
+        )
 
     def _EPlatformSelector__handle_sdl_event(self, event_type: SdlEventType, *args: Any) -> bool:
         try:
@@ -104,131 +460,238 @@ class _Selector(SelectSelector):
             return False
         return handler(self, *args)
 
-    def _EPlatformSelector__handle_sdl_event_quit(self) -> bool:
+    def _EPlatformSelector__handle_sdl_event_quit(self, timestamp: int) -> bool:
         close_window(get_window())
         return True
 
     def _EPlatformSelector__handle_sdl_event_mouse_motion(
-        self, position: IVector2, delta: IVector2
+        self,
+        timestamp: int,
+        position: DVector2,
+        delta: DVector2,
+        samples: DVector2Array | None = None,
+        sample_timestamps: tuple[int, ...] | None = None,
     ) -> bool:
         mouse = get_mouse()
-        change_mouse_position(mouse, position, delta)
+        change_mouse_position(
+            mouse,
+            position,
+            delta,
+            timestamp,
+            samples,
+            sample_timestamps,
+            get_window().mouse_regions,
+        )
         return True
 
-    def _EPlatformSelector__handle_sdl_event_mouse_wheel(self, delta: IVector2) -> bool:
+    def _EPlatformSelector__handle_sdl_event_mouse_wheel(
+        self, timestamp: int, delta: DVector2, sample_count: int | None = None
+    ) -> bool:
         mouse = get_mouse()
-        scroll_mouse_wheel(mouse, delta)
+        scroll_mouse_wheel(mouse, delta, timestamp, sample_count)
         return True
 
     def _EPlatformSelector__handle_sdl_event_mouse_button_changed(
-        self, button: SdlMouseButton, is_pressed: bool
+        self, timestamp: int, button: SdlMouseButton, is_pressed: bool
     ) -> bool:
         mouse = get_mouse()
-        change_mouse_button(mouse, button, is_pressed)
+        change_mouse_button(mouse, button, is_pressed, timestamp, get_window().mouse_regions)
         return True
 
     def _EPlatformSelector__handle_sdl_event_key_changed(
-        self, key: SdlScancode, is_pressed: bool, is_repeat: bool
+        self,
+        timestamp: int,
+        key: SdlScancode,
+        is_pressed: bool,
+        is_repeat: bool,
+        keymod: SdlKeymod,
     ) -> bool:
-        return change_key(get_keyboard(), key, is_pressed, is_repeat)
+        return change_key(get_keyboard(), key, is_pressed, is_repeat, keymod, timestamp)
 
-    def _EPlatformSelector__handle_sdl_event_text_input(self, text: str) -> bool:
-        input_window_text(get_window(), text)
+    def _EPlatformSelector__handle_sdl_event_keymap_changed(self, timestamp: int) -> bool:
+        remap_keyboard(get_keyboard())
         return True
 
-    def _EPlatformSelector__handle_sdl_event_window_resized(self, size: IVector2) -> bool:
-        resize_window(get_window(), size)
+    def _EPlatformSelector__handle_sdl_event_text_input(self, timestamp: int, text: str) -> bool:
+        input_window_text(get_window(), text, timestamp)
         return True
 
-    def _EPlatformSelector__handle_sdl_event_window_shown(self) -> bool:
-        show_window(get_window())
+    def _EPlatformSelector__handle_sdl_event_text_editing(
+        self, timestamp: int, text: str, cursor_position: int, selection_length: int
+    ) -> bool:
+        edit_window_text(get_window(), text, cursor_position, selection_length, timestamp)
         return True
 
-    def _EPlatformSelector__handle_sdl_event_window_hidden(self) -> bool:
-        hide_window(get_window())
+    def _EPlatformSelector__handle_sdl_event_finger_down(
+        self,
+        timestamp: int,
+        touch_id: SdlTouchId,
+        finger_id: SdlFingerId,
+        x: float,
+        y: float,
+        dx: float,
+        dy: float,
+        pressure: float,
+    ) -> bool:
+        press_touch_finger(get_touch(), touch_id, finger_id, x, y, pressure, timestamp)
         return True
 
-    def _EPlatformSelector__handle_sdl_event_window_moved(self, position: IVector2) -> bool:
-        move_window(get_window(), position)
+    def _EPlatformSelector__handle_sdl_event_finger_up(
+        self,
+        timestamp: int,
+        touch_id: SdlTouchId,
+        finger_id: SdlFingerId,
+        x: float,
+        y: float,
+        dx: float,
+        dy: float,
+        pressure: float,
+    ) -> bool:
+        release_touch_finger(get_touch(), touch_id, finger_id, x, y, pressure, timestamp)
+        return True
+
+    def _EPlatformSelector__handle_sdl_event_finger_motion(
+        self,
+        timestamp: int,
+        touch_id: SdlTouchId,
+        finger_id: SdlFingerId,
+        x: float,
+        y: float,
+        dx: float,
+        dy: float,
+        pressure: float,
+    ) -> bool:
+        move_touch_finger(get_touch(), touch_id, finger_id, x, y, dx, dy, pressure, timestamp)
+        return True
+
+    def _EPlatformSelector__handle_sdl_event_pen_proximity_changed(
+        self, timestamp: int, pen_id: SdlPenId, is_in_proximity: bool
+    ) -> bool:
+        change_pen_proximity(get_pen(), pen_id, is_in_proximity, timestamp)
+        return True
+
+    def _EPlatformSelector__handle_sdl_event_pen_press_changed(
+        self, timestamp: int, pen_id: SdlPenId, x: float, y: float, is_down: bool, is_eraser: bool
+    ) -> bool:
+        change_pen_press(get_pen(), pen_id, x, y, is_down, is_eraser, timestamp)
+        return True
+
+    def _EPlatformSelector__handle_sdl_event_pen_motion(
+        self, timestamp: int, pen_id: SdlPenId, x: float, y: float
+    ) -> bool:
+        move_pen(get_pen(), pen_id, x, y, timestamp)
+        return True
+
+    def _EPlatformSelector__handle_sdl_event_pen_axis(
+        self, timestamp: int, pen_id: SdlPenId, x: float, y: float, axis: SdlPenAxis, value: float
+    ) -> bool:
+        return change_pen_axis(get_pen(), pen_id, x, y, axis, value, timestamp)
+
+    def _EPlatformSelector__handle_sdl_event_window_resized(
+        self, timestamp: int, size: IVector2
+    ) -> bool:
+        resize_window(get_window(), size, timestamp)
+        return True
+
+    def _EPlatformSelector__handle_sdl_event_window_shown(self, timestamp: int) -> bool:
+        show_window(get_window(), timestamp)
+        return True
+
+    def _EPlatformSelector__handle_sdl_event_window_hidden(self, timestamp: int) -> bool:
+        hide_window(get_window(), timestamp)
+        return True
+
+    def _EPlatformSelector__handle_sdl_event_window_moved(
+        self, timestamp: int, position: IVector2
+    ) -> bool:
+        move_window(get_window(), position, timestamp)
         return True
 
     def _EPlatformSelector__handle_sdl_event_display_added(
-        self, sdl_display: SdlDisplayId
+        self, timestamp: int, sdl_display: SdlDisplayId
     ) -> bool:
         connect_display(sdl_display)
         return True
 
     def _EPlatformSelector__handle_sdl_event_display_removed(
-        self, sdl_display: SdlDisplayId
+        self, timestamp: int, sdl_display: SdlDisplayId
     ) -> bool:
         disconnect_display(sdl_display)
         return True
 
     def _EPlatformSelector__handle_sdl_event_display_orientation(
-        self, sdl_display: SdlDisplayId, sdl_display_orientation: SdlDisplayOrientation
+        self,
+        timestamp: int,
+        sdl_display: SdlDisplayId,
+        sdl_display_orientation: SdlDisplayOrientation,
     ) -> bool:
         change_display_orientation(sdl_display, sdl_display_orientation)
         return True
 
     def _EPlatformSelector__handle_sdl_event_display_moved(
-        self, sdl_display: SdlDisplayId, position: IVector2
+        self, timestamp: int, sdl_display: SdlDisplayId, position: IVector2
     ) -> bool:
         change_display_position(sdl_display, position)
         return True
 
     def _EPlatformSelector__handle_sdl_event_current_mode_changed(
-        self, sdl_display: SdlDisplayId, size: IVector2, refresh_rate: float
+        self, timestamp: int, sdl_display: SdlDisplayId, size: IVector2, refresh_rate: float
     ) -> bool:
         change_display_size(sdl_display, size)
         change_display_refresh_rate(sdl_display, refresh_rate)
         return True
 
-    def _EPlatformSelector__handle_sdl_event_window_focus_gained(self) -> bool:
+    def _EPlatformSelector__handle_sdl_event_window_focus_gained(self, timestamp: int) -> bool:
         focus_window(get_window())
         return True
 
-    def _EPlatformSelector__handle_sdl_event_window_focus_lost(self) -> bool:
+    def _EPlatformSelector__handle_sdl_event_window_focus_lost(self, timestamp: int) -> bool:
         blur_window(get_window())
         return True
 
     def _EPlatformSelector__handle_sdl_event_joystick_added(
-        self, sdl_joystick: SdlJoystickId
+        self, timestamp: int, sdl_joystick: SdlJoystickId
     ) -> bool:
         connect_controller(sdl_joystick)
         return True
 
     def _EPlatformSelector__handle_sdl_event_joystick_removed(
-        self, sdl_joystick: SdlJoystickId
+        self, timestamp: int, sdl_joystick: SdlJoystickId
     ) -> bool:
         disconnect_controller(sdl_joystick)
         return True
 
     def _EPlatformSelector__handle_sdl_event_joystick_axis_motion(
-        self, sdl_joystick: SdlJoystickId, axis_index: int, value: float
+        self,
+        timestamp: int,
+        sdl_joystick: SdlJoystickId,
+        axis_index: int,
+        value: float,
+        sample_count: int | None = None,
     ) -> bool:
-        return controller_change_axis(sdl_joystick, axis_index, value)
+        return controller_change_axis(sdl_joystick, axis_index, value, timestamp, sample_count)
 
     def _EPlatformSelector__handle_sdl_event_joystick_button_down(
-        self, sdl_joystick: SdlJoystickId, button_index: int
+        self, timestamp: int, sdl_joystick: SdlJoystickId, button_index: int
     ) -> bool:
-        return controller_change_button(sdl_joystick, button_index, True)
+        return controller_change_button(sdl_joystick, button_index, True, timestamp)
 
     def _EPlatformSelector__handle_sdl_event_joystick_button_up(
-        self, sdl_joystick: SdlJoystickId, button_index: int
+        self, timestamp: int, sdl_joystick: SdlJoystickId, button_index: int
     ) -> bool:
-        return controller_change_button(sdl_joystick, button_index, False)
+        return controller_change_button(sdl_joystick, button_index, False, timestamp)
 
     def _EPlatformSelector__handle_sdl_event_joystick_hat_motion(
-        self, sdl_joystick: SdlJoystickId, hat_index: int, value: SdlHat
+        self, timestamp: int, sdl_joystick: SdlJoystickId, hat_index: int, value: SdlHat
     ) -> bool:
-        return controller_change_hat(sdl_joystick, hat_index, value)
+        return controller_change_hat(sdl_joystick, hat_index, value, timestamp)
 
-    def _EPlatformSelector__handle_sdl_event_window_maximized(self):
-        maximize_window(get_window())
+    def _EPlatformSelector__handle_sdl_event_window_maximized(self, timestamp: int) -> bool:
+        maximize_window(get_window(), timestamp)
         return True
 
-    def _EPlatformSelector__handle_sdl_event_window_restored(self):
-        unmaximize_window(get_window())
+    def _EPlatformSelector__handle_sdl_event_window_restored(self, timestamp: int) -> bool:
+        unmaximize_window(get_window(), timestamp)
         return True
 
     _SDL_EVENT_DISPATCH: Final[Mapping[SdlEventType, Callable[..., bool]]] = {
@@ -239,7 +702,9 @@ class _Selector(SelectSelector):
         _eplatform.SDL_EVENT_MOUSE_BUTTON_UP: _EPlatformSelector__handle_sdl_event_mouse_button_changed,
         _eplatform.SDL_EVENT_KEY_DOWN: _EPlatformSelector__handle_sdl_event_key_changed,
         _eplatform.SDL_EVENT_KEY_UP: _EPlatformSelector__handle_sdl_event_key_changed,
+        _eplatform.SDL_EVENT_KEYMAP_CHANGED: _EPlatformSelector__handle_sdl_event_keymap_changed,
         _eplatform.SDL_EVENT_TEXT_INPUT: _EPlatformSelector__handle_sdl_event_text_input,
+        _eplatform.SDL_EVENT_TEXT_EDITING: _EPlatformSelector__handle_sdl_event_text_editing,
         _eplatform.SDL_EVENT_WINDOW_RESIZED: _EPlatformSelector__handle_sdl_event_window_resized,
         _eplatform.SDL_EVENT_WINDOW_SHOWN: _EPlatformSelector__handle_sdl_event_window_shown,
         _eplatform.SDL_EVENT_WINDOW_HIDDEN: _EPlatformSelector__handle_sdl_event_window_hidden,
@@ -257,6 +722,192 @@ class _Selector(SelectSelector):
         _eplatform.SDL_EVENT_JOYSTICK_BUTTON_DOWN: _EPlatformSelector__handle_sdl_event_joystick_button_down,
         _eplatform.SDL_EVENT_JOYSTICK_BUTTON_UP: _EPlatformSelector__handle_sdl_event_joystick_button_up,
         _eplatform.SDL_EVENT_JOYSTICK_HAT_MOTION: _EPlatformSelector__handle_sdl_event_joystick_hat_motion,
+        _eplatform.SDL_EVENT_FINGER_DOWN: _EPlatformSelector__handle_sdl_event_finger_down,
+        _eplatform.SDL_EVENT_FINGER_UP: _EPlatformSelector__handle_sdl_event_finger_up,
+        _eplatform.SDL_EVENT_FINGER_MOTION: _EPlatformSelector__handle_sdl_event_finger_motion,
+        _eplatform.SDL_EVENT_FINGER_CANCELED: _EPlatformSelector__handle_sdl_event_finger_up,
+        _eplatform.SDL_EVENT_PEN_PROXIMITY_IN: _EPlatformSelector__handle_sdl_event_pen_proximity_changed,
+        _eplatform.SDL_EVENT_PEN_PROXIMITY_OUT: _EPlatformSelector__handle_sdl_event_pen_proximity_changed,
+        _eplatform.SDL_EVENT_PEN_DOWN: _EPlatformSelector__handle_sdl_event_pen_press_changed,
+        _eplatform.SDL_EVENT_PEN_UP: _EPlatformSelector__handle_sdl_event_pen_press_changed,
+        _eplatform.SDL_EVENT_PEN_MOTION: _EPlatformSelector__handle_sdl_event_pen_motion,
+        _eplatform.SDL_EVENT_PEN_AXIS: _EPlatformSelector__handle_sdl_event_pen_axis,
         _eplatform.SDL_EVENT_WINDOW_MAXIMIZED: _EPlatformSelector__handle_sdl_event_window_maximized,
         _eplatform.SDL_EVENT_WINDOW_RESTORED: _EPlatformSelector__handle_sdl_event_window_restored,
     }
+
+
+class _Wakeup:
+    def __init__(self) -> None:
+        reader, writer = socketpair()
+        reader.setblocking(False)
+        writer.setblocking(False)
+        # the wakeup must be released before the socket it writes to is closed
+        self.__sdl_event_wakeup: SdlEventWakeup = create_sdl_event_wakeup(writer.fileno())
+        self.reader = reader
+        self.__writer = writer
+
+    def close(self) -> None:
+        del self.__sdl_event_wakeup
+        self.reader.close()
+        self.__writer.close()
+
+    def reset(self) -> None:
+        # the socket must be drained before sdl is allowed to write to it again, otherwise a wakeup
+        # sent in between would be discarded
+        try:
+            while self.reader.recv(4096):
+                pass
+        except BlockingIOError:
+            pass
+        reset_sdl_event_wakeup(self.__sdl_event_wakeup)
+
+
+class _Selector(_SdlEventDispatcher, DefaultSelector):
+    def __init__(
+        self,
+        poll: Callable[[], bool],
+        sdl_event_budget: int | None = None,
+        sleep_when_idle: bool = False,
+        coalesce_mouse_motion: bool = False,
+        coalesce_controller_axis_motion: bool = False,
+        coalesce_text_input: bool = False,
+        coalesce_mouse_wheel: bool = False,
+        stats: EventLoopStats | None = None,
+    ):
+        _SdlEventDispatcher.__init__(
+            self,
+            sdl_event_budget,
+            coalesce_mouse_motion,
+            coalesce_controller_axis_motion,
+            coalesce_text_input,
+            coalesce_mouse_wheel,
+            stats,
+        )
+        DefaultSelector.__init__(self)
+        self.__poll = poll
+        self.__sleep_when_idle = sleep_when_idle
+        # SDL writes to the wakeup socket when an event is queued so that the selector can block
+        # on SDL events and any other registered file objects at the same time
+        self.__wakeup = _Wakeup()
+        self.__wakeup_key = self.register(self.__wakeup.reader, EVENT_READ)
+
+    def close(self) -> None:
+        self.unregister(self.__wakeup.reader)
+        self.__wakeup.close()
+        super().close()
+
+    def select(self, timeout: float | None = None) -> Any:
+        start = time()
+        if self._EPlatformSelector__poll_sdl_events():
+            return []
+        result, is_woken = self._EPlatformSelector__select(-1)
+        if (
+            not is_woken
+            and not self._EPlatformSelector_ready_callbacks
+            and not result
+            and not (timeout is not None and time() - start > timeout)
+            and not self.__poll()
+        ):
+            if self._EPlatformSelector_stats is not None:
+                self._EPlatformSelector_stats._record_idle()
+            idle(None)
+            if self.__sleep_when_idle and not self._EPlatformSelector_ready_callbacks:
+                result = self._EPlatformSelector__sleep(start, timeout)
+        return result
+
+    def _EPlatformSelector__sleep(self, start: float, timeout: float | None) -> Any:
+        while True:
+            if timeout is None:
+                duration = _SLEEP_SLICE
+            else:
+                duration = min(timeout - (time() - start), _SLEEP_SLICE)
+                if duration <= 0:
+                    return []
+            result, is_woken = self._EPlatformSelector__select(duration)
+            # the window system's events are only queued by SDL when they are pumped, so those
+            # are checked for each time the selector gives up waiting
+            if result or is_woken or wait_sdl_event(0):
+                return result
+
+    def _EPlatformSelector__select(
+        self, timeout: float
+    ) -> tuple[list[tuple[SelectorKey, int]], bool]:
+        result = super().select(timeout)
+        wakeup_key = self.__wakeup_key
+        is_woken = False
+        for i, (key, _) in enumerate(result):
+            if key is wakeup_key:
+                del result[i]
+                is_woken = True
+                self.__wakeup.reset()
+                break
+        return result, is_woken
+
+
+class _LoopDriver(_SdlEventDispatcher):
+    def __init__(
+        self,
+        loop: AbstractEventLoop,
+        poll: Callable[[], bool],
+        sdl_event_budget: int | None,
+        sleep_when_idle: bool,
+        coalesce_mouse_motion: bool,
+        coalesce_controller_axis_motion: bool,
+        coalesce_text_input: bool,
+        coalesce_mouse_wheel: bool,
+        stats: EventLoopStats | None,
+    ):
+        super().__init__(
+            sdl_event_budget,
+            coalesce_mouse_motion,
+            coalesce_controller_axis_motion,
+            coalesce_text_input,
+            coalesce_mouse_wheel,
+            stats,
+        )
+        # asyncio's own loops expose their ready callbacks, other loops don't, in which case the
+        # budget is what stops an awaiter from missing events
+        self._EPlatformSelector_ready_callbacks = getattr(loop, "_ready", None)
+        self.__loop = loop
+        self.__poll = poll
+        self.__sleep_when_idle = sleep_when_idle
+        self.__is_sleeping = False
+        self.__is_closed = False
+        self.__wakeup = _Wakeup()
+        loop.add_reader(self.__wakeup.reader, self.__wake)
+        self.__tick_handle: Handle = loop.call_soon(self.__tick)
+
+    def close(self) -> None:
+        if self.__is_closed:
+            return
+        self.__is_closed = True
+        self.__tick_handle.cancel()
+        self.__loop.remove_reader(self.__wakeup.reader)
+        self.__wakeup.close()
+
+    def __wake(self) -> None:
+        self.__wakeup.reset()
+        if self.__is_sleeping:
+            self.__tick_handle.cancel()
+            self.__is_sleeping = False
+            self.__tick_handle = self.__loop.call_soon(self.__tick)
+
+    def __tick(self) -> None:
+        is_idle = False
+        try:
+            if not self._EPlatformSelector__poll_sdl_events() and not self.__poll():
+                is_idle = True
+                if self._EPlatformSelector_stats is not None:
+                    self._EPlatformSelector_stats._record_idle()
+                idle(None)
+        finally:
+            # the driver may have been closed by something run during the tick
+            if not self.__is_closed:
+                # when sleeping the window system's events are pumped at least once per slice
+                if is_idle and self.__sleep_when_idle:
+                    self.__is_sleeping = True
+                    self.__tick_handle = self.__loop.call_later(_SLEEP_SLICE, self.__tick)
+                else:
+                    self.__is_sleeping = False
+                    self.__tick_handle = self.__loop.call_soon(self.__tick)
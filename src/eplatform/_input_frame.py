@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+__all__ = ["InputFrame", "InputFrameInput", "change_input_frame_input"]
+
+from typing import TYPE_CHECKING
+from typing import Final
+from typing import TypeAlias
+from weakref import ref
+
+if TYPE_CHECKING:
+    from ._controller import ControllerButton
+    from ._keyboard import KeyboardKey
+    from ._mouse import MouseButton
+
+InputFrameInput: TypeAlias = "KeyboardKey | MouseButton | ControllerButton"
+
+# a plain set of references, iterating a WeakSet is expensive even when it's empty and this is
+# visited for every button change
+_input_frames: Final[set[ref[InputFrame]]] = set()
+
+
+class InputFrame:
+    def __init__(self) -> None:
+        self._down: frozenset[InputFrameInput] = frozenset()
+        self._went_down: set[InputFrameInput] = set()
+        self._went_up: set[InputFrameInput] = set()
+        self._next_down: set[InputFrameInput] = set()
+        self._next_went_down: set[InputFrameInput] = set()
+        self._next_went_up: set[InputFrameInput] = set()
+        _input_frames.add(ref(self, _input_frames.discard))
+
+    def advance(self) -> None:
+        self._down = frozenset(self._next_down)
+        self._went_down, self._next_went_down = self._next_went_down, self._went_down
+        self._went_up, self._next_went_up = self._next_went_up, self._went_up
+        self._next_went_down.clear()
+        self._next_went_up.clear()
+
+    def is_down(self, input: InputFrameInput) -> bool:
+        return input in self._down
+
+    def went_down(self, input: InputFrameInput) -> bool:
+        return input in self._went_down
+
+    def went_up(self, input: InputFrameInput) -> bool:
+        return input in self._went_up
+
+    @property
+    def down(self) -> frozenset[InputFrameInput]:
+        return self._down
+
+    def _change(self, input: InputFrameInput, is_pressed: bool) -> None:
+        if is_pressed:
+            if input not in self._next_down:
+                self._next_down.add(input)
+                self._next_went_down.add(input)
+        elif input in self._next_down:
+            self._next_down.remove(input)
+            self._next_went_up.add(input)
+
+
+def change_input_frame_input(input: InputFrameInput, is_pressed: bool) -> None:
+    if not _input_frames:
+        return
+    # a frame may be collected, removing its reference, while the others are being changed
+    for input_frame_ref in tuple(_input_frames):
+        input_frame = input_frame_ref()
+        if input_frame is not None:
+            input_frame._change(input, is_pressed)
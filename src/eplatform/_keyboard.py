@@ -1,15 +1,36 @@
-__all__ = ["Keyboard", "KeyboardKey", "KeyboardKeyChanged", "KeyboardKeyLocation", "change_key"]
+__all__ = [
+    "Keyboard",
+    "KeyboardKey",
+    "KeyboardKeyChanged",
+    "KeyboardKeyLocation",
+    "KeyboardShortcut",
+    "KeyboardShortcutActivated",
+    "KeyboardShortcutStroke",
+    "KeyboardState",
+    "change_key",
+    "remap_keyboard",
+]
 
+from asyncio import TimerHandle
+from asyncio import get_running_loop
 from enum import IntFlag
 from enum import StrEnum
 from enum import auto
 from typing import Final
 from typing import Mapping
+from typing import TypeAlias
 from typing import TypedDict
 
 from eevent import Event
 
 from . import _eplatform
+from ._eplatform import get_sdl_keyboard_state
+from ._eplatform import get_sdl_keycodes
+from ._eplatform import get_sdl_mod_state
+from ._eplatform import get_sdl_ticks_ns
+from ._eplatform import set_sdl_key_repeat_enabled
+from ._input_frame import change_input_frame_input
+from ._type import SdlKeymod
 from ._type import SdlScancode
 
 
@@ -17,6 +38,9 @@ class KeyboardModifier(IntFlag):
     CONTROL = auto()
     ALT = auto()
     SHIFT = auto()
+    GUI = auto()
+    CAPS_LOCK = auto()
+    NUM_LOCK = auto()
     NONE = 0
 
 
@@ -260,6 +284,8 @@ class KeyboardKey:
     def __init__(self, location: KeyboardKeyLocation):
         self.location = location
         self.is_pressed = False
+        self._repeat_delay: float | None = None
+        self._repeat_interval: float | None = None
 
         self.changed = Event()
         self.pressed = Event()
@@ -268,65 +294,365 @@ class KeyboardKey:
     def __repr__(self) -> str:
         return f"<KeyboardKey {self.location.value!r}>"
 
+    @property
+    def repeat_delay(self) -> float | None:
+        return self._repeat_delay
+
+    @property
+    def repeat_interval(self) -> float | None:
+        return self._repeat_interval
+
+    def set_repeat(self, delay: float | None, interval: float | None) -> None:
+        _check_key_repeat(delay, interval)
+        self._repeat_delay = delay
+        self._repeat_interval = interval
+
+
+KeyboardShortcutStroke: TypeAlias = tuple[KeyboardKeyLocation, KeyboardModifier]
+
+
+class KeyboardShortcut:
+    activated: Event["KeyboardShortcutActivated"] = Event()
+
+    def __init__(self, *strokes: KeyboardShortcutStroke):
+        if not strokes:
+            raise ValueError("shortcut must have at least one stroke")
+        for _, modifier in strokes:
+            if modifier & ~_KEYBOARD_SHORTCUT_MODIFIER_MASK:
+                raise ValueError("shortcut modifier may only be control, alt, shift or gui")
+        self._strokes = strokes
+
+        self.activated = Event()
+
+    def __repr__(self) -> str:
+        strokes = ", ".join(f"{m!r}+{l.value!r}" for l, m in self._strokes)
+        return f"<KeyboardShortcut {strokes}>"
+
+    @property
+    def strokes(self) -> tuple[KeyboardShortcutStroke, ...]:
+        return self._strokes
+
+
+class _KeyboardShortcutNode:
+    def __init__(self) -> None:
+        self.children: dict[KeyboardShortcutStroke, _KeyboardShortcutNode] = {}
+        self.shortcut: KeyboardShortcut | None = None
+
+
+class KeyboardState:
+    def __init__(self, buffer: bytes | bytearray | memoryview) -> None:
+        self._buffer = buffer
+
+    def __getitem__(self, location: KeyboardKeyLocation) -> bool:
+        return bool(self._buffer[_KEY_LOCATION_TO_SDL_SCANCODE[location]])
+
+    @property
+    def buffer(self) -> memoryview:
+        return memoryview(self._buffer)
+
+    def get_pressed(self) -> set[KeyboardKeyLocation]:
+        buffer = self._buffer
+        return {
+            location
+            for location, sdl_scancode in _KEY_LOCATION_TO_SDL_SCANCODE.items()
+            if buffer[sdl_scancode]
+        }
+
 
 class Keyboard:
     _keys_by_location: Mapping[KeyboardKeyLocation, KeyboardKey]
 
     def __init__(self) -> None:
+        self._state = KeyboardState(get_sdl_keyboard_state())
         self._keys_by_location = {l: KeyboardKey(l) for l in KeyboardKeyLocation}
-        self._left_control = self._keys_by_location[KeyboardKeyLocation.LEFT_CONTROL]
-        self._right_control = self._keys_by_location[KeyboardKeyLocation.RIGHT_CONTROL]
-        self._left_shift = self._keys_by_location[KeyboardKeyLocation.LEFT_SHIFT]
-        self._right_shift = self._keys_by_location[KeyboardKeyLocation.RIGHT_SHIFT]
-        self._left_alt = self._keys_by_location[KeyboardKeyLocation.LEFT_ALT]
-        self._right_alt = self._keys_by_location[KeyboardKeyLocation.RIGHT_ALT]
+        # key events index this by scancode directly, which is cheaper than hashing the location
+        keys_by_sdl_scancode: list[KeyboardKey | None] = [None] * (
+            max(_SDL_SCANCODE_TO_KEY_LOCATION) + 1
+        )
+        for sdl_scancode, location in _SDL_SCANCODE_TO_KEY_LOCATION.items():
+            keys_by_sdl_scancode[sdl_scancode] = self._keys_by_location[location]
+        self._keys_by_sdl_scancode = tuple(keys_by_sdl_scancode)
+        self._sdl_keymod = get_sdl_mod_state()
+        self._modifier = _get_keyboard_modifier(self._sdl_keymod)
+        self._logical_locations = _get_logical_key_locations()
+        self._shortcut_root = self._shortcut_node = _KeyboardShortcutNode()
+        self._shortcut_timestamp = 0
+        self._shortcut_timeout = 1.0
+        self._shortcut_timeout_ns = 1_000_000_000
+        self._key_repeat: tuple[float, float] | None = None
+        self._key_repeat_key: KeyboardKey | None = None
+        self._key_repeat_handle: TimerHandle | None = None
 
     def get_key_by_location(self, location: KeyboardKeyLocation) -> KeyboardKey:
         return self._keys_by_location[location]
 
+    def get_logical_location(self, location: KeyboardKeyLocation) -> KeyboardKeyLocation | None:
+        return self._logical_locations[_KEY_LOCATION_TO_SDL_SCANCODE[location]]
+
+    @property
+    def state(self) -> KeyboardState:
+        return self._state
+
+    def snapshot(self) -> KeyboardState:
+        return KeyboardState(self._state._buffer.tobytes())
+
     @property
     def modifier(self) -> KeyboardModifier:
-        modifier = KeyboardModifier.NONE
-        if self._left_control.is_pressed or self._right_control.is_pressed:
-            modifier |= KeyboardModifier.CONTROL
-        if self._left_shift.is_pressed or self._right_shift.is_pressed:
-            modifier |= KeyboardModifier.SHIFT
-        if self._left_alt.is_pressed or self._right_alt.is_pressed:
-            modifier |= KeyboardModifier.ALT
-        return modifier
+        return self._modifier
+
+    @property
+    def shortcut_timeout(self) -> float:
+        return self._shortcut_timeout
+
+    @shortcut_timeout.setter
+    def shortcut_timeout(self, value: float) -> None:
+        if value < 0:
+            raise ValueError("shortcut timeout must be 0 or greater")
+        self._shortcut_timeout = value
+        self._shortcut_timeout_ns = int(value * 1_000_000_000)
+
+    @property
+    def key_repeat(self) -> tuple[float, float] | None:
+        return self._key_repeat
+
+    def enable_key_repeat(self, delay: float, interval: float) -> None:
+        _check_key_repeat(delay, interval)
+        self._key_repeat = (delay, interval)
+        set_sdl_key_repeat_enabled(False)
+
+    def disable_key_repeat(self) -> None:
+        self._key_repeat = None
+        _stop_key_repeat(self)
+        set_sdl_key_repeat_enabled(True)
+
+    def add_shortcut(self, shortcut: KeyboardShortcut) -> None:
+        node = self._shortcut_root
+        for stroke in shortcut._strokes:
+            try:
+                node = node.children[stroke]
+            except KeyError:
+                node.children[stroke] = node = _KeyboardShortcutNode()
+        if node.shortcut is not None:
+            raise ValueError("shortcut strokes are already bound")
+        node.shortcut = shortcut
+        self._shortcut_node = self._shortcut_root
+
+    def remove_shortcut(self, shortcut: KeyboardShortcut) -> None:
+        path = [self._shortcut_root]
+        for stroke in shortcut._strokes:
+            node = path[-1].children.get(stroke)
+            if node is None:
+                raise ValueError("shortcut is not bound")
+            path.append(node)
+        if path[-1].shortcut is not shortcut:
+            raise ValueError("shortcut is not bound")
+        path[-1].shortcut = None
+        for i in range(len(shortcut._strokes), 0, -1):
+            node = path[i]
+            if node.children or node.shortcut is not None:
+                break
+            del path[i - 1].children[shortcut._strokes[i - 1]]
+        self._shortcut_node = self._shortcut_root
 
 
 def change_key(
-    keyboard: Keyboard, sdl_scancode: SdlScancode, is_pressed: bool, is_repeat: bool
+    keyboard: Keyboard,
+    sdl_scancode: SdlScancode,
+    is_pressed: bool,
+    is_repeat: bool,
+    sdl_keymod: SdlKeymod,
+    timestamp: int,
 ) -> bool:
-    try:
-        key_location = _SDL_SCANCODE_TO_KEY_LOCATION[sdl_scancode]
-    except KeyError:
+    keyboard._sdl_keymod = sdl_keymod
+    keyboard._modifier = modifier = _get_keyboard_modifier(sdl_keymod)
+    keys_by_sdl_scancode = keyboard._keys_by_sdl_scancode
+    if not 0 <= sdl_scancode < len(keys_by_sdl_scancode):
+        return False
+    key = keys_by_sdl_scancode[sdl_scancode]
+    if key is None:
         return False
-    key = keyboard._keys_by_location[key_location]
     key.is_pressed = is_pressed
+    change_input_frame_input(key, is_pressed)
     data: KeyboardKeyChanged = {
         "key": key,
         "is_pressed": is_pressed,
         "is_repeat": is_repeat,
-        "modifier": keyboard.modifier,
+        "modifier": modifier,
+        "logical_location": keyboard._logical_locations[sdl_scancode],
+        "timestamp": timestamp,
     }
     KeyboardKey.changed(data)
     key.changed(data)
     if is_pressed:
         KeyboardKey.pressed(data)
         key.pressed(data)
+        if (
+            not is_repeat
+            and keyboard._shortcut_root.children
+            and key.location not in _MODIFIER_KEY_LOCATIONS
+        ):
+            _match_shortcut(keyboard, key.location, modifier, timestamp)
     else:
         KeyboardKey.released(data)
         key.released(data)
+    if keyboard._key_repeat is not None and not is_repeat:
+        if is_pressed:
+            _start_key_repeat(keyboard, key, sdl_scancode)
+        elif key is keyboard._key_repeat_key:
+            _stop_key_repeat(keyboard)
     return True
 
 
+def _check_key_repeat(delay: float | None, interval: float | None) -> None:
+    if delay is not None and delay < 0:
+        raise ValueError("key repeat delay must be 0 or greater")
+    if interval is not None and interval <= 0:
+        raise ValueError("key repeat interval must be greater than 0")
+
+
+def _start_key_repeat(keyboard: Keyboard, key: KeyboardKey, sdl_scancode: SdlScancode) -> None:
+    # like the os, only the most recently pressed key repeats
+    _stop_key_repeat(keyboard)
+    try:
+        loop = get_running_loop()
+    except RuntimeError:
+        return
+    assert keyboard._key_repeat is not None
+    delay, interval = keyboard._key_repeat
+    if key._repeat_delay is not None:
+        delay = key._repeat_delay
+    if key._repeat_interval is not None:
+        interval = key._repeat_interval
+    keyboard._key_repeat_key = key
+    keyboard._key_repeat_handle = loop.call_later(
+        delay, _repeat_key, keyboard, sdl_scancode, interval
+    )
+
+
+def _repeat_key(keyboard: Keyboard, sdl_scancode: SdlScancode, interval: float) -> None:
+    # scheduled relative to now rather than the previous repeat so that a stalled loop doesn't
+    # catch up with a burst of repeats
+    keyboard._key_repeat_handle = get_running_loop().call_later(
+        interval, _repeat_key, keyboard, sdl_scancode, interval
+    )
+    change_key(keyboard, sdl_scancode, True, True, keyboard._sdl_keymod, get_sdl_ticks_ns())
+
+
+def _stop_key_repeat(keyboard: Keyboard) -> None:
+    if keyboard._key_repeat_handle is not None:
+        keyboard._key_repeat_handle.cancel()
+        keyboard._key_repeat_handle = None
+    keyboard._key_repeat_key = None
+
+
+def remap_keyboard(keyboard: Keyboard) -> None:
+    keyboard._logical_locations = _get_logical_key_locations()
+
+
+def _get_logical_key_locations() -> tuple[KeyboardKeyLocation | None, ...]:
+    scancode_mask = _eplatform.SDLK_SCANCODE_MASK
+    logical_locations: list[KeyboardKeyLocation | None] = []
+    for sdl_keycode in get_sdl_keycodes():
+        if sdl_keycode & scancode_mask:
+            location = _SDL_SCANCODE_TO_KEY_LOCATION.get(SdlScancode(sdl_keycode & ~scancode_mask))
+        else:
+            location = _SDL_CHARACTER_KEYCODE_TO_KEY_LOCATION.get(sdl_keycode)
+        logical_locations.append(location)
+    return tuple(logical_locations)
+
+
+def _match_shortcut(
+    keyboard: Keyboard,
+    key_location: KeyboardKeyLocation,
+    modifier: KeyboardModifier,
+    timestamp: int,
+) -> None:
+    root = keyboard._shortcut_root
+    node = keyboard._shortcut_node
+    if (
+        node is not root
+        and timestamp - keyboard._shortcut_timestamp > keyboard._shortcut_timeout_ns
+    ):
+        node = root
+    stroke = (key_location, _keyboard_shortcut_modifiers[modifier])
+    try:
+        node = node.children[stroke]
+    except KeyError:
+        # a stroke that breaks a chord may still start a new one
+        next_node = None if node is root else root.children.get(stroke)
+        if next_node is None:
+            keyboard._shortcut_node = root
+            return
+        node = next_node
+    keyboard._shortcut_node = node if node.children else root
+    keyboard._shortcut_timestamp = timestamp
+    shortcut = node.shortcut
+    if shortcut is not None:
+        data: KeyboardShortcutActivated = {"shortcut": shortcut, "timestamp": timestamp}
+        KeyboardShortcut.activated(data)
+        shortcut.activated(data)
+
+
 class KeyboardKeyChanged(TypedDict):
     key: KeyboardKey
     is_pressed: bool
     is_repeat: bool
     modifier: KeyboardModifier
+    logical_location: KeyboardKeyLocation | None
+    timestamp: int
+
+
+class KeyboardShortcutActivated(TypedDict):
+    shortcut: KeyboardShortcut
+    timestamp: int
+
+
+def _get_keyboard_modifier(sdl_keymod: SdlKeymod) -> KeyboardModifier:
+    try:
+        return _keyboard_modifiers[sdl_keymod]
+    except KeyError:
+        pass
+    modifier = KeyboardModifier.NONE
+    for sdl_keymod_mask, keyboard_modifier in _SDL_KEYMOD_MASK_TO_KEYBOARD_MODIFIER.items():
+        if sdl_keymod & sdl_keymod_mask:
+            modifier |= keyboard_modifier
+    _keyboard_modifiers[sdl_keymod] = modifier
+    _keyboard_shortcut_modifiers[modifier] = modifier & _KEYBOARD_SHORTCUT_MODIFIER_MASK
+    return modifier
+
+
+_SDL_KEYMOD_MASK_TO_KEYBOARD_MODIFIER: Final[Mapping[SdlKeymod, KeyboardModifier]] = {
+    _eplatform.SDL_KMOD_CTRL: KeyboardModifier.CONTROL,
+    _eplatform.SDL_KMOD_ALT: KeyboardModifier.ALT,
+    _eplatform.SDL_KMOD_SHIFT: KeyboardModifier.SHIFT,
+    _eplatform.SDL_KMOD_GUI: KeyboardModifier.GUI,
+    _eplatform.SDL_KMOD_CAPS: KeyboardModifier.CAPS_LOCK,
+    _eplatform.SDL_KMOD_NUM: KeyboardModifier.NUM_LOCK,
+}
+
+_KEYBOARD_SHORTCUT_MODIFIER_MASK: Final = (
+    KeyboardModifier.CONTROL | KeyboardModifier.ALT | KeyboardModifier.SHIFT | KeyboardModifier.GUI
+)
+
+# pressing a modifier key on its own neither matches nor breaks a shortcut
+_MODIFIER_KEY_LOCATIONS: Final = frozenset(
+    {
+        KeyboardKeyLocation.LEFT_CONTROL,
+        KeyboardKeyLocation.RIGHT_CONTROL,
+        KeyboardKeyLocation.LEFT_ALT,
+        KeyboardKeyLocation.RIGHT_ALT,
+        KeyboardKeyLocation.LEFT_SHIFT,
+        KeyboardKeyLocation.RIGHT_SHIFT,
+        KeyboardKeyLocation.LEFT_SPECIAL,
+        KeyboardKeyLocation.RIGHT_SPECIAL,
+        KeyboardKeyLocation.CAPSLOCK,
+        KeyboardKeyLocation.NUMLOCK_CLEAR,
+    }
+)
+
+_keyboard_modifiers: Final[dict[SdlKeymod, KeyboardModifier]] = {}
+# lock modifiers are ignored when matching shortcuts
+_keyboard_shortcut_modifiers: Final[dict[KeyboardModifier, KeyboardModifier]] = {}
 
 
 _SDL_SCANCODE_TO_KEY_LOCATION: Final[Mapping[SdlScancode, KeyboardKeyLocation]] = {
@@ -577,3 +903,69 @@ _SDL_SCANCODE_TO_KEY_LOCATION: Final[Mapping[SdlScancode, KeyboardKeyLocation]]
 }
 
 assert len(_SDL_SCANCODE_TO_KEY_LOCATION) == len(KeyboardKeyLocation)
+
+_KEY_LOCATION_TO_SDL_SCANCODE: Final[Mapping[KeyboardKeyLocation, SdlScancode]] = {
+    location: sdl_scancode for sdl_scancode, location in _SDL_SCANCODE_TO_KEY_LOCATION.items()
+}
+
+# keys that produce a character have that character's codepoint as their sdl keycode, any other
+# key's keycode is its scancode with SDLK_SCANCODE_MASK set
+_SDL_CHARACTER_KEYCODE_TO_KEY_LOCATION: Final[Mapping[int, KeyboardKeyLocation]] = {
+    # number
+    ord("0"): KeyboardKeyLocation.ZERO,
+    ord("1"): KeyboardKeyLocation.ONE,
+    ord("2"): KeyboardKeyLocation.TWO,
+    ord("3"): KeyboardKeyLocation.THREE,
+    ord("4"): KeyboardKeyLocation.FOUR,
+    ord("5"): KeyboardKeyLocation.FIVE,
+    ord("6"): KeyboardKeyLocation.SIX,
+    ord("7"): KeyboardKeyLocation.SEVEN,
+    ord("8"): KeyboardKeyLocation.EIGHT,
+    ord("9"): KeyboardKeyLocation.NINE,
+    # letter
+    ord("a"): KeyboardKeyLocation.A,
+    ord("b"): KeyboardKeyLocation.B,
+    ord("c"): KeyboardKeyLocation.C,
+    ord("d"): KeyboardKeyLocation.D,
+    ord("e"): KeyboardKeyLocation.E,
+    ord("f"): KeyboardKeyLocation.F,
+    ord("g"): KeyboardKeyLocation.G,
+    ord("h"): KeyboardKeyLocation.H,
+    ord("i"): KeyboardKeyLocation.I,
+    ord("j"): KeyboardKeyLocation.J,
+    ord("k"): KeyboardKeyLocation.K,
+    ord("l"): KeyboardKeyLocation.L,
+    ord("m"): KeyboardKeyLocation.M,
+    ord("n"): KeyboardKeyLocation.N,
+    ord("o"): KeyboardKeyLocation.O,
+    ord("p"): KeyboardKeyLocation.P,
+    ord("q"): KeyboardKeyLocation.Q,
+    ord("r"): KeyboardKeyLocation.R,
+    ord("s"): KeyboardKeyLocation.S,
+    ord("t"): KeyboardKeyLocation.T,
+    ord("u"): KeyboardKeyLocation.U,
+    ord("v"): KeyboardKeyLocation.V,
+    ord("w"): KeyboardKeyLocation.W,
+    ord("x"): KeyboardKeyLocation.X,
+    ord("y"): KeyboardKeyLocation.Y,
+    ord("z"): KeyboardKeyLocation.Z,
+    # symbol
+    ord("'"): KeyboardKeyLocation.APOSTROPHE,
+    ord("\\"): KeyboardKeyLocation.BACKSLASH,
+    ord(","): KeyboardKeyLocation.COMMA,
+    ord("="): KeyboardKeyLocation.EQUALS,
+    ord("`"): KeyboardKeyLocation.GRAVE,
+    ord("["): KeyboardKeyLocation.LEFT_BRACKET,
+    ord("-"): KeyboardKeyLocation.MINUS,
+    ord("."): KeyboardKeyLocation.PERIOD,
+    ord("]"): KeyboardKeyLocation.RIGHT_BRACKET,
+    ord(";"): KeyboardKeyLocation.SEMICOLON,
+    ord("/"): KeyboardKeyLocation.SLASH,
+    ord(" "): KeyboardKeyLocation.SPACE,
+    # control
+    ord("\b"): KeyboardKeyLocation.BACKSPACE,
+    ord("\t"): KeyboardKeyLocation.TAB,
+    ord("\r"): KeyboardKeyLocation.ENTER,
+    ord("\x1b"): KeyboardKeyLocation.ESCAPE,
+    ord("\x7f"): KeyboardKeyLocation.DELETE,
+}
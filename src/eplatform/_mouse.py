@@ -5,6 +5,10 @@ __all__ = [
     "MouseButton",
     "MouseButtonChanged",
     "MouseButtonLocation",
+    "MouseCursor",
+    "MouseCursorImage",
+    "MouseCursorShape",
+    "MouseMotionHistory",
     "MouseMoved",
     "MouseScrolled",
     "MouseScrolledDirection",
@@ -13,18 +17,38 @@ __all__ = [
     "scroll_mouse_wheel",
 ]
 
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from dataclasses import dataclass
 from enum import StrEnum
 from typing import Final
 from typing import Mapping
+from typing import NotRequired
+from typing import TypeAlias
 from typing import TypedDict
 
 from eevent import Event
+from emath import DVector2
+from emath import DVector2Array
 from emath import IVector2
+from emath import U8Vector4Array
 
 from . import _eplatform
+from ._eplatform import create_sdl_cursor
+from ._eplatform import create_sdl_system_cursor
+from ._eplatform import delete_sdl_cursor
 from ._eplatform import hide_cursor
+from ._eplatform import set_sdl_cursor
+from ._eplatform import set_sdl_window_relative_mouse_mode
 from ._eplatform import show_cursor
+from ._input_frame import change_input_frame_input
+from ._mouse_region import MouseRegionGrid
+from ._mouse_region import change_mouse_regions_button
+from ._mouse_region import hover_mouse_regions
+from ._type import SdlCursor
 from ._type import SdlMouseButton
+from ._type import SdlSystemCursor
 
 
 class MouseButtonLocation(StrEnum):
@@ -43,6 +67,7 @@ class MouseButton:
     def __init__(self, location: MouseButtonLocation):
         self.location = location
         self.is_pressed = False
+        self.pressed_timestamp: int | None = None
 
         self.changed = Event()
         self.pressed = Event()
@@ -52,9 +77,106 @@ class MouseButton:
         return f"<MouseButton {self.location!r}>"
 
 
+class MouseCursorShape(StrEnum):
+    DEFAULT = "default"
+    TEXT = "text"
+    WAIT = "wait"
+    CROSSHAIR = "crosshair"
+    PROGRESS = "progress"
+    NWSE_RESIZE = "nwse_resize"
+    NESW_RESIZE = "nesw_resize"
+    EW_RESIZE = "ew_resize"
+    NS_RESIZE = "ns_resize"
+    MOVE = "move"
+    NOT_ALLOWED = "not_allowed"
+    POINTER = "pointer"
+    NW_RESIZE = "nw_resize"
+    N_RESIZE = "n_resize"
+    NE_RESIZE = "ne_resize"
+    E_RESIZE = "e_resize"
+    SE_RESIZE = "se_resize"
+    S_RESIZE = "s_resize"
+    SW_RESIZE = "sw_resize"
+    W_RESIZE = "w_resize"
+
+
+@dataclass(frozen=True)
+class MouseCursorImage:
+    pixels: U8Vector4Array
+    size: IVector2
+    hotspot: IVector2
+
+
+MouseCursor: TypeAlias = MouseCursorShape | MouseCursorImage
+
+
+class MouseMotionHistory:
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("motion history capacity must be greater than 0")
+        self._capacity = capacity
+        self._timestamps = array("q", bytes(8 * capacity))
+        self._positions = array("d", bytes(16 * capacity))
+        self._start = 0
+        self._length = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def clear(self) -> None:
+        self._start = 0
+        self._length = 0
+
+    def get_velocity(self, duration: int) -> DVector2:
+        if self._length < 2:
+            return DVector2(0)
+        last = self._length - 1
+        last_timestamp = self._get_timestamp(last)
+        first = min(self._find(last_timestamp - duration), last - 1)
+        seconds = (last_timestamp - self._get_timestamp(first)) / 1_000_000_000
+        if seconds <= 0:
+            return DVector2(0)
+        return (self._get_position(last) - self._get_position(first)) / seconds
+
+    def get_path(self, since: int) -> DVector2Array:
+        return DVector2Array(
+            *(self._get_position(i) for i in range(self._find(since), self._length))
+        )
+
+    def _find(self, timestamp: int) -> int:
+        return bisect_left(range(self._length), timestamp, key=self._get_timestamp)
+
+    def _get_timestamp(self, i: int) -> int:
+        return self._timestamps[(self._start + i) % self._capacity]
+
+    def _get_position(self, i: int) -> DVector2:
+        i = ((self._start + i) % self._capacity) * 2
+        return DVector2(self._positions[i], self._positions[i + 1])
+
+    def _append(self, timestamp: int, position: DVector2) -> None:
+        if self._length == self._capacity:
+            i = self._start
+            self._start = (i + 1) % self._capacity
+        else:
+            i = (self._start + self._length) % self._capacity
+            self._length += 1
+        self._timestamps[i] = timestamp
+        self._positions[i * 2] = position.x
+        self._positions[i * 2 + 1] = position.y
+
+
 class Mouse:
     _buttons_by_location: Mapping[MouseButtonLocation, MouseButton]
-    _position = IVector2(0)
+    _position = DVector2(0)
+    _is_relative_mode = False
+    _relative_delta = DVector2(0)
+    _motion_history: MouseMotionHistory | None = None
+    _cursor: MouseCursor = MouseCursorShape.DEFAULT
+    _cursor_cache_capacity = 32
 
     moved: Event[MouseMoved] = Event()
 
@@ -68,6 +190,10 @@ class Mouse:
 
     def __init__(self) -> None:
         self._buttons_by_location = {l: MouseButton(l) for l in MouseButtonLocation}
+        self._buttons_by_sdl_mouse_button = {
+            b: self._buttons_by_location[l] for b, l in _SDL_MOUSE_BUTTON_TO_LOCATION.items()
+        }
+        self._sdl_cursors: OrderedDict[MouseCursor, SdlCursor] = OrderedDict()
 
         self.moved = Event()
 
@@ -83,15 +209,99 @@ class Mouse:
         return self._buttons_by_location[location]
 
     @property
-    def position(self) -> IVector2:
+    def position(self) -> DVector2:
         return self._position
 
+    @property
+    def is_relative_mode(self) -> bool:
+        return self._is_relative_mode
+
+    def enable_relative_mode(self) -> None:
+        from ._platform import get_window
+        from ._window import get_sdl_window
+
+        set_sdl_window_relative_mouse_mode(get_sdl_window(get_window()), True)
+        self._is_relative_mode = True
+        self._relative_delta = DVector2(0)
+
+    def disable_relative_mode(self) -> None:
+        if not self._is_relative_mode:
+            return
+        from ._platform import get_window
+        from ._window import get_sdl_window
+
+        set_sdl_window_relative_mouse_mode(get_sdl_window(get_window()), False)
+        self._is_relative_mode = False
+        self._relative_delta = DVector2(0)
+
+    def take_relative_delta(self) -> DVector2:
+        delta = self._relative_delta
+        self._relative_delta = DVector2(0)
+        return delta
+
+    @property
+    def motion_history(self) -> MouseMotionHistory | None:
+        return self._motion_history
+
+    def enable_motion_history(self, capacity: int) -> MouseMotionHistory:
+        self._motion_history = MouseMotionHistory(capacity)
+        return self._motion_history
+
+    def disable_motion_history(self) -> None:
+        self._motion_history = None
+
     def show(self) -> None:
         show_cursor()
 
     def hide(self) -> None:
         hide_cursor()
 
+    @property
+    def cursor(self) -> MouseCursor:
+        return self._cursor
+
+    def set_cursor(self, cursor: MouseCursor) -> None:
+        if cursor == self._cursor:
+            return
+        if cursor is MouseCursorShape.DEFAULT:
+            set_sdl_cursor(None)
+        else:
+            try:
+                sdl_cursor = self._sdl_cursors[cursor]
+            except KeyError:
+                if isinstance(cursor, MouseCursorShape):
+                    sdl_cursor = create_sdl_system_cursor(_MOUSE_CURSOR_SHAPE_TO_SDL[cursor])
+                else:
+                    sdl_cursor = create_sdl_cursor(cursor.pixels, cursor.size, cursor.hotspot)
+                self._sdl_cursors[cursor] = sdl_cursor
+            else:
+                self._sdl_cursors.move_to_end(cursor)
+            set_sdl_cursor(sdl_cursor)
+        self._cursor = cursor
+        self._evict_sdl_cursors()
+
+    def reset_cursor(self) -> None:
+        set_sdl_cursor(None)
+        self._cursor = MouseCursorShape.DEFAULT
+        while self._sdl_cursors:
+            delete_sdl_cursor(self._sdl_cursors.popitem()[1])
+
+    @property
+    def cursor_cache_capacity(self) -> int:
+        return self._cursor_cache_capacity
+
+    @cursor_cache_capacity.setter
+    def cursor_cache_capacity(self, value: int) -> None:
+        if value < 1:
+            raise ValueError("cursor cache capacity must be greater than 0")
+        self._cursor_cache_capacity = value
+        self._evict_sdl_cursors()
+
+    def _evict_sdl_cursors(self) -> None:
+        # the active cursor is always the most recently used, so it is never evicted
+        while len(self._sdl_cursors) > self._cursor_cache_capacity:
+            delete_sdl_cursor(self._sdl_cursors.popitem(last=False)[1])
+
 
 _SDL_MOUSE_BUTTON_TO_LOCATION: Final[Mapping[SdlMouseButton, MouseButtonLocation]] = {
     _eplatform.SDL_BUTTON_LEFT: MouseButtonLocation.LEFT,
@@ -102,39 +312,107 @@ _SDL_MOUSE_BUTTON_TO_LOCATION: Final[Mapping[SdlMouseButton, MouseButtonLocation
 }
 
 
+_MOUSE_CURSOR_SHAPE_TO_SDL: Final[Mapping[MouseCursorShape, SdlSystemCursor]] = {
+    MouseCursorShape.DEFAULT: _eplatform.SDL_SYSTEM_CURSOR_DEFAULT,
+    MouseCursorShape.TEXT: _eplatform.SDL_SYSTEM_CURSOR_TEXT,
+    MouseCursorShape.WAIT: _eplatform.SDL_SYSTEM_CURSOR_WAIT,
+    MouseCursorShape.CROSSHAIR: _eplatform.SDL_SYSTEM_CURSOR_CROSSHAIR,
+    MouseCursorShape.PROGRESS: _eplatform.SDL_SYSTEM_CURSOR_PROGRESS,
+    MouseCursorShape.NWSE_RESIZE: _eplatform.SDL_SYSTEM_CURSOR_NWSE_RESIZE,
+    MouseCursorShape.NESW_RESIZE: _eplatform.SDL_SYSTEM_CURSOR_NESW_RESIZE,
+    MouseCursorShape.EW_RESIZE: _eplatform.SDL_SYSTEM_CURSOR_EW_RESIZE,
+    MouseCursorShape.NS_RESIZE: _eplatform.SDL_SYSTEM_CURSOR_NS_RESIZE,
+    MouseCursorShape.MOVE: _eplatform.SDL_SYSTEM_CURSOR_MOVE,
+    MouseCursorShape.NOT_ALLOWED: _eplatform.SDL_SYSTEM_CURSOR_NOT_ALLOWED,
+    MouseCursorShape.POINTER: _eplatform.SDL_SYSTEM_CURSOR_POINTER,
+    MouseCursorShape.NW_RESIZE: _eplatform.SDL_SYSTEM_CURSOR_NW_RESIZE,
+    MouseCursorShape.N_RESIZE: _eplatform.SDL_SYSTEM_CURSOR_N_RESIZE,
+    MouseCursorShape.NE_RESIZE: _eplatform.SDL_SYSTEM_CURSOR_NE_RESIZE,
+    MouseCursorShape.E_RESIZE: _eplatform.SDL_SYSTEM_CURSOR_E_RESIZE,
+    MouseCursorShape.SE_RESIZE: _eplatform.SDL_SYSTEM_CURSOR_SE_RESIZE,
+    MouseCursorShape.S_RESIZE: _eplatform.SDL_SYSTEM_CURSOR_S_RESIZE,
+    MouseCursorShape.SW_RESIZE: _eplatform.SDL_SYSTEM_CURSOR_SW_RESIZE,
+    MouseCursorShape.W_RESIZE: _eplatform.SDL_SYSTEM_CURSOR_W_RESIZE,
+}
+
+
 class MouseMoved(TypedDict):
-    position: IVector2
-    delta: IVector2
+    position: DVector2
+    delta: DVector2
+    timestamp: int
+    samples: NotRequired[DVector2Array]
+    sample_timestamps: NotRequired[tuple[int, ...]]
 
 
 class MouseScrolled(TypedDict):
-    delta: IVector2
+    delta: DVector2
+    timestamp: int
+    sample_count: NotRequired[int]
 
 
 class MouseScrolledDirection(TypedDict):
-    delta: int
+    delta: float
+    timestamp: int
 
 
 class MouseButtonChanged(TypedDict):
     button: MouseButton
     is_pressed: bool
-    position: IVector2
-
-
-def change_mouse_position(mouse: Mouse, position: IVector2, delta: IVector2) -> None:
+    position: DVector2
+    timestamp: int
+
+
+def change_mouse_position(
+    mouse: Mouse,
+    position: DVector2,
+    delta: DVector2,
+    timestamp: int,
+    samples: DVector2Array | None = None,
+    sample_timestamps: tuple[int, ...] | None = None,
+    mouse_regions: MouseRegionGrid | None = None,
+) -> None:
     mouse._position = position
-    event_data: MouseMoved = {"position": position, "delta": delta}
+    if mouse._is_relative_mode:
+        mouse._relative_delta += delta
+    if mouse._motion_history is not None:
+        if samples is None:
+            mouse._motion_history._append(timestamp, position)
+        elif sample_timestamps is None:
+            for sample in samples:
+                mouse._motion_history._append(timestamp, sample)
+        else:
+            for sample_timestamp, sample in zip(sample_timestamps, samples, strict=True):
+                mouse._motion_history._append(sample_timestamp, sample)
+    if mouse_regions is not None:
+        hover_mouse_regions(mouse_regions, position, timestamp)
+    event_data: MouseMoved = {"position": position, "delta": delta, "timestamp": timestamp}
+    if samples is not None:
+        event_data["samples"] = samples
+    if sample_timestamps is not None:
+        event_data["sample_timestamps"] = sample_timestamps
     Mouse.moved(event_data)
     mouse.moved(event_data)
 
 
-def change_mouse_button(mouse: Mouse, sdl_mouse_button: SdlMouseButton, is_pressed: bool) -> None:
-    button = mouse.get_button(_SDL_MOUSE_BUTTON_TO_LOCATION[sdl_mouse_button])
+def change_mouse_button(
+    mouse: Mouse,
+    sdl_mouse_button: SdlMouseButton,
+    is_pressed: bool,
+    timestamp: int,
+    mouse_regions: MouseRegionGrid | None = None,
+) -> None:
+    button = mouse._buttons_by_sdl_mouse_button[sdl_mouse_button]
     button.is_pressed = is_pressed
+    if is_pressed:
+        button.pressed_timestamp = timestamp
+    change_input_frame_input(button, is_pressed)
+    if mouse_regions is not None:
+        change_mouse_regions_button(mouse_regions, button, is_pressed, mouse._position, timestamp)
     event_data: MouseButtonChanged = {
         "button": button,
         "is_pressed": is_pressed,
         "position": mouse.position,
+        "timestamp": timestamp,
     }
     MouseButton.changed(event_data)
     button.changed(event_data)
@@ -146,12 +424,16 @@ def change_mouse_button(mouse: Mouse, sdl_mouse_button: SdlMouseButton, is_press
         button.released(event_data)
 
 
-def scroll_mouse_wheel(mouse: Mouse, delta: IVector2) -> None:
-    scrolled_data: MouseScrolled = {"delta": delta}
+def scroll_mouse_wheel(
+    mouse: Mouse, delta: DVector2, timestamp: int, sample_count: int | None = None
+) -> None:
+    scrolled_data: MouseScrolled = {"delta": delta, "timestamp": timestamp}
+    if sample_count is not None:
+        scrolled_data["sample_count"] = sample_count
     Mouse.scrolled(scrolled_data)
     mouse.scrolled(scrolled_data)
     if delta.y:
-        y_data: MouseScrolledDirection = {"delta": delta.y}
+        y_data: MouseScrolledDirection = {"delta": delta.y, "timestamp": timestamp}
         Mouse.scrolled_vertically(y_data)
         mouse.scrolled_vertically(y_data)
         if delta.y > 0:
@@ -162,7 +444,7 @@ def scroll_mouse_wheel(mouse: Mouse, delta: IVector2) -> None:
             Mouse.scrolled_down(y_data)
             mouse.scrolled_down(y_data)
     if delta.x:
-        x_data: MouseScrolledDirection = {"delta": delta.x}
+        x_data: MouseScrolledDirection = {"delta": delta.x, "timestamp": timestamp}
         Mouse.scrolled_horizontally(x_data)
         mouse.scrolled_horizontally(x_data)
         if delta.x > 0:
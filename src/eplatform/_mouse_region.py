@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+__all__ = [
+    "MouseRegion",
+    "MouseRegionButtonChanged",
+    "MouseRegionGrid",
+    "MouseRegionHovered",
+    "change_mouse_regions_button",
+    "hover_mouse_regions",
+]
+
+from typing import TYPE_CHECKING
+from typing import Generator
+from typing import TypedDict
+
+from eevent import Event
+from egeometry import IRectangle
+from emath import DVector2
+
+if TYPE_CHECKING:
+    from ._mouse import MouseButton
+
+
+class MouseRegion:
+    _grid: MouseRegionGrid | None = None
+
+    entered: Event[MouseRegionHovered] = Event()
+    left: Event[MouseRegionHovered] = Event()
+    pressed: Event[MouseRegionButtonChanged] = Event()
+    released: Event[MouseRegionButtonChanged] = Event()
+
+    def __init__(self, rectangle: IRectangle):
+        self._rectangle = rectangle
+        self.is_hovered = False
+
+        self.entered = Event()
+        self.left = Event()
+        self.pressed = Event()
+        self.released = Event()
+
+    def __repr__(self) -> str:
+        return f"<MouseRegion {self._rectangle!r}>"
+
+    @property
+    def rectangle(self) -> IRectangle:
+        return self._rectangle
+
+    @rectangle.setter
+    def rectangle(self, value: IRectangle) -> None:
+        grid = self._grid
+        if grid is None:
+            self._rectangle = value
+            return
+        grid._remove_cells(self)
+        self._rectangle = value
+        grid._add_cells(self)
+        # the region may have moved under or away from a cursor that is itself still
+        position = grid._position
+        if position is not None:
+            hover_mouse_regions(grid, position, grid._timestamp)
+
+
+class MouseRegionGrid:
+    def __init__(self, cell_size: int = 64):
+        if cell_size < 1:
+            raise ValueError("cell size must be greater than 0")
+        self._cell_size = cell_size
+        self._cells: dict[tuple[int, int], dict[MouseRegion, None]] = {}
+        self._regions: dict[MouseRegion, None] = {}
+        self._hovered: dict[MouseRegion, None] = {}
+        self._position: DVector2 | None = None
+        self._timestamp = 0
+
+    def __len__(self) -> int:
+        return len(self._regions)
+
+    def __contains__(self, region: MouseRegion) -> bool:
+        return region in self._regions
+
+    @property
+    def cell_size(self) -> int:
+        return self._cell_size
+
+    def add(self, region: MouseRegion) -> None:
+        if region._grid is not None:
+            raise ValueError("region is already in a grid")
+        region._grid = self
+        self._regions[region] = None
+        self._add_cells(region)
+
+    def remove(self, region: MouseRegion) -> None:
+        if region._grid is not self:
+            raise ValueError("region is not in this grid")
+        self._remove_cells(region)
+        del self._regions[region]
+        region._grid = None
+        if region in self._hovered:
+            del self._hovered[region]
+            region.is_hovered = False
+            # the region stops being under the cursor as far as its listeners are concerned
+            position = self._position
+            assert position is not None
+            event_data: MouseRegionHovered = {
+                "region": region,
+                "position": position,
+                "timestamp": self._timestamp,
+            }
+            MouseRegion.left(event_data)
+            region.left(event_data)
+
+    def get_regions_at(self, position: DVector2) -> tuple[MouseRegion, ...]:
+        x, y = position
+        cell = self._cells.get((int(x // self._cell_size), int(y // self._cell_size)))
+        if cell is None:
+            return ()
+        return tuple(r for r in cell if _contains(r._rectangle, x, y))
+
+    def _iter_cells(self, rectangle: IRectangle) -> Generator[tuple[int, int], None, None]:
+        cell_size = self._cell_size
+        position = rectangle.position
+        extent = rectangle.extent
+        for y in range(position.y // cell_size, (extent.y - 1) // cell_size + 1):
+            for x in range(position.x // cell_size, (extent.x - 1) // cell_size + 1):
+                yield x, y
+
+    def _add_cells(self, region: MouseRegion) -> None:
+        for key in self._iter_cells(region._rectangle):
+            try:
+                cell = self._cells[key]
+            except KeyError:
+                cell = self._cells[key] = {}
+            cell[region] = None
+
+    def _remove_cells(self, region: MouseRegion) -> None:
+        for key in self._iter_cells(region._rectangle):
+            cell = self._cells[key]
+            del cell[region]
+            if not cell:
+                del self._cells[key]
+
+
+def _contains(rectangle: IRectangle, x: float, y: float) -> bool:
+    position = rectangle.position
+    extent = rectangle.extent
+    return position.x <= x < extent.x and position.y <= y < extent.y
+
+
+class MouseRegionHovered(TypedDict):
+    region: MouseRegion
+    position: DVector2
+    timestamp: int
+
+
+class MouseRegionButtonChanged(TypedDict):
+    region: MouseRegion
+    button: MouseButton
+    is_pressed: bool
+    position: DVector2
+    timestamp: int
+
+
+def hover_mouse_regions(grid: MouseRegionGrid, position: DVector2, timestamp: int) -> None:
+    grid._position = position
+    grid._timestamp = timestamp
+    hovered = grid._hovered
+    if not hovered and not grid._cells:
+        return
+    regions = dict.fromkeys(grid.get_regions_at(position))
+    if regions.keys() == hovered.keys():
+        return
+    grid._hovered = regions
+    for region in hovered:
+        if region not in regions:
+            region.is_hovered = False
+            left_data: MouseRegionHovered = {
+                "region": region,
+                "position": position,
+                "timestamp": timestamp,
+            }
+            MouseRegion.left(left_data)
+            region.left(left_data)
+    for region in regions:
+        if region not in hovered:
+            region.is_hovered = True
+            entered_data: MouseRegionHovered = {
+                "region": region,
+                "position": position,
+                "timestamp": timestamp,
+            }
+            MouseRegion.entered(entered_data)
+            region.entered(entered_data)
+
+
+def change_mouse_regions_button(
+    grid: MouseRegionGrid,
+    button: MouseButton,
+    is_pressed: bool,
+    position: DVector2,
+    timestamp: int,
+) -> None:
+    for region in tuple(grid._hovered):
+        event_data: MouseRegionButtonChanged = {
+            "region": region,
+            "button": button,
+            "is_pressed": is_pressed,
+            "position": position,
+            "timestamp": timestamp,
+        }
+        if is_pressed:
+            MouseRegion.pressed(event_data)
+            region.pressed(event_data)
+        else:
+            MouseRegion.released(event_data)
+            region.released(event_data)
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+__all__ = [
+    "Pen",
+    "PenAxis",
+    "PenAxisChanged",
+    "PenMoved",
+    "PenPressChanged",
+    "PenProximityChanged",
+    "change_pen_axis",
+    "change_pen_press",
+    "change_pen_proximity",
+    "move_pen",
+]
+
+from array import array
+from enum import StrEnum
+from typing import Final
+from typing import Mapping
+from typing import TypedDict
+
+from eevent import Event
+from emath import DVector2
+
+from . import _eplatform
+from ._type import SdlPenAxis
+from ._type import SdlPenId
+
+
+class PenAxis(StrEnum):
+    PRESSURE = "pressure"
+    X_TILT = "x_tilt"
+    Y_TILT = "y_tilt"
+    DISTANCE = "distance"
+    ROTATION = "rotation"
+    SLIDER = "slider"
+    TANGENTIAL_PRESSURE = "tangential_pressure"
+
+
+class Pen:
+    _pen_id = 0
+    _x = 0.0
+    _y = 0.0
+    _is_in_proximity = False
+    _is_down = False
+    _is_eraser = False
+
+    moved: Event[PenMoved] = Event()
+    pressed: Event[PenPressChanged] = Event()
+    released: Event[PenPressChanged] = Event()
+    axis_changed: Event[PenAxisChanged] = Event()
+    entered: Event[PenProximityChanged] = Event()
+    left: Event[PenProximityChanged] = Event()
+
+    def __init__(self) -> None:
+        self._axes = array("d", bytes(8 * _eplatform.SDL_PEN_AXIS_COUNT))
+
+        self.moved = Event()
+        self.pressed = Event()
+        self.released = Event()
+        self.axis_changed = Event()
+        self.entered = Event()
+        self.left = Event()
+
+    @property
+    def pen_id(self) -> int:
+        return self._pen_id
+
+    @property
+    def position(self) -> DVector2:
+        return DVector2(self._x, self._y)
+
+    @property
+    def is_in_proximity(self) -> bool:
+        return self._is_in_proximity
+
+    @property
+    def is_down(self) -> bool:
+        return self._is_down
+
+    @property
+    def is_eraser(self) -> bool:
+        return self._is_eraser
+
+    @property
+    def pressure(self) -> float:
+        return self._axes[_eplatform.SDL_PEN_AXIS_PRESSURE]
+
+    @property
+    def tilt(self) -> DVector2:
+        return DVector2(
+            self._axes[_eplatform.SDL_PEN_AXIS_XTILT], self._axes[_eplatform.SDL_PEN_AXIS_YTILT]
+        )
+
+    def get_axis(self, axis: PenAxis) -> float:
+        return self._axes[_PEN_AXIS_TO_SDL_PEN_AXIS[axis]]
+
+
+_PEN_AXIS_TO_SDL_PEN_AXIS: Final[Mapping[PenAxis, SdlPenAxis]] = {
+    PenAxis.PRESSURE: _eplatform.SDL_PEN_AXIS_PRESSURE,
+    PenAxis.X_TILT: _eplatform.SDL_PEN_AXIS_XTILT,
+    PenAxis.Y_TILT: _eplatform.SDL_PEN_AXIS_YTILT,
+    PenAxis.DISTANCE: _eplatform.SDL_PEN_AXIS_DISTANCE,
+    PenAxis.ROTATION: _eplatform.SDL_PEN_AXIS_ROTATION,
+    PenAxis.SLIDER: _eplatform.SDL_PEN_AXIS_SLIDER,
+    PenAxis.TANGENTIAL_PRESSURE: _eplatform.SDL_PEN_AXIS_TANGENTIAL_PRESSURE,
+}
+
+_SDL_PEN_AXIS_TO_PEN_AXIS: Final[Mapping[SdlPenAxis, PenAxis]] = {
+    v: k for k, v in _PEN_AXIS_TO_SDL_PEN_AXIS.items()
+}
+
+
+class PenProximityChanged(TypedDict):
+    is_in_proximity: bool
+    timestamp: int
+
+
+class PenMoved(TypedDict):
+    position: DVector2
+    timestamp: int
+
+
+class PenPressChanged(TypedDict):
+    is_down: bool
+    is_eraser: bool
+    position: DVector2
+    timestamp: int
+
+
+class PenAxisChanged(TypedDict):
+    axis: PenAxis
+    value: float
+    timestamp: int
+
+
+def change_pen_proximity(
+    pen: Pen, sdl_pen_id: SdlPenId, is_in_proximity: bool, timestamp: int
+) -> None:
+    pen._pen_id = sdl_pen_id
+    pen._is_in_proximity = is_in_proximity
+    event_data: PenProximityChanged = {"is_in_proximity": is_in_proximity, "timestamp": timestamp}
+    if is_in_proximity:
+        Pen.entered(event_data)
+        pen.entered(event_data)
+    else:
+        Pen.left(event_data)
+        pen.left(event_data)
+
+
+def move_pen(pen: Pen, sdl_pen_id: SdlPenId, x: float, y: float, timestamp: int) -> None:
+    pen._pen_id = sdl_pen_id
+    pen._x = x
+    pen._y = y
+    event_data: PenMoved = {"position": DVector2(x, y), "timestamp": timestamp}
+    Pen.moved(event_data)
+    pen.moved(event_data)
+
+
+def change_pen_press(
+    pen: Pen,
+    sdl_pen_id: SdlPenId,
+    x: float,
+    y: float,
+    is_down: bool,
+    is_eraser: bool,
+    timestamp: int,
+) -> None:
+    pen._pen_id = sdl_pen_id
+    pen._x = x
+    pen._y = y
+    pen._is_down = is_down
+    pen._is_eraser = is_eraser
+    event_data: PenPressChanged = {
+        "is_down": is_down,
+        "is_eraser": is_eraser,
+        "position": DVector2(x, y),
+        "timestamp": timestamp,
+    }
+    if is_down:
+        Pen.pressed(event_data)
+        pen.pressed(event_data)
+    else:
+        Pen.released(event_data)
+        pen.released(event_data)
+
+
+def change_pen_axis(
+    pen: Pen,
+    sdl_pen_id: SdlPenId,
+    x: float,
+    y: float,
+    sdl_pen_axis: SdlPenAxis,
+    value: float,
+    timestamp: int,
+) -> bool:
+    try:
+        axis = _SDL_PEN_AXIS_TO_PEN_AXIS[sdl_pen_axis]
+    except KeyError:
+        return False
+    pen._pen_id = sdl_pen_id
+    pen._x = x
+    pen._y = y
+    pen._axes[sdl_pen_axis] = value
+    event_data: PenAxisChanged = {"axis": axis, "value": value, "timestamp": timestamp}
+    Pen.axis_changed(event_data)
+    pen.axis_changed(event_data)
+    return True
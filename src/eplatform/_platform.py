@@ -1,27 +1,35 @@
 from __future__ import annotations
 
 __all__ = [
+    "InputKind",
     "Platform",
     "get_clipboard",
     "get_controllers",
+    "get_disabled_input",
     "get_displays",
     "get_keyboard",
     "get_mouse",
+    "get_pen",
+    "get_touch",
     "get_window",
     "set_clipboard",
+    "set_disabled_input",
 ]
 
 import logging
 from enum import IntFlag
+from enum import auto
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import Callable
 from typing import ClassVar
 from typing import Final
 from typing import Generator
+from typing import Mapping
 from typing import Self
 from typing import Sequence
 
+from . import _eplatform
 from ._controller import Controller
 from ._controller import discover_controllers
 from ._controller import forget_controllers
@@ -44,7 +52,11 @@ from ._eplatform import get_clipboard as _get_clipboard
 from ._eplatform import get_gl_attrs
 from ._eplatform import initialize_sdl
 from ._eplatform import set_clipboard as _set_clipboard
+from ._eplatform import set_sdl_event_enabled
 from ._keyboard import Keyboard
+from ._pen import Pen
+from ._touch import Touch
+from ._type import SdlEventType
 from ._type import VkDebugUtilsMessenger
 from ._type import VkInstance
 from ._type import VkSurface
@@ -72,6 +84,59 @@ _GL_VERSIONS: Final[tuple[tuple[int, int], ...]] = (
 )
 
 
+class InputKind(IntFlag):
+    MOUSE_MOTION = auto()
+    MOUSE_WHEEL = auto()
+    MOUSE_BUTTON = auto()
+    KEY = auto()
+    CONTROLLER_AXIS = auto()
+    CONTROLLER_BUTTON = auto()
+    CONTROLLER_HAT = auto()
+    TOUCH = auto()
+    PEN = auto()
+    NONE = 0
+
+
+_INPUT_KIND_SDL_EVENT_TYPES: Final[Mapping[InputKind, tuple[SdlEventType, ...]]] = {
+    InputKind.MOUSE_MOTION: (_eplatform.SDL_EVENT_MOUSE_MOTION,),
+    InputKind.MOUSE_WHEEL: (_eplatform.SDL_EVENT_MOUSE_WHEEL,),
+    InputKind.MOUSE_BUTTON: (
+        _eplatform.SDL_EVENT_MOUSE_BUTTON_DOWN,
+        _eplatform.SDL_EVENT_MOUSE_BUTTON_UP,
+    ),
+    InputKind.KEY: (_eplatform.SDL_EVENT_KEY_DOWN, _eplatform.SDL_EVENT_KEY_UP),
+    InputKind.CONTROLLER_AXIS: (_eplatform.SDL_EVENT_JOYSTICK_AXIS_MOTION,),
+    InputKind.CONTROLLER_BUTTON: (
+        _eplatform.SDL_EVENT_JOYSTICK_BUTTON_DOWN,
+        _eplatform.SDL_EVENT_JOYSTICK_BUTTON_UP,
+    ),
+    InputKind.CONTROLLER_HAT: (_eplatform.SDL_EVENT_JOYSTICK_HAT_MOTION,),
+    InputKind.TOUCH: (
+        _eplatform.SDL_EVENT_FINGER_DOWN,
+        _eplatform.SDL_EVENT_FINGER_UP,
+        _eplatform.SDL_EVENT_FINGER_MOTION,
+        _eplatform.SDL_EVENT_FINGER_CANCELED,
+    ),
+    InputKind.PEN: (
+        _eplatform.SDL_EVENT_PEN_PROXIMITY_IN,
+        _eplatform.SDL_EVENT_PEN_PROXIMITY_OUT,
+        _eplatform.SDL_EVENT_PEN_DOWN,
+        _eplatform.SDL_EVENT_PEN_UP,
+        _eplatform.SDL_EVENT_PEN_MOTION,
+        _eplatform.SDL_EVENT_PEN_AXIS,
+    ),
+}
+
+
+def _apply_disabled_input(disabled_input: InputKind) -> None:
+    # disabled events are dropped by SDL before they are queued, so they are never converted
+    # into python objects
+    for input_kind, sdl_event_types in _INPUT_KIND_SDL_EVENT_TYPES.items():
+        enabled = not (disabled_input & input_kind)
+        for sdl_event_type in sdl_event_types:
+            set_sdl_event_enabled(sdl_event_type, enabled)
+
+
 class VulkanMessageSeverity(IntFlag):
     VERBOSE = 0x00000001
     INFO = 0x00000010
@@ -109,6 +174,8 @@ class Platform:
     _window: Window | None = None
     _mouse: Mouse | None = None
     _keyboard: Keyboard | None = None
+    _touch: Touch | None = None
+    _pen: Pen | None = None
     _gl_context: Any = None
     _gl_version: tuple[int, int] | None = None
     _color_bits: tuple[int, int, int, int] | None = None
@@ -124,11 +191,14 @@ class Platform:
         window_cls: type[Window] | None = None,
         mouse_cls: type[Mouse] | None = None,
         keyboard_cls: type[Keyboard] | None = None,
+        touch_cls: type[Touch] | None = None,
+        pen_cls: type[Pen] | None = None,
         vulkan_layers: Sequence[str] = (),
         vulkan_extensions: Sequence[str] = (),
         vulkan_message_callback: Callable[[int, int, str], None] | None = None,
         open_gl_version_min: tuple[int, int] = _GL_VERSIONS[-1],
         open_gl_version_max: tuple[int, int] = _GL_VERSIONS[0],
+        disabled_input: InputKind = InputKind.NONE,
     ) -> None:
         if __debug__ and vulkan_message_callback is None:
             vulkan_message_callback = log_vulkan_message
@@ -138,6 +208,7 @@ class Platform:
         self._vulkan_message_callback = vulkan_message_callback
         self._gl_version_min = open_gl_version_min
         self._gl_version_max = open_gl_version_max
+        self._disabled_input = disabled_input
 
         if window_cls is None:
             self._window_cls = Window
@@ -156,10 +227,21 @@ class Platform:
         else:
             self._keyboard_cls = keyboard_cls
 
+        if touch_cls is None:
+            self._touch_cls = Touch
+        else:
+            self._touch_cls = touch_cls
+
+        if pen_cls is None:
+            self._pen_cls = Pen
+        else:
+            self._pen_cls = pen_cls
+
     def __enter__(self) -> None:
         if Platform._singleton:
             raise RuntimeError("platform already active")
         initialize_sdl()
+        _apply_disabled_input(self._disabled_input)
         if issubclass(self._window_cls, VulkanWindow):
             self._window = self._window_cls()
             self._setup_vulkan()
@@ -190,6 +272,8 @@ class Platform:
             self._window = self._window_cls()
         self._mouse = self._mouse_cls()
         self._keyboard = self._keyboard_cls()
+        self._touch = self._touch_cls()
+        self._pen = self._pen_cls()
         discover_displays()
         discover_controllers()
         clear_sdl_events()
@@ -202,6 +286,11 @@ class Platform:
         for callback in self._deactivate_callbacks:
             callback()
 
+        assert self._mouse is not None
+        self._mouse.disable_relative_mode()
+        self._mouse.reset_cursor()
+        assert self._keyboard is not None
+        self._keyboard.disable_key_repeat()
         self._teardown_open_gl()
         self._teardown_vulkan()
         forget_controllers()
@@ -289,6 +378,22 @@ def get_keyboard() -> Keyboard:
     return keyboard
 
 
+def get_touch() -> Touch:
+    if Platform._singleton is None:
+        raise RuntimeError("platform is not active")
+    touch = Platform._singleton._touch
+    assert touch is not None
+    return touch
+
+
+def get_pen() -> Pen:
+    if Platform._singleton is None:
+        raise RuntimeError("platform is not active")
+    pen = Platform._singleton._pen
+    assert pen is not None
+    return pen
+
+
 def get_gl_color_bits() -> tuple[int, int, int, int]:
     assert Platform._singleton is not None
     color_bits = Platform._singleton._color_bits
@@ -343,6 +448,19 @@ def set_clipboard(text: str) -> None:
     _set_clipboard(text)
 
 
+def get_disabled_input() -> InputKind:
+    if Platform._singleton is None:
+        raise RuntimeError("platform is not active")
+    return Platform._singleton._disabled_input
+
+
+def set_disabled_input(disabled_input: InputKind) -> None:
+    if Platform._singleton is None:
+        raise RuntimeError("platform is not active")
+    Platform._singleton._disabled_input = disabled_input
+    _apply_disabled_input(disabled_input)
+
+
 def get_displays() -> Generator[Display, None, None]:
     if Platform._singleton is None:
         raise RuntimeError("platform is not active")
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+__all__ = [
+    "Touch",
+    "TouchFingerChanged",
+    "move_touch_finger",
+    "press_touch_finger",
+    "release_touch_finger",
+]
+
+from array import array
+from typing import Final
+from typing import TypedDict
+
+from eevent import Event
+from emath import DVector2
+
+from ._type import SdlFingerId
+from ._type import SdlTouchId
+
+_INITIAL_FINGER_CAPACITY: Final = 10
+
+
+class Touch:
+    finger_pressed: Event[TouchFingerChanged] = Event()
+    finger_moved: Event[TouchFingerChanged] = Event()
+    finger_released: Event[TouchFingerChanged] = Event()
+
+    def __init__(self) -> None:
+        # active fingers are packed at the front of the table, a finger's slot is only written
+        # in place while it is down, finger ids are only unique per touch device
+        self._finger_slots: dict[tuple[SdlTouchId, SdlFingerId], int] = {}
+        self._finger_touch_ids = array("Q", bytes(8 * _INITIAL_FINGER_CAPACITY))
+        self._finger_ids = array("Q", bytes(8 * _INITIAL_FINGER_CAPACITY))
+        self._finger_positions = array("d", bytes(16 * _INITIAL_FINGER_CAPACITY))
+        self._finger_pressures = array("d", bytes(8 * _INITIAL_FINGER_CAPACITY))
+
+        self.finger_pressed = Event()
+        self.finger_moved = Event()
+        self.finger_released = Event()
+
+    @property
+    def finger_count(self) -> int:
+        return len(self._finger_slots)
+
+    @property
+    def fingers(self) -> tuple[tuple[int, int], ...]:
+        count = len(self._finger_slots)
+        return tuple(zip(self._finger_touch_ids[:count], self._finger_ids[:count]))
+
+    def is_finger_down(self, touch_id: int, finger_id: int) -> bool:
+        return (touch_id, finger_id) in self._finger_slots
+
+    def get_finger_position(self, touch_id: int, finger_id: int) -> DVector2:
+        slot = self._finger_slots[SdlTouchId(touch_id), SdlFingerId(finger_id)] * 2
+        return DVector2(self._finger_positions[slot], self._finger_positions[slot + 1])
+
+    def get_finger_pressure(self, touch_id: int, finger_id: int) -> float:
+        return self._finger_pressures[
+            self._finger_slots[SdlTouchId(touch_id), SdlFingerId(finger_id)]
+        ]
+
+    def _grow(self) -> None:
+        capacity = len(self._finger_ids)
+        self._finger_touch_ids.frombytes(bytes(8 * capacity))
+        self._finger_ids.frombytes(bytes(8 * capacity))
+        self._finger_positions.frombytes(bytes(16 * capacity))
+        self._finger_pressures.frombytes(bytes(8 * capacity))
+
+
+class TouchFingerChanged(TypedDict):
+    touch_id: int
+    finger_id: int
+    position: DVector2
+    delta: DVector2
+    pressure: float
+    timestamp: int
+
+
+def press_touch_finger(
+    touch: Touch,
+    sdl_touch_id: SdlTouchId,
+    sdl_finger_id: SdlFingerId,
+    x: float,
+    y: float,
+    pressure: float,
+    timestamp: int,
+) -> None:
+    key = (sdl_touch_id, sdl_finger_id)
+    slot = touch._finger_slots.get(key)
+    if slot is None:
+        slot = len(touch._finger_slots)
+        if slot == len(touch._finger_ids):
+            touch._grow()
+        touch._finger_slots[key] = slot
+    touch._finger_touch_ids[slot] = sdl_touch_id
+    touch._finger_ids[slot] = sdl_finger_id
+    touch._finger_positions[slot * 2] = x
+    touch._finger_positions[slot * 2 + 1] = y
+    touch._finger_pressures[slot] = pressure
+    event_data: TouchFingerChanged = {
+        "touch_id": sdl_touch_id,
+        "finger_id": sdl_finger_id,
+        "position": DVector2(x, y),
+        "delta": DVector2(0),
+        "pressure": pressure,
+        "timestamp": timestamp,
+    }
+    Touch.finger_pressed(event_data)
+    touch.finger_pressed(event_data)
+
+
+def move_touch_finger(
+    touch: Touch,
+    sdl_touch_id: SdlTouchId,
+    sdl_finger_id: SdlFingerId,
+    x: float,
+    y: float,
+    dx: float,
+    dy: float,
+    pressure: float,
+    timestamp: int,
+) -> None:
+    slot = touch._finger_slots.get((sdl_touch_id, sdl_finger_id))
+    if slot is None:
+        return
+    touch._finger_positions[slot * 2] = x
+    touch._finger_positions[slot * 2 + 1] = y
+    touch._finger_pressures[slot] = pressure
+    event_data: TouchFingerChanged = {
+        "touch_id": sdl_touch_id,
+        "finger_id": sdl_finger_id,
+        "position": DVector2(x, y),
+        "delta": DVector2(dx, dy),
+        "pressure": pressure,
+        "timestamp": timestamp,
+    }
+    Touch.finger_moved(event_data)
+    touch.finger_moved(event_data)
+
+
+def release_touch_finger(
+    touch: Touch,
+    sdl_touch_id: SdlTouchId,
+    sdl_finger_id: SdlFingerId,
+    x: float,
+    y: float,
+    pressure: float,
+    timestamp: int,
+) -> None:
+    slot = touch._finger_slots.pop((sdl_touch_id, sdl_finger_id), None)
+    if slot is None:
+        return
+    # keep the table packed by moving the last finger into the released slot
+    last = len(touch._finger_slots)
+    if slot != last:
+        last_touch_id = SdlTouchId(touch._finger_touch_ids[last])
+        last_finger_id = SdlFingerId(touch._finger_ids[last])
+        touch._finger_slots[last_touch_id, last_finger_id] = slot
+        touch._finger_touch_ids[slot] = last_touch_id
+        touch._finger_ids[slot] = last_finger_id
+        touch._finger_positions[slot * 2] = touch._finger_positions[last * 2]
+        touch._finger_positions[slot * 2 + 1] = touch._finger_positions[last * 2 + 1]
+        touch._finger_pressures[slot] = touch._finger_pressures[last]
+    event_data: TouchFingerChanged = {
+        "touch_id": sdl_touch_id,
+        "finger_id": sdl_finger_id,
+        "position": DVector2(x, y),
+        "delta": DVector2(0),
+        "pressure": pressure,
+        "timestamp": timestamp,
+    }
+    Touch.finger_released(event_data)
+    touch.finger_released(event_data)
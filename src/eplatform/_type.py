@@ -1,7 +1,10 @@
 __all__ = [
+    "SdlCursor",
     "SdlDisplayId",
     "SdlDisplayOrientation",
     "SdlEventType",
+    "SdlEventWakeup",
+    "SdlFingerId",
     "SdlGamepadAxis",
     "SdlGamepadBindingType",
     "SdlGamepadButton",
@@ -10,8 +13,14 @@ __all__ = [
     "SdlGlContext",
     "SdlHat",
     "SdlJoystickId",
+    "SdlKeycode",
+    "SdlKeymod",
     "SdlMouseButton",
+    "SdlPenAxis",
+    "SdlPenId",
     "SdlScancode",
+    "SdlSystemCursor",
+    "SdlTouchId",
     "SdlWindow",
     "VkDebugUtilsMessenger",
     "VkInstance",
@@ -22,9 +31,18 @@ from typing import NewType
 
 SdlGlContext = NewType("SdlGlContext", object)
 SdlWindow = NewType("SdlWindow", object)
+SdlEventWakeup = NewType("SdlEventWakeup", object)
 SdlEventType = NewType("SdlEventType", int)
 SdlMouseButton = NewType("SdlMouseButton", int)
+SdlCursor = NewType("SdlCursor", object)
+SdlSystemCursor = NewType("SdlSystemCursor", int)
+SdlTouchId = NewType("SdlTouchId", int)
+SdlFingerId = NewType("SdlFingerId", int)
+SdlPenId = NewType("SdlPenId", int)
+SdlPenAxis = NewType("SdlPenAxis", int)
 SdlScancode = NewType("SdlScancode", int)
+SdlKeycode = NewType("SdlKeycode", int)
+SdlKeymod = NewType("SdlKeymod", int)
 SdlDisplayId = NewType("SdlDisplayId", int)
 SdlDisplayOrientation = NewType("SdlDisplayOrientation", int)
 SdlJoystickId = NewType("SdlJoystickId", int)
@@ -8,11 +8,13 @@ __all__ = [
     "WindowDestroyedError",
     "WindowMoved",
     "WindowResized",
+    "WindowTextEdited",
     "WindowTextInputted",
     "WindowVisibilityChanged",
     "blur_window",
     "close_window",
     "delete_window",
+    "edit_window_text",
     "focus_window",
     "get_sdl_window",
     "hide_window",
@@ -58,6 +60,7 @@ from ._eplatform import set_sdl_window_size
 from ._eplatform import set_sdl_window_title
 from ._eplatform import show_sdl_window
 from ._eplatform import swap_sdl_window
+from ._mouse_region import MouseRegionGrid
 from ._type import SdlWindow
 from ._type import VkInstance
 from ._type import VkSurface
@@ -72,19 +75,30 @@ class WindowBufferSynchronization(Enum):
 
 class WindowTextInputted(TypedDict):
     text: str
+    timestamp: int
+
+
+class WindowTextEdited(TypedDict):
+    text: str
+    cursor_position: int | None
+    selection_length: int | None
+    timestamp: int
 
 
 class WindowResized(TypedDict):
     size: IVector2
     is_maximized: bool
+    timestamp: int
 
 
 class WindowMoved(TypedDict):
     position: IVector2
+    timestamp: int
 
 
 class WindowVisibilityChanged(TypedDict):
     is_visible: bool
+    timestamp: int
 
 
 class WindowDestroyedError(RuntimeError):
@@ -97,6 +111,7 @@ class Window:
     moved: Event[WindowMoved] = Event()
     closed: Event[None] = Event()
     text_inputted: Event[WindowTextInputted] = Event()
+    text_edited: Event[WindowTextEdited] = Event()
     resized: Event[WindowResized] = Event()
     visibility_changed: Event[WindowVisibilityChanged] = Event()
     shown: Event[WindowVisibilityChanged] = Event()
@@ -122,6 +137,7 @@ class Window:
 
         self.closed = Event()
         self.text_inputted = Event()
+        self.text_edited = Event()
 
         self._size = IVector2(200, 200)
         self.resized = Event()
@@ -141,6 +157,8 @@ class Window:
         self._is_fullscreen = False
         self._is_maximized = False
 
+        self._mouse_regions = MouseRegionGrid()
+
     def __del__(self) -> None:
         delete_window(self)
 
@@ -209,6 +227,10 @@ class Window:
     def position(self) -> IVector2:
         return self._position
 
+    @property
+    def mouse_regions(self) -> MouseRegionGrid:
+        return self._mouse_regions
+
     @property
     def size(self) -> IVector2:
         return self._size
@@ -389,40 +411,58 @@ def close_window(window: Window) -> None:
     window.closed(None)
 
 
-def input_window_text(window: Window, text: str) -> None:
-    data: WindowTextInputted = {"text": text}
+def input_window_text(window: Window, text: str, timestamp: int) -> None:
+    data: WindowTextInputted = {"text": text, "timestamp": timestamp}
     Window.text_inputted(data)
     window.text_inputted(data)
 
 
-def show_window(window: Window) -> None:
+def edit_window_text(
+    window: Window, text: str, cursor_position: int, selection_length: int, timestamp: int
+) -> None:
+    # sdl uses -1 when the input method doesn't report a cursor or selection
+    data: WindowTextEdited = {
+        "text": text,
+        "cursor_position": None if cursor_position < 0 else cursor_position,
+        "selection_length": None if selection_length < 0 else selection_length,
+        "timestamp": timestamp,
+    }
+    Window.text_edited(data)
+    window.text_edited(data)
+
+
+def show_window(window: Window, timestamp: int) -> None:
     window._is_visible = True
-    event_data: WindowVisibilityChanged = {"is_visible": True}
+    event_data: WindowVisibilityChanged = {"is_visible": True, "timestamp": timestamp}
     Window.visibility_changed(event_data)
     window.visibility_changed(event_data)
     Window.shown(event_data)
     window.shown(event_data)
 
 
-def hide_window(window: Window) -> None:
+def hide_window(window: Window, timestamp: int) -> None:
     window._is_visible = False
-    event_data: WindowVisibilityChanged = {"is_visible": False}
+    event_data: WindowVisibilityChanged = {"is_visible": False, "timestamp": timestamp}
     Window.visibility_changed(event_data)
     window.visibility_changed(event_data)
     Window.hidden(event_data)
     window.hidden(event_data)
 
 
-def resize_window(window: Window, size: IVector2) -> None:
+def resize_window(window: Window, size: IVector2, timestamp: int) -> None:
     window._size = size
-    event_data: WindowResized = {"size": size, "is_maximized": window.is_maximized}
+    event_data: WindowResized = {
+        "size": size,
+        "is_maximized": window.is_maximized,
+        "timestamp": timestamp,
+    }
     Window.resized(event_data)
     window.resized(event_data)
 
 
-def move_window(window: Window, position: IVector2) -> None:
+def move_window(window: Window, position: IVector2, timestamp: int) -> None:
     window._position = position
-    event_data: WindowMoved = {"position": position}
+    event_data: WindowMoved = {"position": position, "timestamp": timestamp}
     Window.moved(event_data)
     window.moved(event_data)
 
@@ -439,15 +479,19 @@ def blur_window(window: Window) -> None:
     window.blurred(None)
 
 
-def maximize_window(window: Window) -> None:
+def maximize_window(window: Window, timestamp: int) -> None:
     window._is_maximized = True
-    event_data: WindowResized = {"size": window.size, "is_maximized": True}
+    event_data: WindowResized = {"size": window.size, "is_maximized": True, "timestamp": timestamp}
     Window.resized(event_data)
     window.resized(event_data)
 
 
-def unmaximize_window(window: Window) -> None:
+def unmaximize_window(window: Window, timestamp: int) -> None:
     window._is_maximized = False
-    event_data: WindowResized = {"size": window.size, "is_maximized": False}
+    event_data: WindowResized = {
+        "size": window.size,
+        "is_maximized": False,
+        "timestamp": timestamp,
+    }
     Window.resized(event_data)
     window.resized(event_data)
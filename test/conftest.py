@@ -13,6 +13,8 @@ from eplatform import Platform
 from eplatform import VulkanWindow
 from eplatform import get_keyboard
 from eplatform import get_mouse
+from eplatform import get_pen
+from eplatform import get_touch
 from eplatform import get_window
 
 
@@ -75,6 +77,16 @@ def keyboard(platform):
     return get_keyboard()
 
 
+@pytest.fixture
+def touch(platform):
+    return get_touch()
+
+
+@pytest.fixture
+def pen(platform):
+    return get_pen()
+
+
 @pytest.fixture
 def capture_event():
     def _(f, e):
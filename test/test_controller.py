@@ -1,4 +1,8 @@
+from array import array
 from math import isclose
+from unittest.mock import ANY
+from unittest.mock import MagicMock
+from unittest.mock import patch
 
 import pytest
 
@@ -14,11 +18,18 @@ from eplatform import ControllerStickName
 from eplatform import ControllerTrigger
 from eplatform import ControllerTriggerName
 from eplatform import ControllerType
+from eplatform import InputFrame
 from eplatform import Platform
+from eplatform import _eplatform
 from eplatform import get_controllers
+from eplatform._controller import controller_change_axis
+from eplatform._controller import controller_change_button
 from eplatform._eplatform import add_sdl_gamepad_mapping
+from eplatform._eplatform import check_controller_mapping_plan
 from eplatform._eplatform import connect_virtual_joystick
 from eplatform._eplatform import disconnect_virtual_joystick
+from eplatform._eplatform import map_controller_button
+from eplatform._eplatform import map_controller_input
 from eplatform._eplatform import set_virtual_joystick_axis_position
 from eplatform._eplatform import set_virtual_joystick_button_press
 from eplatform._eplatform import set_virtual_joystick_hat_value
@@ -159,14 +170,14 @@ def test_connect_disconnect(
         event = capture_event(
             vc.disconnect, getattr(event_object or controller1, disconnected_event_name)
         )
-        assert event == {"controller": controller1, "is_connected": False}
+        assert event == {"controller": controller1, "is_connected": False, "timestamp": ANY}
         assert not controller1.is_connected
         assert not set(get_controllers())
 
         event = capture_event(vc.connect, getattr(Controller, connected_event_name))
         controller2 = vc.get_controller()
         assert controller1 is not controller2
-        assert event == {"controller": controller2, "is_connected": True}
+        assert event == {"controller": controller2, "is_connected": True, "timestamp": ANY}
         assert not controller1.is_connected
         assert controller2.is_connected
         assert set(get_controllers()) == {controller2}
@@ -223,7 +234,7 @@ def test_analog_value(capture_event, event_object):
 
         event = capture_event(_, getattr(event_object or analog0, "changed"))
 
-        assert event == {"analog_input": analog0, "value": analog0.value}
+        assert event == {"analog_input": analog0, "value": analog0.value, "timestamp": ANY}
         assert isclose(analog0.value, -1)
         assert isclose(analog1.value, 0, abs_tol=1e-04)
 
@@ -233,7 +244,7 @@ def test_analog_value(capture_event, event_object):
             assert isclose(analog1.value, 0, abs_tol=1e-04)
 
         event = capture_event(_, getattr(event_object or analog1, "changed"))
-        assert event == {"analog_input": analog1, "value": analog1.value}
+        assert event == {"analog_input": analog1, "value": analog1.value, "timestamp": ANY}
         assert isclose(analog0.value, -1)
         assert isclose(analog1.value, 1)
 
@@ -243,11 +254,24 @@ def test_analog_value(capture_event, event_object):
             assert isclose(analog1.value, 1)
 
         event = capture_event(_, getattr(event_object or analog1, "changed"))
-        assert event == {"analog_input": analog1, "value": analog1.value}
+        assert event == {"analog_input": analog1, "value": analog1.value, "timestamp": ANY}
         assert isclose(analog0.value, -1)
         assert isclose(analog1.value, 0.5, abs_tol=1e-04)
 
 
+def test_analog_value_sample_count():
+    vc = VirtualController(axis_count=1)
+    with Platform():
+        controller = vc.get_controller()
+        analog0 = controller.get_analog_input("analog 0")
+        with patch.object(analog0, "changed", new=MagicMock()) as changed:
+            assert controller_change_axis(vc.sdl_joystick, 0, 0.5, 5, 3)
+        changed.assert_called_once_with(
+            {"analog_input": analog0, "value": 0.5, "timestamp": 5, "sample_count": 3}
+        )
+        assert analog0.value == 0.5
+
+
 @pytest.mark.parametrize("event_object", [ControllerBinaryInput, None])
 def test_binary_value(capture_event, event_object):
     vc = VirtualController(button_count=2)
@@ -265,7 +289,7 @@ def test_binary_value(capture_event, event_object):
 
         event = capture_event(_, getattr(event_object or binary0, "changed"))
 
-        assert event == {"binary_input": binary0, "value": True}
+        assert event == {"binary_input": binary0, "value": True, "timestamp": ANY}
         assert binary0.value
         assert not binary1.value
 
@@ -276,7 +300,7 @@ def test_binary_value(capture_event, event_object):
 
         event = capture_event(_, getattr(event_object or binary1, "changed"))
 
-        assert event == {"binary_input": binary1, "value": True}
+        assert event == {"binary_input": binary1, "value": True, "timestamp": ANY}
         assert binary0.value
         assert binary1.value
 
@@ -287,7 +311,7 @@ def test_binary_value(capture_event, event_object):
 
         event = capture_event(_, getattr(event_object or binary1, "changed"))
 
-        assert event == {"binary_input": binary1, "value": False}
+        assert event == {"binary_input": binary1, "value": False, "timestamp": ANY}
         assert binary0.value
         assert not binary1.value
 
@@ -311,7 +335,11 @@ def test_directional_value(capture_event, event_object):
 
         event = capture_event(_, getattr(event_object or directional0, "changed"))
 
-        assert event == {"directional_input": directional0, "value": directional0.value}
+        assert event == {
+            "directional_input": directional0,
+            "value": directional0.value,
+            "timestamp": ANY,
+        }
         assert directional0.value == ControllerDirectionalInputValue.LEFT
         assert directional1.value == ControllerDirectionalInputValue.NEUTRAL
 
@@ -324,7 +352,11 @@ def test_directional_value(capture_event, event_object):
 
         event = capture_event(_, getattr(event_object or directional1, "changed"))
 
-        assert event == {"directional_input": directional1, "value": directional1.value}
+        assert event == {
+            "directional_input": directional1,
+            "value": directional1.value,
+            "timestamp": ANY,
+        }
         assert directional0.value == ControllerDirectionalInputValue.LEFT
         assert directional1.value == ControllerDirectionalInputValue.UP_RIGHT
 
@@ -335,11 +367,34 @@ def test_directional_value(capture_event, event_object):
 
         event = capture_event(_, getattr(event_object or directional1, "changed"))
 
-        assert event == {"directional_input": directional1, "value": directional1.value}
+        assert event == {
+            "directional_input": directional1,
+            "value": directional1.value,
+            "timestamp": ANY,
+        }
         assert directional0.value == ControllerDirectionalInputValue.LEFT
         assert directional1.value == ControllerDirectionalInputValue.ALL
 
 
+@pytest.mark.parametrize("disconnect", [False, True])
+def test_button_input_frame(disconnect):
+    vc = VirtualController(button_count=1, gamepad_map={"a": "b0"})
+    with Platform():
+        controller = vc.get_controller()
+        button = controller.get_button(GAMEPAD_MAP_TO_BUTTON_NAME["a"])
+        frame = InputFrame()
+        assert controller_change_button(vc.sdl_joystick, 0, True, 0)
+        frame.advance()
+        assert frame.went_down(button)
+        if disconnect:
+            vc.disconnect()
+        else:
+            assert controller_change_button(vc.sdl_joystick, 0, False, 0)
+        frame.advance()
+        assert frame.went_up(button)
+        assert not frame.is_down(button)
+
+
 @pytest.mark.parametrize("event_object", [ControllerButton, None])
 @pytest.mark.parametrize("mapped_binary_index", [0, 1])
 @pytest.mark.parametrize("mapped_button, button_name", GAMEPAD_MAP_TO_BUTTON_NAME.items())
@@ -358,7 +413,7 @@ def test_button_binary_mapped(
 
         event = capture_event(_, getattr(event_object or button, event_name or "pressed"))
 
-        assert event == {"button": button, "is_pressed": True}
+        assert event == {"button": button, "is_pressed": True, "timestamp": ANY}
         assert button.is_pressed
 
         def _():
@@ -367,7 +422,7 @@ def test_button_binary_mapped(
 
         event = capture_event(_, getattr(event_object or button, event_name or "released"))
 
-        assert event == {"button": button, "is_pressed": False}
+        assert event == {"button": button, "is_pressed": False, "timestamp": ANY}
         assert not button.is_pressed
 
 
@@ -409,7 +464,7 @@ def test_button_directional_mapped(
 
         event = capture_event(_, getattr(event_object or button, event_name or "pressed"))
 
-        assert event == {"button": button, "is_pressed": True}
+        assert event == {"button": button, "is_pressed": True, "timestamp": ANY}
         assert button.is_pressed
 
         def _():
@@ -420,7 +475,7 @@ def test_button_directional_mapped(
 
         event = capture_event(_, getattr(event_object or button, event_name or "released"))
 
-        assert event == {"button": button, "is_pressed": False}
+        assert event == {"button": button, "is_pressed": False, "timestamp": ANY}
         assert not button.is_pressed
 
         def _():
@@ -431,7 +486,7 @@ def test_button_directional_mapped(
 
         event = capture_event(_, getattr(event_object or button, event_name or "pressed"))
 
-        assert event == {"button": button, "is_pressed": True}
+        assert event == {"button": button, "is_pressed": True, "timestamp": ANY}
         assert button.is_pressed
 
 
@@ -466,7 +521,7 @@ def test_button_analog_mapped(
 
             event = capture_event(_, getattr(event_object or button, event_name or "pressed"))
 
-            assert event == {"button": button, "is_pressed": True}
+            assert event == {"button": button, "is_pressed": True, "timestamp": ANY}
             assert button.is_pressed
 
             def _():
@@ -477,7 +532,7 @@ def test_button_analog_mapped(
 
             event = capture_event(_, getattr(event_object or button, event_name or "released"))
 
-            assert event == {"button": button, "is_pressed": False}
+            assert event == {"button": button, "is_pressed": False, "timestamp": ANY}
             assert not button.is_pressed
 
 
@@ -517,7 +572,7 @@ def test_stick_analog_mapped(
 
         event = capture_event(_, getattr(event_object or stick, "changed"))
 
-        assert event == {"stick": stick, "vector": stick.vector}
+        assert event == {"stick": stick, "vector": stick.vector, "timestamp": ANY}
         assert isclose(stick.vector.x, 1.0, abs_tol=1e-04)
         assert isclose(stick.vector.y, 0, abs_tol=1e-04)
 
@@ -529,7 +584,7 @@ def test_stick_analog_mapped(
             assert isclose(stick.vector.y, 0, abs_tol=1e-04)
 
         event = capture_event(_, getattr(event_object or stick, "changed"))
-        assert event == {"stick": stick, "vector": stick.vector}
+        assert event == {"stick": stick, "vector": stick.vector, "timestamp": ANY}
         assert isclose(stick.vector.x, 1.0, abs_tol=1e-04)
         assert isclose(stick.vector.y, -1.0, abs_tol=1e-04)
 
@@ -541,7 +596,7 @@ def test_stick_analog_mapped(
             assert isclose(stick.vector.y, -1.0, abs_tol=1e-04)
 
         event = capture_event(_, getattr(event_object or stick, "changed"))
-        assert event == {"stick": stick, "vector": stick.vector}
+        assert event == {"stick": stick, "vector": stick.vector, "timestamp": ANY}
         assert isclose(stick.vector.x, 1.0, abs_tol=1e-04)
         assert isclose(stick.vector.y, 0.5, abs_tol=1e-04)
 
@@ -597,7 +652,7 @@ def test_stick_directional_mapped(
 
         event = capture_event(_, getattr(event_object or stick, "changed"))
 
-        assert event == {"stick": stick, "vector": stick.vector}
+        assert event == {"stick": stick, "vector": stick.vector, "timestamp": ANY}
         assert isclose(stick.vector.x, input_max, abs_tol=1e-04)
         assert isclose(stick.vector.y, input_min, abs_tol=1e-04)
 
@@ -609,7 +664,7 @@ def test_stick_directional_mapped(
             assert isclose(stick.vector.y, input_min, abs_tol=1e-04)
 
         event = capture_event(_, getattr(event_object or stick, "changed"))
-        assert event == {"stick": stick, "vector": stick.vector}
+        assert event == {"stick": stick, "vector": stick.vector, "timestamp": ANY}
         assert isclose(stick.vector.x, input_min, abs_tol=1e-04)
         assert isclose(stick.vector.y, input_max, abs_tol=1e-04)
 
@@ -621,7 +676,7 @@ def test_stick_directional_mapped(
             assert isclose(stick.vector.y, input_max, abs_tol=1e-04)
 
         event = capture_event(_, getattr(event_object or stick, "changed"))
-        assert event == {"stick": stick, "vector": stick.vector}
+        assert event == {"stick": stick, "vector": stick.vector, "timestamp": ANY}
         assert isclose(stick.vector.x, input_max, abs_tol=1e-04)
         assert isclose(stick.vector.y, input_max, abs_tol=1e-04)
 
@@ -633,7 +688,7 @@ def test_stick_directional_mapped(
             assert isclose(stick.vector.y, input_max, abs_tol=1e-04)
 
         event = capture_event(_, getattr(event_object or stick, "changed"))
-        assert event == {"stick": stick, "vector": stick.vector}
+        assert event == {"stick": stick, "vector": stick.vector, "timestamp": ANY}
         assert isclose(stick.vector.x, input_min, abs_tol=1e-04)
         assert isclose(stick.vector.y, input_min, abs_tol=1e-04)
 
@@ -675,7 +730,7 @@ def test_stick_binary_mapped(
 
         event = capture_event(_, getattr(event_object or stick, "changed"))
 
-        assert event == {"stick": stick, "vector": stick.vector}
+        assert event == {"stick": stick, "vector": stick.vector, "timestamp": ANY}
         assert isclose(stick.vector.x, input_max, abs_tol=1e-04)
         assert isclose(stick.vector.y, input_min, abs_tol=1e-04)
 
@@ -686,7 +741,7 @@ def test_stick_binary_mapped(
 
         event = capture_event(_, getattr(event_object or stick, "changed"))
 
-        assert event == {"stick": stick, "vector": stick.vector}
+        assert event == {"stick": stick, "vector": stick.vector, "timestamp": ANY}
         assert isclose(stick.vector.x, input_max, abs_tol=1e-04)
         assert isclose(stick.vector.y, input_max, abs_tol=1e-04)
 
@@ -697,7 +752,7 @@ def test_stick_binary_mapped(
 
         event = capture_event(_, getattr(event_object or stick, "changed"))
 
-        assert event == {"stick": stick, "vector": stick.vector}
+        assert event == {"stick": stick, "vector": stick.vector, "timestamp": ANY}
         assert isclose(stick.vector.x, input_min, abs_tol=1e-04)
         assert isclose(stick.vector.y, input_max, abs_tol=1e-04)
 
@@ -708,7 +763,7 @@ def test_stick_binary_mapped(
 
         event = capture_event(_, getattr(event_object or stick, "changed"))
 
-        assert event == {"stick": stick, "vector": stick.vector}
+        assert event == {"stick": stick, "vector": stick.vector, "timestamp": ANY}
         assert isclose(stick.vector.x, input_min, abs_tol=1e-04)
         assert isclose(stick.vector.y, input_min, abs_tol=1e-04)
 
@@ -739,7 +794,7 @@ def test_trigger_analog_mapped(
 
         event = capture_event(_, getattr(event_object or trigger, "changed"))
 
-        assert event == {"trigger": trigger, "position": trigger.position}
+        assert event == {"trigger": trigger, "position": trigger.position, "timestamp": ANY}
         assert isclose(trigger.position, 1, abs_tol=1e-04)
 
         def _():
@@ -748,7 +803,7 @@ def test_trigger_analog_mapped(
 
         event = capture_event(_, getattr(event_object or trigger, "changed"))
 
-        assert event == {"trigger": trigger, "position": trigger.position}
+        assert event == {"trigger": trigger, "position": trigger.position, "timestamp": ANY}
         assert isclose(trigger.position, 0, abs_tol=1e-04)
 
         def _():
@@ -757,7 +812,7 @@ def test_trigger_analog_mapped(
 
         event = capture_event(_, getattr(event_object or trigger, "changed"))
 
-        assert event == {"trigger": trigger, "position": trigger.position}
+        assert event == {"trigger": trigger, "position": trigger.position, "timestamp": ANY}
         assert isclose(trigger.position, 0.5, abs_tol=1e-04)
 
 
@@ -798,7 +853,7 @@ def test_trigger_directional_mapped(
 
         event = capture_event(_, getattr(event_object or trigger, "changed"))
 
-        assert event == {"trigger": trigger, "position": trigger.position}
+        assert event == {"trigger": trigger, "position": trigger.position, "timestamp": ANY}
         assert isclose(trigger.position, 1, abs_tol=1e-04)
 
         def _():
@@ -809,7 +864,7 @@ def test_trigger_directional_mapped(
 
         event = capture_event(_, getattr(event_object or trigger, "changed"))
 
-        assert event == {"trigger": trigger, "position": trigger.position}
+        assert event == {"trigger": trigger, "position": trigger.position, "timestamp": ANY}
         assert isclose(trigger.position, 0, abs_tol=1e-04)
 
         def _():
@@ -820,7 +875,7 @@ def test_trigger_directional_mapped(
 
         event = capture_event(_, getattr(event_object or trigger, "changed"))
 
-        assert event == {"trigger": trigger, "position": trigger.position}
+        assert event == {"trigger": trigger, "position": trigger.position, "timestamp": ANY}
         assert isclose(trigger.position, 1, abs_tol=1e-04)
 
 
@@ -843,7 +898,7 @@ def test_trigger_binary_mapped(
 
         event = capture_event(_, getattr(event_object or trigger, "changed"))
 
-        assert event == {"trigger": trigger, "position": trigger.position}
+        assert event == {"trigger": trigger, "position": trigger.position, "timestamp": ANY}
         assert isclose(trigger.position, 1, abs_tol=1e-04)
 
         def _():
@@ -852,5 +907,91 @@ def test_trigger_binary_mapped(
 
         event = capture_event(_, getattr(event_object or trigger, "changed"))
 
-        assert event == {"trigger": trigger, "position": trigger.position}
+        assert event == {"trigger": trigger, "position": trigger.position, "timestamp": ANY}
         assert isclose(trigger.position, 0, abs_tol=1e-04)
+
+
+def test_map_controller_input():
+    axis = _eplatform.SDL_GAMEPAD_BINDTYPE_AXIS
+    button = _eplatform.SDL_GAMEPAD_BINDTYPE_BUTTON
+    hat = _eplatform.SDL_GAMEPAD_BINDTYPE_HAT
+    plan = array(
+        "d",
+        (
+            *(axis, 0, 0.0, 1.0, 0.0, 1.0, 0),
+            *(button, 1, 0.0, 0.0, 0.0, -0.25, 0),
+            *(hat, 2, _eplatform.SDL_HAT_UP, 0.0, 0.0, -1.0, 1),
+            *(axis, 0, 0.0, -1.0, 0.0, 1.0, 1),
+        ),
+    )
+    values = array("d", (0.5, 0, 0))
+    assert map_controller_input(plan, values, -1.0, 1.0) == (0.5, 0.0)
+    values[1] = 1
+    assert map_controller_input(plan, values, -1.0, 1.0) == (0.25, 0.0)
+    values[2] = _eplatform.SDL_HAT_UP | _eplatform.SDL_HAT_LEFT
+    assert map_controller_input(plan, values, -1.0, 1.0) == (0.25, -1.0)
+    values[0] = -0.5
+    assert map_controller_input(plan, values, -1.0, 1.0) == (-0.25, -0.5)
+    assert map_controller_input(plan, values, 0.0, 1.0) == (0.0, 0.0)
+    assert map_controller_input(array("d"), array("d"), -1.0, 1.0) == (0.0, 0.0)
+
+
+def test_map_controller_button():
+    axis = _eplatform.SDL_GAMEPAD_BINDTYPE_AXIS
+    button = _eplatform.SDL_GAMEPAD_BINDTYPE_BUTTON
+    hat = _eplatform.SDL_GAMEPAD_BINDTYPE_HAT
+    plan = array(
+        "d",
+        (
+            *(button, 1, 0.0, 0.0, 0.0, 0.0, 0),
+            *(hat, 2, _eplatform.SDL_HAT_DOWN, 0.0, 0.0, 0.0, 0),
+            *(axis, 0, 0.0, 1.0, -1.0, 1.0, 0),
+        ),
+    )
+    values = array("d", (-0.5, 0, 0))
+    assert not map_controller_button(plan, values, 0.3)
+    values[1] = 1
+    assert map_controller_button(plan, values, 0.3)
+    values[1] = 0
+    values[2] = _eplatform.SDL_HAT_DOWN
+    assert map_controller_button(plan, values, 0.3)
+    # an analog input past either threshold decides before any other input
+    values[0] = 0.6
+    assert not map_controller_button(plan, values, 0.3)
+    values[0] = 0.9
+    values[2] = 0
+    assert map_controller_button(plan, values, 0.3)
+    assert not map_controller_button(array("d"), array("d"), 0.3)
+
+
+@pytest.mark.parametrize(
+    "plan, error",
+    [
+        ((_eplatform.SDL_GAMEPAD_BINDTYPE_BUTTON, 0), "invalid mapping plan size: 16"),
+        (
+            (_eplatform.SDL_GAMEPAD_BINDTYPE_BUTTON, 1, 0.0, 0.0, 0.0, 0.0, 0),
+            "invalid mapping value index: 1",
+        ),
+        (
+            (_eplatform.SDL_GAMEPAD_BINDTYPE_BUTTON, 0, 0.0, 0.0, 0.0, 0.0, 2),
+            "invalid mapping component: 2",
+        ),
+    ],
+)
+def test_check_controller_mapping_plan_invalid(plan, error):
+    plan = array("d", plan)
+    values = array("d", (0.0,))
+    with pytest.raises(ValueError) as excinfo:
+        check_controller_mapping_plan(plan, values)
+    assert str(excinfo.value) == error
+
+
+def test_map_controller_invalid_plan_size():
+    plan = array("d", (_eplatform.SDL_GAMEPAD_BINDTYPE_BUTTON, 0))
+    values = array("d", (0.0,))
+    with pytest.raises(ValueError) as excinfo:
+        map_controller_input(plan, values, -1.0, 1.0)
+    assert str(excinfo.value) == "invalid mapping plan size: 16"
+    with pytest.raises(ValueError) as excinfo:
+        map_controller_button(plan, values, 0.3)
+    assert str(excinfo.value) == "invalid mapping plan size: 16"
@@ -1,17 +1,28 @@
+import asyncio
 import inspect
 import platform
 from contextlib import contextmanager
+from unittest.mock import ANY
 from unittest.mock import MagicMock
+from unittest.mock import call
 from unittest.mock import patch
 
 import pytest
+from emath import DVector2
+from emath import DVector2Array
 from emath import IVector2
 
 from eplatform import EventLoop
+from eplatform import EventLoopStats
 from eplatform import _eplatform
 from eplatform import get_displays
+from eplatform import idle
+from eplatform import install
 from eplatform._eplatform import clear_sdl_events
+from eplatform._eplatform import get_sdl_events
 from eplatform._eplatform import push_sdl_event
+from eplatform._eplatform import reset_sdl_event_wakeup
+from eplatform._eplatform import wait_sdl_event
 from eplatform._event_loop import _noop_poll
 from eplatform._event_loop import _Selector
 
@@ -32,6 +43,20 @@ def mock_mouse():
         yield mouse
 
 
+@pytest.fixture
+def mock_touch():
+    touch = MagicMock()
+    with patch("eplatform._event_loop.get_touch", return_value=touch):
+        yield touch
+
+
+@pytest.fixture
+def mock_pen():
+    pen = MagicMock()
+    with patch("eplatform._event_loop.get_pen", return_value=pen):
+        yield pen
+
+
 @pytest.fixture
 def mock_window():
     window = MagicMock()
@@ -42,10 +67,35 @@ def mock_window():
 @patch("eplatform._event_loop._Selector")
 @patch("eplatform._event_loop.SelectorEventLoop.__init__")
 @pytest.mark.parametrize(
-    "kwargs, expected_poll",
-    [({}, _noop_poll), ({"poll": None}, _noop_poll), ({"poll": MOCK}, MOCK)],
+    "kwargs, expected_selector_args",
+    [
+        ({}, (_noop_poll, None, False, False, False, False, False, None)),
+        ({"poll": None}, (_noop_poll, None, False, False, False, False, False, None)),
+        ({"poll": MOCK}, (MOCK, None, False, False, False, False, False, None)),
+        ({"sdl_event_budget": None}, (_noop_poll, None, False, False, False, False, False, None)),
+        ({"sdl_event_budget": 1}, (_noop_poll, 1, False, False, False, False, False, None)),
+        ({"sdl_event_budget": 100}, (_noop_poll, 100, False, False, False, False, False, None)),
+        ({"sleep_when_idle": True}, (_noop_poll, None, True, False, False, False, False, None)),
+        (
+            {"coalesce_mouse_motion": True},
+            (_noop_poll, None, False, True, False, False, False, None),
+        ),
+        (
+            {"coalesce_controller_axis_motion": True},
+            (_noop_poll, None, False, False, True, False, False, None),
+        ),
+        (
+            {"coalesce_text_input": True},
+            (_noop_poll, None, False, False, False, True, False, None),
+        ),
+        (
+            {"coalesce_mouse_wheel": True},
+            (_noop_poll, None, False, False, False, False, True, None),
+        ),
+        ({"stats": MOCK}, (_noop_poll, None, False, False, False, False, False, MOCK)),
+    ],
 )
-def test_event_loop(super_init, selector_cls_mock, kwargs, expected_poll):
+def test_event_loop(super_init, selector_cls_mock, kwargs, expected_selector_args):
     ready_callbacks = MagicMock()
 
     def _(*args, **kwargs):
@@ -60,10 +110,169 @@ def test_event_loop(super_init, selector_cls_mock, kwargs, expected_poll):
     el = EventLoop(**kwargs)
     el._closed = True
     super_init.assert_called_once()
-    selector_cls_mock.assert_called_once_with(expected_poll)
+    selector_cls_mock.assert_called_once_with(*expected_selector_args)
     assert selector_cls_mock.return_value._EPlatformSelector_ready_callbacks is ready_callbacks
 
 
+@pytest.mark.parametrize("sdl_event_budget", [0, -1])
+def test_event_loop_invalid_sdl_event_budget(sdl_event_budget):
+    with pytest.raises(ValueError) as excinfo:
+        EventLoop(sdl_event_budget=sdl_event_budget)
+    assert str(excinfo.value) == "sdl_event_budget must be at least 1"
+
+
+@pytest.mark.parametrize("sdl_event_budget", [0, -1])
+def test_install_invalid_sdl_event_budget(sdl_event_budget):
+    loop = asyncio.new_event_loop()
+    with pytest.raises(ValueError) as excinfo:
+        install(loop, sdl_event_budget=sdl_event_budget)
+    assert str(excinfo.value) == "sdl_event_budget must be at least 1"
+    loop.close()
+
+
+@pytest.mark.parametrize("sleep_when_idle", [False, True])
+@pytest.mark.parametrize("sdl_event_budget", [None, 1, 2])
+def test_install(platform, mock_window, sleep_when_idle, sdl_event_budget):
+    clear_sdl_events()
+    loop = asyncio.new_event_loop()
+    uninstall = install(loop, sdl_event_budget=sdl_event_budget, sleep_when_idle=sleep_when_idle)
+
+    async def test():
+        await asyncio.wait_for(idle, timeout=1)
+        push_sdl_event(_eplatform.SDL_EVENT_QUIT)
+        push_sdl_event(_eplatform.SDL_EVENT_QUIT)
+        await asyncio.wait_for(idle, timeout=1)
+
+    with patch("eplatform._event_loop.close_window") as close_window:
+        loop.run_until_complete(test())
+    assert close_window.call_count == 2
+
+    uninstall()
+    with patch("eplatform._event_loop.close_window") as close_window:
+        push_sdl_event(_eplatform.SDL_EVENT_QUIT)
+        loop.run_until_complete(asyncio.sleep(0.05))
+    close_window.assert_not_called()
+    # uninstalling again does nothing
+    uninstall()
+    clear_sdl_events()
+    loop.close()
+
+
+def test_install_poll(platform):
+    clear_sdl_events()
+    loop = asyncio.new_event_loop()
+    poll = MagicMock(side_effect=lambda: poll.call_count == 1)
+    uninstall = install(loop, poll=poll)
+    loop.run_until_complete(asyncio.wait_for(idle, timeout=1))
+    assert poll.call_count >= 2
+    uninstall()
+    loop.close()
+
+
+def test_install_close_during_tick(platform):
+    clear_sdl_events()
+    loop = asyncio.new_event_loop()
+    poll = MagicMock(side_effect=lambda: uninstall())
+    uninstall = install(loop, poll=poll, sleep_when_idle=False)
+    loop.run_until_complete(asyncio.sleep(0.05))
+    poll.assert_called_once_with()
+    loop.close()
+
+
+def test_install_stats(platform):
+    clear_sdl_events()
+    stats = EventLoopStats()
+    loop = asyncio.new_event_loop()
+    uninstall = install(loop, stats=stats)
+    loop.run_until_complete(asyncio.wait_for(idle, timeout=1))
+    assert stats.idle_count >= 1
+    assert stats.drain_count >= 1
+    uninstall()
+    loop.close()
+
+
+def test_event_loop_stats_default():
+    stats = EventLoopStats()
+    assert stats.idle_count == 0
+    assert stats.drain_count == 0
+    assert stats.max_queue_depth == 0
+    assert stats.mean_queue_depth == 0.0
+    assert stats.event_types == ()
+    assert stats.get_event_count(1) == 0
+    assert stats.get_handler_time(1) == 0
+    assert stats.get_handler_time_percentile(1, 50) == 0
+
+
+def test_event_loop_stats_dispatch_sdl_event():
+    stats = EventLoopStats()
+    handle = MagicMock(return_value=True)
+    for handler_time in [5, 100, 1000, 3000]:
+        with patch("eplatform._event_loop.perf_counter_ns", side_effect=[0, handler_time]):
+            assert stats._dispatch_sdl_event(handle, (1, 2, 3))
+    handle.assert_called_with(1, 2, 3)
+    assert stats.event_types == (1,)
+    assert stats.get_event_count(1) == 4
+    assert stats.get_handler_time(1) == 4105
+    assert stats.get_handler_time_percentile(1, 0) == 7
+    assert stats.get_handler_time_percentile(1, 50) == 127
+    assert stats.get_handler_time_percentile(1, 75) == 1023
+    assert stats.get_handler_time_percentile(1, 100) == 4095
+
+    handle.side_effect = RuntimeError()
+    with pytest.raises(RuntimeError):
+        stats._dispatch_sdl_event(handle, (2,))
+    assert stats.get_event_count(2) == 1
+
+    stats.reset()
+    assert stats.event_types == ()
+
+
+@pytest.mark.parametrize("percentile", [-1, 101])
+def test_event_loop_stats_invalid_percentile(percentile):
+    stats = EventLoopStats()
+    with pytest.raises(ValueError) as excinfo:
+        stats.get_handler_time_percentile(1, percentile)
+    assert str(excinfo.value) == "percentile must be between 0 and 100"
+
+
+def test_event_loop_stats_queue_depth():
+    stats = EventLoopStats()
+    stats._record_drain(3)
+    stats._record_drain(5)
+    stats._record_idle()
+    assert stats.drain_count == 2
+    assert stats.max_queue_depth == 5
+    assert stats.mean_queue_depth == 4.0
+    assert stats.idle_count == 1
+
+
+def test_selector_poll_sdl_events_stats(platform):
+    stats = EventLoopStats()
+    selector = _Selector(_noop_poll, None, False, False, False, False, False, stats)
+    clear_sdl_events()
+    for _ in range(3):
+        push_sdl_event(_eplatform.SDL_EVENT_WINDOW_SHOWN)
+    with patch.object(selector, "_EPlatformSelector__handle_sdl_event", return_value=True):
+        assert selector._EPlatformSelector__poll_sdl_events()
+    assert stats.drain_count == 1
+    assert stats.max_queue_depth == 3
+    assert stats.get_event_count(_eplatform.SDL_EVENT_WINDOW_SHOWN) == 3
+
+
+def test_selector_select_stats():
+    stats = EventLoopStats()
+    selector = _Selector(_noop_poll, None, False, False, False, False, False, stats)
+    selector._EPlatformSelector_ready_callbacks = []
+    with (
+        patch("eplatform._event_loop.idle", new=MagicMock()) as idle,
+        patch.object(selector, "_EPlatformSelector__poll_sdl_events", return_value=False),
+        patch("eplatform._event_loop.DefaultSelector.select", return_value=[]),
+    ):
+        selector.select(0.5)
+    idle.assert_called_once_with(None)
+    assert stats.idle_count == 1
+
+
 def test_noop_poll():
     assert not _noop_poll()
 
@@ -79,7 +288,7 @@ def test_selector_select():
         patch.object(
             selector, "_EPlatformSelector__poll_sdl_events", return_value=False
         ) as poll_sdl_events,
-        patch("eplatform._event_loop.SelectSelector.select", return_value=[]) as super_select,
+        patch("eplatform._event_loop.DefaultSelector.select", return_value=[]) as super_select,
     ):
         assert selector.select(0.5) == []
         poll_sdl_events.assert_called_with()
@@ -94,7 +303,7 @@ def test_selector_select():
         patch.object(
             selector, "_EPlatformSelector__poll_sdl_events", return_value=False
         ) as poll_sdl_events,
-        patch("eplatform._event_loop.SelectSelector.select", return_value=[]) as super_select,
+        patch("eplatform._event_loop.DefaultSelector.select", return_value=[]) as super_select,
     ):
         assert selector.select(0.5) == []
         poll_sdl_events.assert_called_with()
@@ -109,7 +318,7 @@ def test_selector_select():
         patch.object(
             selector, "_EPlatformSelector__poll_sdl_events", return_value=False
         ) as poll_sdl_events,
-        patch("eplatform._event_loop.SelectSelector.select", return_value=[]) as super_select,
+        patch("eplatform._event_loop.DefaultSelector.select", return_value=[]) as super_select,
     ):
         assert selector.select(0.5) == []
         poll_sdl_events.assert_called_with()
@@ -123,7 +332,7 @@ def test_selector_select():
         patch.object(
             selector, "_EPlatformSelector__poll_sdl_events", return_value=True
         ) as poll_sdl_events,
-        patch("eplatform._event_loop.SelectSelector.select", return_value=[]) as super_select,
+        patch("eplatform._event_loop.DefaultSelector.select", return_value=[]) as super_select,
     ):
         assert selector.select() == []
         poll_sdl_events.assert_called_once_with()
@@ -136,15 +345,160 @@ def test_selector_select():
         patch.object(
             selector, "_EPlatformSelector__poll_sdl_events", return_value=False
         ) as poll_sdl_events,
-        patch("eplatform._event_loop.SelectSelector.select", return_value=[True]) as super_select,
+        patch(
+            "eplatform._event_loop.DefaultSelector.select", return_value=[(MOCK, 1)]
+        ) as super_select,
     ):
-        assert selector.select() == [True]
+        assert selector.select() == [(MOCK, 1)]
         poll_sdl_events.assert_called_once_with()
         super_select.assert_called_once_with(-1)
         poll.assert_not_called()
         idle.assert_not_called()
 
 
+def test_selector_select_sleep_when_idle():
+    poll = MagicMock(return_value=False)
+
+    selector = _Selector(poll, None, True)
+    selector._EPlatformSelector_ready_callbacks = []
+    # sleeps until an sdl event is available
+    with (
+        patch("eplatform._event_loop.idle", new=MagicMock()) as idle,
+        patch.object(selector, "_EPlatformSelector__poll_sdl_events", return_value=False),
+        patch("eplatform._event_loop.DefaultSelector.select", return_value=[]) as super_select,
+        patch(
+            "eplatform._event_loop.wait_sdl_event", side_effect=[False, False, True]
+        ) as wait_sdl_event,
+    ):
+        assert selector.select() == []
+        idle.assert_called_once_with(None)
+        assert wait_sdl_event.call_count == 3
+        for call in wait_sdl_event.call_args_list:
+            assert call.args == (0,)
+        assert super_select.call_count == 4
+        for call in super_select.call_args_list[1:]:
+            assert call.args == (0.01,)
+    # sleeps until a file descriptor is ready
+    with (
+        patch("eplatform._event_loop.idle", new=MagicMock()),
+        patch.object(selector, "_EPlatformSelector__poll_sdl_events", return_value=False),
+        patch("eplatform._event_loop.DefaultSelector.select", side_effect=[[], [], [(MOCK, 1)]]),
+        patch("eplatform._event_loop.wait_sdl_event", return_value=False) as wait_sdl_event,
+    ):
+        assert selector.select() == [(MOCK, 1)]
+        assert wait_sdl_event.call_count == 1
+    # sleeps until sdl wakes the selector
+    with (
+        patch("eplatform._event_loop.idle", new=MagicMock()),
+        patch.object(selector, "_EPlatformSelector__poll_sdl_events", return_value=False),
+        patch.object(
+            selector, "_EPlatformSelector__select", side_effect=[([], False), ([], True)]
+        ),
+        patch("eplatform._event_loop.wait_sdl_event") as wait_sdl_event,
+    ):
+        assert selector.select() == []
+        wait_sdl_event.assert_not_called()
+    # sleeps no longer than the timeout
+    with (
+        patch("eplatform._event_loop.idle", new=MagicMock()),
+        patch.object(selector, "_EPlatformSelector__poll_sdl_events", return_value=False),
+        patch("eplatform._event_loop.DefaultSelector.select", return_value=[]) as super_select,
+        patch("eplatform._event_loop.wait_sdl_event", return_value=False),
+    ):
+        assert selector.select(0.005) == []
+        for call in super_select.call_args_list[1:]:
+            assert 0 < call.args[0] <= 0.005
+    # idle scheduled a callback
+    with (
+        patch(
+            "eplatform._event_loop.idle",
+            new=MagicMock(
+                side_effect=lambda _: selector._EPlatformSelector_ready_callbacks.append(1)
+            ),
+        ),
+        patch.object(selector, "_EPlatformSelector__poll_sdl_events", return_value=False),
+        patch("eplatform._event_loop.DefaultSelector.select", return_value=[]),
+        patch("eplatform._event_loop.wait_sdl_event") as wait_sdl_event,
+    ):
+        assert selector.select() == []
+        wait_sdl_event.assert_not_called()
+    selector._EPlatformSelector_ready_callbacks.clear()
+    # poll has work
+    poll.return_value = True
+    with (
+        patch("eplatform._event_loop.idle", new=MagicMock()) as idle,
+        patch.object(selector, "_EPlatformSelector__poll_sdl_events", return_value=False),
+        patch("eplatform._event_loop.DefaultSelector.select", return_value=[]),
+        patch("eplatform._event_loop.wait_sdl_event") as wait_sdl_event,
+    ):
+        assert selector.select() == []
+        idle.assert_not_called()
+        wait_sdl_event.assert_not_called()
+
+
+def test_wait_sdl_event_no_platform():
+    assert not wait_sdl_event(1)
+
+
+def test_wait_sdl_event(platform):
+    clear_sdl_events()
+    assert not wait_sdl_event(1)
+    push_sdl_event(_eplatform.SDL_EVENT_QUIT)
+    assert wait_sdl_event(1000)
+    # the event is left on the queue
+    assert wait_sdl_event(0)
+    clear_sdl_events()
+
+
+def test_selector_wakeup(platform):
+    selector = _Selector(_noop_poll)
+    clear_sdl_events()
+    assert selector._EPlatformSelector__select(0) == ([], False)
+    push_sdl_event(_eplatform.SDL_EVENT_QUIT)
+    push_sdl_event(_eplatform.SDL_EVENT_QUIT)
+    assert selector._EPlatformSelector__select(1) == ([], True)
+    assert selector._EPlatformSelector__select(0) == ([], False)
+    # sdl can wake the selector again once it has been woken
+    push_sdl_event(_eplatform.SDL_EVENT_QUIT)
+    assert selector._EPlatformSelector__select(1) == ([], True)
+    clear_sdl_events()
+    selector.close()
+
+
+def test_selector_wakeup_during_reset(platform):
+    selector = _Selector(_noop_poll)
+    clear_sdl_events()
+    push_sdl_event(_eplatform.SDL_EVENT_QUIT)
+
+    def reset_sdl_event_wakeup_then_push(wakeup):
+        reset_sdl_event_wakeup(wakeup)
+        # the watch fires as soon as sdl is able to wake the selector again
+        push_sdl_event(_eplatform.SDL_EVENT_QUIT)
+
+    with patch(
+        "eplatform._event_loop.reset_sdl_event_wakeup",
+        side_effect=reset_sdl_event_wakeup_then_push,
+    ):
+        assert selector._EPlatformSelector__select(1) == ([], True)
+    assert selector._EPlatformSelector__select(0) == ([], True)
+    clear_sdl_events()
+    selector.close()
+
+
+def test_selector_woken_no_idle(platform):
+    selector = _Selector(_noop_poll)
+    selector._EPlatformSelector_ready_callbacks = []
+    with (
+        patch("eplatform._event_loop.idle", new=MagicMock()) as idle,
+        patch.object(selector, "_EPlatformSelector__poll_sdl_events", return_value=False),
+    ):
+        push_sdl_event(_eplatform.SDL_EVENT_QUIT)
+        assert selector.select() == []
+        idle.assert_not_called()
+    clear_sdl_events()
+    selector.close()
+
+
 def test_selector_poll_sdl_events_no_platform():
     selector = _Selector(_noop_poll)
     clear_sdl_events()
@@ -161,10 +515,107 @@ def test_selector_poll_sdl_events_none(platform):
     assert handle_sdl_event.call_count == 0
 
 
+def test_get_sdl_events_no_platform():
+    clear_sdl_events()
+    assert get_sdl_events(10) == []
+
+
+@pytest.mark.parametrize("event_count", [0, 1, 63, 64, 65, 200])
+@pytest.mark.parametrize("max_count", [0, 1, 64, 100, 1000])
+def test_get_sdl_events(platform, event_count, max_count):
+    clear_sdl_events()
+    for _ in range(event_count):
+        push_sdl_event(_eplatform.SDL_EVENT_WINDOW_SHOWN)
+    events = get_sdl_events(max_count)
+    assert events == [(_eplatform.SDL_EVENT_WINDOW_SHOWN, ANY)] * min(event_count, max_count)
+    assert get_sdl_events(1000) == [(_eplatform.SDL_EVENT_WINDOW_SHOWN, ANY)] * max(
+        event_count - max_count, 0
+    )
+
+
+def test_get_sdl_events_timestamp(platform):
+    clear_sdl_events()
+    push_sdl_event(_eplatform.SDL_EVENT_WINDOW_SHOWN)
+    push_sdl_event(_eplatform.SDL_EVENT_WINDOW_HIDDEN)
+    (_, timestamp_a), (_, timestamp_b) = get_sdl_events(2)
+    assert isinstance(timestamp_a, int)
+    assert 0 < timestamp_a <= timestamp_b
+
+
+def test_get_sdl_events_negative_max_count(platform):
+    with pytest.raises(ValueError) as excinfo:
+        get_sdl_events(-1)
+    assert str(excinfo.value) == "max_count must not be negative, got -1"
+
+
+@pytest.mark.parametrize("event_count", [1, 2, 10, 100])
+def test_selector_poll_sdl_events_drain(platform, event_count):
+    selector = _Selector(_noop_poll)
+    clear_sdl_events()
+    for _ in range(event_count):
+        push_sdl_event(_eplatform.SDL_EVENT_WINDOW_SHOWN)
+    with patch.object(
+        selector, "_EPlatformSelector__handle_sdl_event", return_value=True
+    ) as handle_sdl_event:
+        assert selector._EPlatformSelector__poll_sdl_events()
+        assert handle_sdl_event.call_count == event_count
+        assert not selector._EPlatformSelector__poll_sdl_events()
+        assert handle_sdl_event.call_count == event_count
+
+
+@pytest.mark.parametrize("sdl_event_budget", [1, 2, 3])
+def test_selector_poll_sdl_events_budget(platform, sdl_event_budget):
+    selector = _Selector(_noop_poll, sdl_event_budget)
+    clear_sdl_events()
+    for _ in range(5):
+        push_sdl_event(_eplatform.SDL_EVENT_WINDOW_SHOWN)
+    with patch.object(
+        selector, "_EPlatformSelector__handle_sdl_event", return_value=True
+    ) as handle_sdl_event:
+        assert selector._EPlatformSelector__poll_sdl_events()
+        assert handle_sdl_event.call_count == sdl_event_budget
+        while selector._EPlatformSelector__poll_sdl_events():
+            pass
+        assert handle_sdl_event.call_count == 5
+
+
+def test_selector_poll_sdl_events_budget_unhandled(platform):
+    selector = _Selector(_noop_poll, 1)
+    clear_sdl_events()
+    for _ in range(3):
+        push_sdl_event(_eplatform.SDL_EVENT_WINDOW_SHOWN)
+    with patch.object(
+        selector, "_EPlatformSelector__handle_sdl_event", side_effect=[False, False, True]
+    ) as handle_sdl_event:
+        assert selector._EPlatformSelector__poll_sdl_events()
+    assert handle_sdl_event.call_count == 3
+
+
+def test_selector_poll_sdl_events_stops_on_ready_callback(platform):
+    selector = _Selector(_noop_poll)
+    selector._EPlatformSelector_ready_callbacks = ready_callbacks = [None]
+    clear_sdl_events()
+    for _ in range(3):
+        push_sdl_event(_eplatform.SDL_EVENT_WINDOW_SHOWN)
+
+    def _(*args):
+        ready_callbacks.append(None)
+        return True
+
+    with patch.object(
+        selector, "_EPlatformSelector__handle_sdl_event", side_effect=_
+    ) as handle_sdl_event:
+        assert selector._EPlatformSelector__poll_sdl_events()
+        assert handle_sdl_event.call_count == 1
+        assert selector._EPlatformSelector__poll_sdl_events()
+        assert handle_sdl_event.call_count == 2
+
+
 @pytest.mark.parametrize(
     "event_type",
     [
         _eplatform.SDL_EVENT_QUIT,
+        _eplatform.SDL_EVENT_KEYMAP_CHANGED,
         _eplatform.SDL_EVENT_WINDOW_HIDDEN,
         _eplatform.SDL_EVENT_WINDOW_SHOWN,
         _eplatform.SDL_EVENT_WINDOW_FOCUS_GAINED,
@@ -179,25 +630,100 @@ def test_selector_poll_sdl_events_default(platform, event_type):
     push_sdl_event(event_type)
     with patch.object(selector, "_EPlatformSelector__handle_sdl_event") as handle_sdl_event:
         assert selector._EPlatformSelector__poll_sdl_events()
-    handle_sdl_event.assert_called_once_with(event_type)
+    handle_sdl_event.assert_called_once_with(event_type, ANY)
 
 
 @pytest.mark.parametrize("event_type", [_eplatform.SDL_EVENT_MOUSE_MOTION])
-@pytest.mark.parametrize("position", [IVector2(0, 1), IVector2(99, 75)])
-@pytest.mark.parametrize("delta", [IVector2(1, 2), IVector2(-1, -2)])
+@pytest.mark.parametrize("position", [DVector2(0, 1), DVector2(99.5, 75.25)])
+@pytest.mark.parametrize("delta", [DVector2(1, 2), DVector2(-0.5, -2)])
 def test_selector_poll_sdl_events_mouse_motion(platform, event_type, position, delta):
     selector = _Selector(_noop_poll)
     clear_sdl_events()
     push_sdl_event(event_type, *position, *delta)
     with patch.object(selector, "_EPlatformSelector__handle_sdl_event") as handle_sdl_event:
         assert selector._EPlatformSelector__poll_sdl_events()
-    handle_sdl_event.assert_called_once_with(event_type, position, delta)
+    handle_sdl_event.assert_called_once_with(event_type, ANY, position, delta)
+
+
+@pytest.mark.parametrize("sdl_event_budget", [None, 1])
+def test_selector_poll_sdl_events_coalesce_mouse_motion(platform, sdl_event_budget):
+    selector = _Selector(_noop_poll, sdl_event_budget, False, True)
+    clear_sdl_events()
+    push_sdl_event(_eplatform.SDL_EVENT_MOUSE_MOTION, 1, 2, 1, 2)
+    push_sdl_event(_eplatform.SDL_EVENT_MOUSE_MOTION, 2, 4, 1, 2)
+    push_sdl_event(_eplatform.SDL_EVENT_MOUSE_MOTION, 5, 3, 3, -1)
+    push_sdl_event(_eplatform.SDL_EVENT_QUIT)
+    push_sdl_event(_eplatform.SDL_EVENT_MOUSE_MOTION, 6, 3, 1, 0)
+    with patch.object(
+        selector, "_EPlatformSelector__handle_sdl_event", return_value=True
+    ) as handle_sdl_event:
+        while selector._EPlatformSelector__poll_sdl_events():
+            pass
+    assert handle_sdl_event.call_args_list == [
+        call(
+            _eplatform.SDL_EVENT_MOUSE_MOTION,
+            ANY,
+            DVector2(5, 3),
+            DVector2(5, 3),
+            DVector2Array(DVector2(1, 2), DVector2(2, 4), DVector2(5, 3)),
+            ANY,
+        ),
+        call(_eplatform.SDL_EVENT_QUIT, ANY),
+        call(
+            _eplatform.SDL_EVENT_MOUSE_MOTION,
+            ANY,
+            DVector2(6, 3),
+            DVector2(1, 0),
+            DVector2Array(DVector2(6, 3)),
+            ANY,
+        ),
+    ]
+    # each sample keeps the timestamp of the event it came from
+    first_motion = handle_sdl_event.call_args_list[0].args
+    sample_timestamps = first_motion[5]
+    assert len(sample_timestamps) == 3
+    assert sample_timestamps[-1] == first_motion[1]
+    assert list(sample_timestamps) == sorted(sample_timestamps)
+    last_motion = handle_sdl_event.call_args_list[2].args
+    assert last_motion[5] == (last_motion[1],)
+
+
+def test_selector_poll_sdl_events_coalesce_controller_axis_motion():
+    selector = _Selector(_noop_poll, None, False, False, True)
+    axis_motion = _eplatform.SDL_EVENT_JOYSTICK_AXIS_MOTION
+    button_down = _eplatform.SDL_EVENT_JOYSTICK_BUTTON_DOWN
+    events = [
+        (axis_motion, 1, 1, 0, 0.1),
+        (axis_motion, 2, 1, 1, 0.2),
+        (axis_motion, 3, 1, 0, 0.3),
+        (axis_motion, 4, 2, 0, 0.4),
+        (button_down, 5, 1, 0),
+        (axis_motion, 6, 1, 0, 0.5),
+        (_eplatform.SDL_EVENT_QUIT, 7),
+        (axis_motion, 8, 1, 0, 0.6),
+    ]
+    with (
+        patch("eplatform._event_loop.get_sdl_events", side_effect=[events, []]),
+        patch.object(
+            selector, "_EPlatformSelector__handle_sdl_event", return_value=True
+        ) as handle_sdl_event,
+    ):
+        assert selector._EPlatformSelector__poll_sdl_events()
+    assert handle_sdl_event.call_args_list == [
+        call(axis_motion, 3, 1, 0, 0.3, 2),
+        call(axis_motion, 2, 1, 1, 0.2, 1),
+        call(axis_motion, 4, 2, 0, 0.4, 1),
+        call(button_down, 5, 1, 0),
+        call(_eplatform.SDL_EVENT_QUIT, 7),
+        call(axis_motion, 8, 1, 0, 0.6, 2),
+    ]
 
 
 @pytest.mark.parametrize("event_type", [_eplatform.SDL_EVENT_MOUSE_WHEEL])
 @pytest.mark.parametrize("flipped", [False, True])
 @pytest.mark.parametrize(
-    "delta", [IVector2(1, 2), IVector2(-1, -2), IVector2(0, 1), IVector2(1, 0)]
+    "delta",
+    [DVector2(1, 2), DVector2(-1, -2), DVector2(0, 1), DVector2(1, 0), DVector2(0.25, -0.5)],
 )
 def test_selector_poll_sdl_events_mouse_wheel(platform, event_type, flipped, delta):
     selector = _Selector(_noop_poll)
@@ -205,7 +731,7 @@ def test_selector_poll_sdl_events_mouse_wheel(platform, event_type, flipped, del
     push_sdl_event(event_type, flipped, *delta)
     with patch.object(selector, "_EPlatformSelector__handle_sdl_event") as handle_sdl_event:
         assert selector._EPlatformSelector__poll_sdl_events()
-    handle_sdl_event.assert_called_once_with(event_type, delta * (-1 if flipped else 1))
+    handle_sdl_event.assert_called_once_with(event_type, ANY, delta * (-1 if flipped else 1))
 
 
 @pytest.mark.parametrize(
@@ -219,7 +745,7 @@ def test_selector_poll_sdl_events_mouse_button(platform, event_type, button, is_
     push_sdl_event(event_type, button, is_pressed)
     with patch.object(selector, "_EPlatformSelector__handle_sdl_event") as handle_sdl_event:
         assert selector._EPlatformSelector__poll_sdl_events()
-    handle_sdl_event.assert_called_once_with(event_type, button, is_pressed)
+    handle_sdl_event.assert_called_once_with(event_type, ANY, button, is_pressed)
 
 
 @pytest.mark.parametrize(
@@ -228,13 +754,20 @@ def test_selector_poll_sdl_events_mouse_button(platform, event_type, button, is_
 @pytest.mark.parametrize("scancode", [0, 1, 100, 999999])
 @pytest.mark.parametrize("is_pressed", [False, True])
 @pytest.mark.parametrize("is_repeat", [False, True])
-def test_selector_poll_sdl_events_key(platform, event_type, scancode, is_pressed, is_repeat):
+@pytest.mark.parametrize(
+    "keymod", [_eplatform.SDL_KMOD_NONE, _eplatform.SDL_KMOD_LCTRL | _eplatform.SDL_KMOD_CAPS]
+)
+def test_selector_poll_sdl_events_key(
+    platform, event_type, scancode, is_pressed, is_repeat, keymod
+):
     selector = _Selector(_noop_poll)
     clear_sdl_events()
-    push_sdl_event(event_type, scancode, is_pressed, is_repeat)
+    push_sdl_event(event_type, scancode, is_pressed, is_repeat, keymod)
     with patch.object(selector, "_EPlatformSelector__handle_sdl_event") as handle_sdl_event:
         assert selector._EPlatformSelector__poll_sdl_events()
-    handle_sdl_event.assert_called_once_with(event_type, scancode, is_pressed, is_repeat)
+    handle_sdl_event.assert_called_once_with(
+        event_type, ANY, scancode, is_pressed, is_repeat, keymod
+    )
 
 
 @pytest.mark.parametrize("event_type", [_eplatform.SDL_EVENT_TEXT_INPUT])
@@ -245,7 +778,162 @@ def test_selector_poll_sdl_events_text_input(platform, event_type, text):
     push_sdl_event(event_type, text)
     with patch.object(selector, "_EPlatformSelector__handle_sdl_event") as handle_sdl_event:
         assert selector._EPlatformSelector__poll_sdl_events()
-    handle_sdl_event.assert_called_once_with(event_type, text)
+    handle_sdl_event.assert_called_once_with(event_type, ANY, text)
+
+
+@pytest.mark.parametrize("event_type", [_eplatform.SDL_EVENT_TEXT_EDITING])
+@pytest.mark.parametrize("text", ["a", "私"])
+@pytest.mark.parametrize("cursor_position, selection_length", [(-1, -1), (0, 1)])
+def test_selector_poll_sdl_events_text_editing(
+    platform, event_type, text, cursor_position, selection_length
+):
+    selector = _Selector(_noop_poll)
+    clear_sdl_events()
+    push_sdl_event(event_type, text, cursor_position, selection_length)
+    with patch.object(selector, "_EPlatformSelector__handle_sdl_event") as handle_sdl_event:
+        assert selector._EPlatformSelector__poll_sdl_events()
+    handle_sdl_event.assert_called_once_with(
+        event_type, ANY, text, cursor_position, selection_length
+    )
+
+
+@pytest.mark.parametrize(
+    "event_type",
+    [
+        _eplatform.SDL_EVENT_FINGER_DOWN,
+        _eplatform.SDL_EVENT_FINGER_UP,
+        _eplatform.SDL_EVENT_FINGER_MOTION,
+        _eplatform.SDL_EVENT_FINGER_CANCELED,
+    ],
+)
+def test_selector_poll_sdl_events_finger(platform, event_type):
+    selector = _Selector(_noop_poll)
+    clear_sdl_events()
+    push_sdl_event(event_type, 1, 2, 0.25, 0.5, -0.25, 0.125, 0.75)
+    with patch.object(selector, "_EPlatformSelector__handle_sdl_event") as handle_sdl_event:
+        assert selector._EPlatformSelector__poll_sdl_events()
+    handle_sdl_event.assert_called_once_with(event_type, ANY, 1, 2, 0.25, 0.5, -0.25, 0.125, 0.75)
+
+
+@pytest.mark.parametrize(
+    "event_type, push_args, expected_args",
+    [
+        (_eplatform.SDL_EVENT_PEN_PROXIMITY_IN, (3,), (3, True)),
+        (_eplatform.SDL_EVENT_PEN_PROXIMITY_OUT, (3,), (3, False)),
+        (_eplatform.SDL_EVENT_PEN_DOWN, (3, 1.5, 2.5, False), (3, 1.5, 2.5, True, False)),
+        (_eplatform.SDL_EVENT_PEN_UP, (3, 1.5, 2.5, True), (3, 1.5, 2.5, False, True)),
+        (_eplatform.SDL_EVENT_PEN_MOTION, (3, 1.5, 2.5), (3, 1.5, 2.5)),
+        (
+            _eplatform.SDL_EVENT_PEN_AXIS,
+            (3, 1.5, 2.5, _eplatform.SDL_PEN_AXIS_PRESSURE, 0.5),
+            (3, 1.5, 2.5, _eplatform.SDL_PEN_AXIS_PRESSURE, 0.5),
+        ),
+    ],
+)
+def test_selector_poll_sdl_events_pen(platform, event_type, push_args, expected_args):
+    selector = _Selector(_noop_poll)
+    clear_sdl_events()
+    push_sdl_event(event_type, *push_args)
+    with patch.object(selector, "_EPlatformSelector__handle_sdl_event") as handle_sdl_event:
+        assert selector._EPlatformSelector__poll_sdl_events()
+    handle_sdl_event.assert_called_once_with(event_type, ANY, *expected_args)
+
+
+def test_selector_poll_sdl_events_coalesce_text_input():
+    selector = _Selector(_noop_poll, None, False, False, False, True)
+    text_input = _eplatform.SDL_EVENT_TEXT_INPUT
+    key_down = _eplatform.SDL_EVENT_KEY_DOWN
+    key_up = _eplatform.SDL_EVENT_KEY_UP
+    events = [
+        (key_down, 1, 4, True, False, 0),
+        (text_input, 2, "a"),
+        (key_down, 3, 4, True, True, 0),
+        (text_input, 4, "a"),
+        (key_up, 5, 4, False, False, 0),
+        (text_input, 6, "私"),
+        (key_down, 7, 42, True, False, 0),
+        (text_input, 8, "b"),
+        (_eplatform.SDL_EVENT_QUIT, 9),
+        (text_input, 10, "c"),
+    ]
+    with (
+        patch("eplatform._event_loop.get_sdl_events", side_effect=[events, []]),
+        patch.object(
+            selector, "_EPlatformSelector__handle_sdl_event", return_value=True
+        ) as handle_sdl_event,
+    ):
+        assert selector._EPlatformSelector__poll_sdl_events()
+    assert handle_sdl_event.call_args_list == [
+        call(key_down, 1, 4, True, False, 0),
+        call(key_down, 3, 4, True, True, 0),
+        call(key_up, 5, 4, False, False, 0),
+        call(text_input, 6, "aa私"),
+        call(key_down, 7, 42, True, False, 0),
+        call(text_input, 8, "b"),
+        call(_eplatform.SDL_EVENT_QUIT, 9),
+        call(text_input, 10, "c"),
+    ]
+
+
+def test_selector_poll_sdl_events_coalesce_mouse_wheel():
+    selector = _Selector(_noop_poll, None, False, False, False, False, True)
+    wheel = _eplatform.SDL_EVENT_MOUSE_WHEEL
+    motion = _eplatform.SDL_EVENT_MOUSE_MOTION
+    button_down = _eplatform.SDL_EVENT_MOUSE_BUTTON_DOWN
+    events = [
+        (wheel, 1, DVector2(0, 0.25)),
+        (wheel, 2, DVector2(0.5, 0.25)),
+        (_eplatform.SDL_EVENT_QUIT, 3),
+        (wheel, 4, DVector2(0, -1)),
+        (motion, 5, DVector2(1, 1), DVector2(1, 1)),
+        (wheel, 6, DVector2(0, 2)),
+        (button_down, 7, 1, True),
+        (wheel, 8, DVector2(1, 0)),
+        (wheel, 9, DVector2(1, 0)),
+    ]
+    with (
+        patch("eplatform._event_loop.get_sdl_events", side_effect=[events, []]),
+        patch.object(
+            selector, "_EPlatformSelector__handle_sdl_event", return_value=True
+        ) as handle_sdl_event,
+    ):
+        assert selector._EPlatformSelector__poll_sdl_events()
+    assert handle_sdl_event.call_args_list == [
+        call(_eplatform.SDL_EVENT_QUIT, 3),
+        call(wheel, 4, DVector2(0.5, -0.5), 3),
+        call(motion, 5, DVector2(1, 1), DVector2(1, 1)),
+        call(wheel, 6, DVector2(0, 2), 1),
+        call(button_down, 7, 1, True),
+        call(wheel, 9, DVector2(2, 0), 2),
+    ]
+
+
+def test_selector_poll_sdl_events_coalesce_mouse_wheel_key_order():
+    selector = _Selector(_noop_poll, None, False, False, False, False, True)
+    wheel = _eplatform.SDL_EVENT_MOUSE_WHEEL
+    key_down = _eplatform.SDL_EVENT_KEY_DOWN
+    key_up = _eplatform.SDL_EVENT_KEY_UP
+    lctrl = _eplatform.SDL_SCANCODE_LCTRL
+    kmod = _eplatform.SDL_KMOD_LCTRL
+    events = [
+        (key_down, 1, lctrl, True, False, kmod),
+        (wheel, 2, DVector2(0, 1)),
+        (wheel, 3, DVector2(0, 1)),
+        (key_up, 4, lctrl, False, False, _eplatform.SDL_KMOD_NONE),
+    ]
+    with (
+        patch("eplatform._event_loop.get_sdl_events", side_effect=[events, []]),
+        patch.object(
+            selector, "_EPlatformSelector__handle_sdl_event", return_value=True
+        ) as handle_sdl_event,
+    ):
+        assert selector._EPlatformSelector__poll_sdl_events()
+    # the wheel is dispatched while ctrl is still held
+    assert handle_sdl_event.call_args_list == [
+        call(key_down, 1, lctrl, True, False, kmod),
+        call(wheel, 3, DVector2(0, 2), 2),
+        call(key_up, 4, lctrl, False, False, _eplatform.SDL_KMOD_NONE),
+    ]
 
 
 @pytest.mark.parametrize("event_type", [_eplatform.SDL_EVENT_WINDOW_RESIZED])
@@ -256,7 +944,7 @@ def test_selector_poll_sdl_events_window_resized(platform, event_type, size):
     push_sdl_event(event_type, size.x, size.y)
     with patch.object(selector, "_EPlatformSelector__handle_sdl_event") as handle_sdl_event:
         assert selector._EPlatformSelector__poll_sdl_events()
-    handle_sdl_event.assert_called_once_with(event_type, size)
+    handle_sdl_event.assert_called_once_with(event_type, ANY, size)
 
 
 @pytest.mark.parametrize("event_type", [_eplatform.SDL_EVENT_WINDOW_MOVED])
@@ -267,7 +955,7 @@ def test_selector_poll_sdl_events_window_moved(platform, event_type, position):
     push_sdl_event(event_type, position.x, position.y)
     with patch.object(selector, "_EPlatformSelector__handle_sdl_event") as handle_sdl_event:
         assert selector._EPlatformSelector__poll_sdl_events()
-    handle_sdl_event.assert_called_once_with(event_type, position)
+    handle_sdl_event.assert_called_once_with(event_type, ANY, position)
 
 
 @pytest.mark.parametrize(
@@ -280,7 +968,7 @@ def test_selector_poll_sdl_events_display_added_removed(platform, event_type, sd
     push_sdl_event(event_type, sdl_display)
     with patch.object(selector, "_EPlatformSelector__handle_sdl_event") as handle_sdl_event:
         assert selector._EPlatformSelector__poll_sdl_events()
-    handle_sdl_event.assert_called_once_with(event_type, sdl_display)
+    handle_sdl_event.assert_called_once_with(event_type, ANY, sdl_display)
 
 
 @pytest.mark.parametrize("event_type", [_eplatform.SDL_EVENT_DISPLAY_ORIENTATION])
@@ -294,7 +982,7 @@ def test_selector_poll_sdl_events_display_orientation(
     push_sdl_event(event_type, sdl_display, orientation)
     with patch.object(selector, "_EPlatformSelector__handle_sdl_event") as handle_sdl_event:
         assert selector._EPlatformSelector__poll_sdl_events()
-    handle_sdl_event.assert_called_once_with(event_type, sdl_display, orientation)
+    handle_sdl_event.assert_called_once_with(event_type, ANY, sdl_display, orientation)
 
 
 move_display = None
@@ -363,7 +1051,7 @@ def test_selector_poll_sdl_events_display_moved(platform):
         with patch.object(selector, "_EPlatformSelector__handle_sdl_event") as handle_sdl_event:
             selector._EPlatformSelector__poll_sdl_events()
         handle_sdl_event.assert_called_once_with(
-            _eplatform.SDL_EVENT_DISPLAY_MOVED, display_to_move._sdl_display, position
+            _eplatform.SDL_EVENT_DISPLAY_MOVED, ANY, display_to_move._sdl_display, position
         )
 
 
@@ -456,6 +1144,7 @@ def test_selector_poll_sdl_events_mode_changed(platform):
                 pass
         handle_sdl_event.assert_any_call(
             _eplatform.SDL_EVENT_DISPLAY_CURRENT_MODE_CHANGED,
+            ANY,
             display._sdl_display,
             different_mode.size,
             different_mode.refresh_rate,
@@ -478,7 +1167,12 @@ def test_selector_poll_sdl_events_mode_changed(platform):
         ),
         (_eplatform.SDL_EVENT_KEY_DOWN, "_EPlatformSelector__handle_sdl_event_key_changed"),
         (_eplatform.SDL_EVENT_KEY_UP, "_EPlatformSelector__handle_sdl_event_key_changed"),
+        (
+            _eplatform.SDL_EVENT_KEYMAP_CHANGED,
+            "_EPlatformSelector__handle_sdl_event_keymap_changed",
+        ),
         (_eplatform.SDL_EVENT_TEXT_INPUT, "_EPlatformSelector__handle_sdl_event_text_input"),
+        (_eplatform.SDL_EVENT_TEXT_EDITING, "_EPlatformSelector__handle_sdl_event_text_editing"),
         (
             _eplatform.SDL_EVENT_WINDOW_RESIZED,
             "_EPlatformSelector__handle_sdl_event_window_resized",
@@ -508,6 +1202,22 @@ def test_selector_poll_sdl_events_mode_changed(platform):
             _eplatform.SDL_EVENT_DISPLAY_CURRENT_MODE_CHANGED,
             "_EPlatformSelector__handle_sdl_event_current_mode_changed",
         ),
+        (_eplatform.SDL_EVENT_FINGER_DOWN, "_EPlatformSelector__handle_sdl_event_finger_down"),
+        (_eplatform.SDL_EVENT_FINGER_UP, "_EPlatformSelector__handle_sdl_event_finger_up"),
+        (_eplatform.SDL_EVENT_FINGER_MOTION, "_EPlatformSelector__handle_sdl_event_finger_motion"),
+        (_eplatform.SDL_EVENT_FINGER_CANCELED, "_EPlatformSelector__handle_sdl_event_finger_up"),
+        (
+            _eplatform.SDL_EVENT_PEN_PROXIMITY_IN,
+            "_EPlatformSelector__handle_sdl_event_pen_proximity_changed",
+        ),
+        (
+            _eplatform.SDL_EVENT_PEN_PROXIMITY_OUT,
+            "_EPlatformSelector__handle_sdl_event_pen_proximity_changed",
+        ),
+        (_eplatform.SDL_EVENT_PEN_DOWN, "_EPlatformSelector__handle_sdl_event_pen_press_changed"),
+        (_eplatform.SDL_EVENT_PEN_UP, "_EPlatformSelector__handle_sdl_event_pen_press_changed"),
+        (_eplatform.SDL_EVENT_PEN_MOTION, "_EPlatformSelector__handle_sdl_event_pen_motion"),
+        (_eplatform.SDL_EVENT_PEN_AXIS, "_EPlatformSelector__handle_sdl_event_pen_axis"),
         (
             _eplatform.SDL_EVENT_WINDOW_MAXIMIZED,
             "_EPlatformSelector__handle_sdl_event_window_maximized",
@@ -538,7 +1248,7 @@ def test_selector_handle_sdl_event_unexpected():
 def test_selector_handle_sdl_event_quit(mock_window):
     selector = _Selector(_noop_poll)
     with patch("eplatform._event_loop.close_window") as close_window:
-        assert selector._EPlatformSelector__handle_sdl_event_quit()
+        assert selector._EPlatformSelector__handle_sdl_event_quit(5)
     close_window.assert_called_once_with(mock_window)
 
 
@@ -546,34 +1256,54 @@ def test_selector_handle_sdl_event_quit(mock_window):
 @pytest.mark.parametrize("y", [0, -1, 1])
 @pytest.mark.parametrize("xrel", [0, -1, 1])
 @pytest.mark.parametrize("yrel", [0, -1, 1])
-def test_selector_handle_sdl_event_mouse_motion(mock_mouse, x, y, xrel, yrel):
+def test_selector_handle_sdl_event_mouse_motion(mock_mouse, mock_window, x, y, xrel, yrel):
+    selector = _Selector(_noop_poll)
+    position = DVector2(x, y)
+    delta = DVector2(xrel, yrel)
+    with patch("eplatform._event_loop.change_mouse_position") as change_mouse_position:
+        assert selector._EPlatformSelector__handle_sdl_event_mouse_motion(5, position, delta)
+    change_mouse_position.assert_called_once_with(
+        mock_mouse, position, delta, 5, None, None, mock_window.mouse_regions
+    )
+
+
+def test_selector_handle_sdl_event_mouse_motion_samples(mock_mouse, mock_window):
     selector = _Selector(_noop_poll)
-    position = IVector2(x, y)
-    delta = IVector2(xrel, yrel)
+    samples = DVector2Array(DVector2(1, 2), DVector2(3, 4))
     with patch("eplatform._event_loop.change_mouse_position") as change_mouse_position:
-        assert selector._EPlatformSelector__handle_sdl_event_mouse_motion(position, delta)
-    change_mouse_position.assert_called_once_with(mock_mouse, position, delta)
+        assert selector._EPlatformSelector__handle_sdl_event_mouse_motion(
+            5, DVector2(3, 4), DVector2(2, 2), samples, (4, 5)
+        )
+    change_mouse_position.assert_called_once_with(
+        mock_mouse, DVector2(3, 4), DVector2(2, 2), 5, samples, (4, 5), mock_window.mouse_regions
+    )
 
 
 @pytest.mark.parametrize("x", [0, -1, 1])
 @pytest.mark.parametrize("y", [0, -1, 1])
 def test_selector_handle_sdl_event_mouse_wheel(mock_mouse, x, y):
     selector = _Selector(_noop_poll)
-    delta = IVector2(x, y)
+    delta = DVector2(x, y)
     with patch("eplatform._event_loop.scroll_mouse_wheel") as scroll_mouse_wheel:
-        assert selector._EPlatformSelector__handle_sdl_event_mouse_wheel(delta)
-    scroll_mouse_wheel.assert_called_once_with(mock_mouse, delta)
+        assert selector._EPlatformSelector__handle_sdl_event_mouse_wheel(5, delta)
+        assert selector._EPlatformSelector__handle_sdl_event_mouse_wheel(6, delta, 3)
+    assert scroll_mouse_wheel.call_args_list == [
+        call(mock_mouse, delta, 5, None),
+        call(mock_mouse, delta, 6, 3),
+    ]
 
 
 @pytest.mark.parametrize("is_pressed", (False, True))
-def test_selector_handle_sdl_mouse_button_changed(mock_mouse, is_pressed):
+def test_selector_handle_sdl_mouse_button_changed(mock_mouse, mock_window, is_pressed):
     selector = _Selector(_noop_poll)
     sdl_button = MagicMock()
     with patch("eplatform._event_loop.change_mouse_button") as change_mouse_button:
         assert selector._EPlatformSelector__handle_sdl_event_mouse_button_changed(
-            sdl_button, is_pressed
+            5, sdl_button, is_pressed
         )
-    change_mouse_button.assert_called_once_with(mock_mouse, sdl_button, is_pressed)
+    change_mouse_button.assert_called_once_with(
+        mock_mouse, sdl_button, is_pressed, 5, mock_window.mouse_regions
+    )
 
 
 @pytest.mark.parametrize("is_pressed", (False, True))
@@ -581,20 +1311,111 @@ def test_selector_handle_sdl_mouse_button_changed(mock_mouse, is_pressed):
 def test_selector_handle_sdl_event_key_changed(mock_keyboard, is_pressed, is_repeat):
     selector = _Selector(_noop_poll)
     sdl_scancode = MagicMock()
+    sdl_keymod = MagicMock()
     with patch("eplatform._event_loop.change_key") as change_key:
         result = selector._EPlatformSelector__handle_sdl_event_key_changed(
-            sdl_scancode, is_pressed, is_repeat
+            5, sdl_scancode, is_pressed, is_repeat, sdl_keymod
         )
-    change_key.assert_called_once_with(mock_keyboard, sdl_scancode, is_pressed, is_repeat)
+    change_key.assert_called_once_with(
+        mock_keyboard, sdl_scancode, is_pressed, is_repeat, sdl_keymod, 5
+    )
     assert result == change_key.return_value
 
 
+def test_selector_handle_sdl_event_keymap_changed(mock_keyboard):
+    selector = _Selector(_noop_poll)
+    with patch("eplatform._event_loop.remap_keyboard") as remap_keyboard:
+        assert selector._EPlatformSelector__handle_sdl_event_keymap_changed(5)
+    remap_keyboard.assert_called_once_with(mock_keyboard)
+
+
 @pytest.mark.parametrize("text", ["", "hello", "私"])
 def test_selector_handle_sdl_event_text_input(mock_window, text):
     selector = _Selector(_noop_poll)
     with patch("eplatform._event_loop.input_window_text") as input_window_text:
-        assert selector._EPlatformSelector__handle_sdl_event_text_input(text)
-    input_window_text.assert_called_once_with(mock_window, text)
+        assert selector._EPlatformSelector__handle_sdl_event_text_input(5, text)
+    input_window_text.assert_called_once_with(mock_window, text, 5)
+
+
+@pytest.mark.parametrize("text", ["", "hello", "私"])
+@pytest.mark.parametrize("cursor_position, selection_length", [(-1, -1), (0, 1)])
+def test_selector_handle_sdl_event_text_editing(
+    mock_window, text, cursor_position, selection_length
+):
+    selector = _Selector(_noop_poll)
+    with patch("eplatform._event_loop.edit_window_text") as edit_window_text:
+        assert selector._EPlatformSelector__handle_sdl_event_text_editing(
+            5, text, cursor_position, selection_length
+        )
+    edit_window_text.assert_called_once_with(
+        mock_window, text, cursor_position, selection_length, 5
+    )
+
+
+def test_selector_handle_sdl_event_finger_down(mock_touch):
+    selector = _Selector(_noop_poll)
+    with patch("eplatform._event_loop.press_touch_finger") as press_touch_finger:
+        assert selector._EPlatformSelector__handle_sdl_event_finger_down(
+            5, 1, 2, 0.25, 0.5, 0, 0, 0.75
+        )
+    press_touch_finger.assert_called_once_with(mock_touch, 1, 2, 0.25, 0.5, 0.75, 5)
+
+
+def test_selector_handle_sdl_event_finger_up(mock_touch):
+    selector = _Selector(_noop_poll)
+    with patch("eplatform._event_loop.release_touch_finger") as release_touch_finger:
+        assert selector._EPlatformSelector__handle_sdl_event_finger_up(
+            5, 1, 2, 0.25, 0.5, 0, 0, 0.75
+        )
+    release_touch_finger.assert_called_once_with(mock_touch, 1, 2, 0.25, 0.5, 0.75, 5)
+
+
+def test_selector_handle_sdl_event_finger_motion(mock_touch):
+    selector = _Selector(_noop_poll)
+    with patch("eplatform._event_loop.move_touch_finger") as move_touch_finger:
+        assert selector._EPlatformSelector__handle_sdl_event_finger_motion(
+            5, 1, 2, 0.25, 0.5, -0.25, 0.125, 0.75
+        )
+    move_touch_finger.assert_called_once_with(mock_touch, 1, 2, 0.25, 0.5, -0.25, 0.125, 0.75, 5)
+
+
+@pytest.mark.parametrize("is_in_proximity", [False, True])
+def test_selector_handle_sdl_event_pen_proximity_changed(mock_pen, is_in_proximity):
+    selector = _Selector(_noop_poll)
+    with patch("eplatform._event_loop.change_pen_proximity") as change_pen_proximity:
+        assert selector._EPlatformSelector__handle_sdl_event_pen_proximity_changed(
+            5, 3, is_in_proximity
+        )
+    change_pen_proximity.assert_called_once_with(mock_pen, 3, is_in_proximity, 5)
+
+
+@pytest.mark.parametrize("is_down", [False, True])
+@pytest.mark.parametrize("is_eraser", [False, True])
+def test_selector_handle_sdl_event_pen_press_changed(mock_pen, is_down, is_eraser):
+    selector = _Selector(_noop_poll)
+    with patch("eplatform._event_loop.change_pen_press") as change_pen_press:
+        assert selector._EPlatformSelector__handle_sdl_event_pen_press_changed(
+            5, 3, 1.5, 2.5, is_down, is_eraser
+        )
+    change_pen_press.assert_called_once_with(mock_pen, 3, 1.5, 2.5, is_down, is_eraser, 5)
+
+
+def test_selector_handle_sdl_event_pen_motion(mock_pen):
+    selector = _Selector(_noop_poll)
+    with patch("eplatform._event_loop.move_pen") as move_pen:
+        assert selector._EPlatformSelector__handle_sdl_event_pen_motion(5, 3, 1.5, 2.5)
+    move_pen.assert_called_once_with(mock_pen, 3, 1.5, 2.5, 5)
+
+
+@pytest.mark.parametrize("handled", [False, True])
+def test_selector_handle_sdl_event_pen_axis(mock_pen, handled):
+    selector = _Selector(_noop_poll)
+    with patch("eplatform._event_loop.change_pen_axis", return_value=handled) as change_pen_axis:
+        assert (
+            selector._EPlatformSelector__handle_sdl_event_pen_axis(5, 3, 1.5, 2.5, 0, 0.5)
+            == handled
+        )
+    change_pen_axis.assert_called_once_with(mock_pen, 3, 1.5, 2.5, 0, 0.5, 5)
 
 
 @pytest.mark.parametrize("x", [25, 45])
@@ -603,8 +1424,8 @@ def test_selector_handle_sdl_event_window_resized(mock_window, x, y):
     selector = _Selector(_noop_poll)
     size = IVector2(x, y)
     with patch("eplatform._event_loop.resize_window") as resize_window:
-        assert selector._EPlatformSelector__handle_sdl_event_window_resized(size)
-    resize_window.assert_called_once_with(mock_window, size)
+        assert selector._EPlatformSelector__handle_sdl_event_window_resized(5, size)
+    resize_window.assert_called_once_with(mock_window, size, 5)
 
 
 @pytest.mark.parametrize("w", [25, 45])
@@ -613,35 +1434,35 @@ def test_selector_handle_sdl_event_window_moved(mock_window, w, h):
     selector = _Selector(_noop_poll)
     position = IVector2(w, h)
     with patch("eplatform._event_loop.move_window") as move_window:
-        assert selector._EPlatformSelector__handle_sdl_event_window_moved(position)
-    move_window.assert_called_once_with(mock_window, position)
+        assert selector._EPlatformSelector__handle_sdl_event_window_moved(5, position)
+    move_window.assert_called_once_with(mock_window, position, 5)
 
 
 def test_selector_handle_sdl_event_window_shown(mock_window):
     selector = _Selector(_noop_poll)
     with patch("eplatform._event_loop.show_window") as show_window:
-        assert selector._EPlatformSelector__handle_sdl_event_window_shown()
-    show_window.assert_called_once_with(mock_window)
+        assert selector._EPlatformSelector__handle_sdl_event_window_shown(5)
+    show_window.assert_called_once_with(mock_window, 5)
 
 
 def test_selector_handle_sdl_event_window_hidden(mock_window):
     selector = _Selector(_noop_poll)
     with patch("eplatform._event_loop.hide_window") as hide_window:
-        assert selector._EPlatformSelector__handle_sdl_event_window_hidden()
-    hide_window.assert_called_once_with(mock_window)
+        assert selector._EPlatformSelector__handle_sdl_event_window_hidden(5)
+    hide_window.assert_called_once_with(mock_window, 5)
 
 
 def test_selector_handle_sdl_event_window_focus_gained(mock_window):
     selector = _Selector(_noop_poll)
     with patch("eplatform._event_loop.focus_window") as focus_window:
-        assert selector._EPlatformSelector__handle_sdl_event_window_focus_gained()
+        assert selector._EPlatformSelector__handle_sdl_event_window_focus_gained(5)
     focus_window.assert_called_once_with(mock_window)
 
 
 def test_selector_handle_sdl_event_window_focus_lost(mock_window):
     selector = _Selector(_noop_poll)
     with patch("eplatform._event_loop.blur_window") as blur_window:
-        assert selector._EPlatformSelector__handle_sdl_event_window_focus_lost()
+        assert selector._EPlatformSelector__handle_sdl_event_window_focus_lost(5)
     blur_window.assert_called_once_with(mock_window)
 
 
@@ -649,7 +1470,7 @@ def test_selector_handle_sdl_event_display_added():
     sdl_display = MagicMock()
     selector = _Selector(_noop_poll)
     with patch("eplatform._event_loop.connect_display") as connect_display:
-        assert selector._EPlatformSelector__handle_sdl_event_display_added(sdl_display)
+        assert selector._EPlatformSelector__handle_sdl_event_display_added(5, sdl_display)
     connect_display.assert_called_once_with(sdl_display)
 
 
@@ -657,7 +1478,7 @@ def test_selector_handle_sdl_event_display_removed():
     sdl_display = MagicMock()
     selector = _Selector(_noop_poll)
     with patch("eplatform._event_loop.disconnect_display") as disconnect_display:
-        assert selector._EPlatformSelector__handle_sdl_event_display_removed(sdl_display)
+        assert selector._EPlatformSelector__handle_sdl_event_display_removed(5, sdl_display)
     disconnect_display.assert_called_once_with(sdl_display)
 
 
@@ -667,7 +1488,7 @@ def test_selector_handle_sdl_event_display_orientation():
     selector = _Selector(_noop_poll)
     with patch("eplatform._event_loop.change_display_orientation") as change_display_orientation:
         assert selector._EPlatformSelector__handle_sdl_event_display_orientation(
-            sdl_display, sdl_display_orientation
+            5, sdl_display, sdl_display_orientation
         )
     change_display_orientation.assert_called_once_with(sdl_display, sdl_display_orientation)
 
@@ -677,7 +1498,9 @@ def test_selector_handle_sdl_event_display_moved():
     position = MagicMock()
     selector = _Selector(_noop_poll)
     with patch("eplatform._event_loop.change_display_position") as change_display_position:
-        assert selector._EPlatformSelector__handle_sdl_event_display_moved(sdl_display, position)
+        assert selector._EPlatformSelector__handle_sdl_event_display_moved(
+            5, sdl_display, position
+        )
     change_display_position.assert_called_once_with(sdl_display, position)
 
 
@@ -691,7 +1514,7 @@ def test_EPlatformSelector__handle_sdl_event_current_mode_changed():
         patch("eplatform._event_loop.change_display_refresh_rate") as change_display_refresh_rate,
     ):
         assert selector._EPlatformSelector__handle_sdl_event_current_mode_changed(
-            sdl_display, size, refresh_rate
+            5, sdl_display, size, refresh_rate
         )
     change_display_size.assert_called_once_with(sdl_display, size)
     change_display_refresh_rate.assert_called_once_with(sdl_display, refresh_rate)
@@ -700,12 +1523,12 @@ def test_EPlatformSelector__handle_sdl_event_current_mode_changed():
 def test_selector_handle_sdl_event_window_maximized(mock_window):
     selector = _Selector(_noop_poll)
     with patch("eplatform._event_loop.maximize_window") as maximize_window:
-        assert selector._EPlatformSelector__handle_sdl_event_window_maximized()
-    maximize_window.assert_called_once_with(mock_window)
+        assert selector._EPlatformSelector__handle_sdl_event_window_maximized(5)
+    maximize_window.assert_called_once_with(mock_window, 5)
 
 
 def test_selector_handle_sdl_event_window_restored(mock_window):
     selector = _Selector(_noop_poll)
     with patch("eplatform._event_loop.unmaximize_window") as unmaximize_window:
-        assert selector._EPlatformSelector__handle_sdl_event_window_restored()
-    unmaximize_window.assert_called_once_with(mock_window)
+        assert selector._EPlatformSelector__handle_sdl_event_window_restored(5)
+    unmaximize_window.assert_called_once_with(mock_window, 5)
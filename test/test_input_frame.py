@@ -0,0 +1,123 @@
+import gc
+from weakref import ref
+
+from eplatform import InputFrame
+from eplatform import KeyboardKeyLocation
+from eplatform import MouseButtonLocation
+from eplatform import _eplatform
+from eplatform._input_frame import change_input_frame_input
+from eplatform._keyboard import change_key
+from eplatform._mouse import change_mouse_button
+
+
+class Input:
+    pass
+
+
+def test_default():
+    frame = InputFrame()
+    input = Input()
+    assert not frame.is_down(input)
+    assert not frame.went_down(input)
+    assert not frame.went_up(input)
+    assert frame.down == frozenset()
+
+
+def test_press_release():
+    frame = InputFrame()
+    input = Input()
+
+    change_input_frame_input(input, True)
+    assert not frame.is_down(input)
+    assert not frame.went_down(input)
+
+    frame.advance()
+    assert frame.is_down(input)
+    assert frame.went_down(input)
+    assert not frame.went_up(input)
+    assert frame.down == {input}
+
+    frame.advance()
+    assert frame.is_down(input)
+    assert not frame.went_down(input)
+    assert not frame.went_up(input)
+
+    change_input_frame_input(input, False)
+    frame.advance()
+    assert not frame.is_down(input)
+    assert not frame.went_down(input)
+    assert frame.went_up(input)
+
+    frame.advance()
+    assert not frame.is_down(input)
+    assert not frame.went_down(input)
+    assert not frame.went_up(input)
+
+
+def test_press_release_same_frame():
+    frame = InputFrame()
+    input = Input()
+    change_input_frame_input(input, True)
+    change_input_frame_input(input, False)
+    frame.advance()
+    assert not frame.is_down(input)
+    assert frame.went_down(input)
+    assert frame.went_up(input)
+
+
+def test_repeated_change():
+    frame = InputFrame()
+    input = Input()
+    change_input_frame_input(input, False)
+    frame.advance()
+    assert not frame.went_up(input)
+
+    change_input_frame_input(input, True)
+    frame.advance()
+    change_input_frame_input(input, True)
+    frame.advance()
+    assert frame.is_down(input)
+    assert not frame.went_down(input)
+
+
+def test_multiple_frames():
+    frame_a = InputFrame()
+    frame_b = InputFrame()
+    input = Input()
+    change_input_frame_input(input, True)
+    frame_a.advance()
+    assert frame_a.went_down(input)
+    assert not frame_b.is_down(input)
+    frame_b.advance()
+    assert frame_b.went_down(input)
+
+
+def test_collected_frame():
+    frame = InputFrame()
+    frame_ref = ref(frame)
+    del frame
+    gc.collect()
+    assert frame_ref() is None
+    change_input_frame_input(Input(), True)
+
+
+def test_keyboard(keyboard):
+    frame = InputFrame()
+    key = keyboard.get_key_by_location(KeyboardKeyLocation.A)
+    change_key(keyboard, _eplatform.SDL_SCANCODE_A, True, False, _eplatform.SDL_KMOD_NONE, 0)
+    frame.advance()
+    assert frame.went_down(key)
+    change_key(keyboard, _eplatform.SDL_SCANCODE_A, False, False, _eplatform.SDL_KMOD_NONE, 0)
+    frame.advance()
+    assert frame.went_up(key)
+
+
+def test_mouse(mouse):
+    frame = InputFrame()
+    button = mouse.get_button(MouseButtonLocation.LEFT)
+    change_mouse_button(mouse, _eplatform.SDL_BUTTON_LEFT, True, 0)
+    frame.advance()
+    assert frame.went_down(button)
+    change_mouse_button(mouse, _eplatform.SDL_BUTTON_LEFT, False, 0)
+    frame.advance()
+    assert frame.went_up(button)
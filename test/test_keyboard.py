@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
@@ -8,8 +9,13 @@ from eplatform import Keyboard
 from eplatform import KeyboardKey
 from eplatform import KeyboardKeyLocation
 from eplatform import KeyboardModifier
+from eplatform import KeyboardShortcut
+from eplatform import KeyboardState
+from eplatform import Platform
 from eplatform import _eplatform
+from eplatform import get_keyboard
 from eplatform._keyboard import change_key
+from eplatform._keyboard import remap_keyboard
 
 SDL_SCANCODE_KEYBOARD_KEY_LOCATION = (
     # number
@@ -280,7 +286,18 @@ def test_attrs(keyboard):
 
 @pytest.mark.parametrize("is_pressed", [False, True])
 @pytest.mark.parametrize("is_repeat", [False, True])
-def test_change_key(keyboard, is_pressed, is_repeat):
+@pytest.mark.parametrize(
+    "sdl_keymod, expected_modifier",
+    [
+        (_eplatform.SDL_KMOD_NONE, KeyboardModifier.NONE),
+        (_eplatform.SDL_KMOD_LCTRL, KeyboardModifier.CONTROL),
+        (
+            _eplatform.SDL_KMOD_RSHIFT | _eplatform.SDL_KMOD_CAPS,
+            KeyboardModifier.SHIFT | KeyboardModifier.CAPS_LOCK,
+        ),
+    ],
+)
+def test_change_key(keyboard, is_pressed, is_repeat, sdl_keymod, expected_modifier):
     for sdl_scancode, key_location in SDL_SCANCODE_KEYBOARD_KEY_LOCATION:
         key = keyboard.get_key_by_location(key_location)
         with (
@@ -291,19 +308,8 @@ def test_change_key(keyboard, is_pressed, is_repeat):
             patch.object(key, "pressed", new=MagicMock()) as key_pressed,
             patch.object(key, "released", new=MagicMock()) as key_released,
         ):
-            assert change_key(keyboard, sdl_scancode, is_pressed, is_repeat)
-
-        expected_modifier = KeyboardModifier.NONE
-        if is_pressed:
-            if key_location in {
-                KeyboardKeyLocation.LEFT_CONTROL,
-                KeyboardKeyLocation.RIGHT_CONTROL,
-            }:
-                expected_modifier |= KeyboardModifier.CONTROL
-            elif key_location in {KeyboardKeyLocation.LEFT_SHIFT, KeyboardKeyLocation.RIGHT_SHIFT}:
-                expected_modifier |= KeyboardModifier.SHIFT
-            elif key_location in {KeyboardKeyLocation.LEFT_ALT, KeyboardKeyLocation.RIGHT_ALT}:
-                expected_modifier |= KeyboardModifier.ALT
+            assert change_key(keyboard, sdl_scancode, is_pressed, is_repeat, sdl_keymod, 5)
+        logical_location = keyboard.get_logical_location(key_location)
 
         keyboard_key_changed.assert_called_once_with(
             {
@@ -311,6 +317,8 @@ def test_change_key(keyboard, is_pressed, is_repeat):
                 "is_pressed": is_pressed,
                 "is_repeat": is_repeat,
                 "modifier": expected_modifier,
+                "logical_location": logical_location,
+                "timestamp": 5,
             }
         )
         key_changed.assert_called_once_with(
@@ -319,6 +327,8 @@ def test_change_key(keyboard, is_pressed, is_repeat):
                 "is_pressed": is_pressed,
                 "is_repeat": is_repeat,
                 "modifier": expected_modifier,
+                "logical_location": logical_location,
+                "timestamp": 5,
             }
         )
         if is_pressed:
@@ -328,6 +338,8 @@ def test_change_key(keyboard, is_pressed, is_repeat):
                     "is_pressed": is_pressed,
                     "is_repeat": is_repeat,
                     "modifier": expected_modifier,
+                    "logical_location": logical_location,
+                    "timestamp": 5,
                 }
             )
             key_pressed.assert_called_once_with(
@@ -336,6 +348,8 @@ def test_change_key(keyboard, is_pressed, is_repeat):
                     "is_pressed": is_pressed,
                     "is_repeat": is_repeat,
                     "modifier": expected_modifier,
+                    "logical_location": logical_location,
+                    "timestamp": 5,
                 }
             )
         else:
@@ -345,6 +359,8 @@ def test_change_key(keyboard, is_pressed, is_repeat):
                     "is_pressed": is_pressed,
                     "is_repeat": is_repeat,
                     "modifier": expected_modifier,
+                    "logical_location": logical_location,
+                    "timestamp": 5,
                 }
             )
             key_released.assert_called_once_with(
@@ -353,70 +369,61 @@ def test_change_key(keyboard, is_pressed, is_repeat):
                     "is_pressed": is_pressed,
                     "is_repeat": is_repeat,
                     "modifier": expected_modifier,
+                    "logical_location": logical_location,
+                    "timestamp": 5,
                 }
             )
         assert key.is_pressed == is_pressed
+        assert keyboard.modifier == expected_modifier
 
-        change_key(keyboard, sdl_scancode, False, False)
+        change_key(keyboard, sdl_scancode, False, False, _eplatform.SDL_KMOD_NONE, 5)
 
 
-def test_modifier(keyboard):
+@pytest.mark.parametrize(
+    "sdl_keymod, expected_modifier",
+    [
+        (_eplatform.SDL_KMOD_NONE, KeyboardModifier.NONE),
+        (_eplatform.SDL_KMOD_LCTRL, KeyboardModifier.CONTROL),
+        (_eplatform.SDL_KMOD_RCTRL, KeyboardModifier.CONTROL),
+        (_eplatform.SDL_KMOD_LSHIFT, KeyboardModifier.SHIFT),
+        (_eplatform.SDL_KMOD_RSHIFT, KeyboardModifier.SHIFT),
+        (_eplatform.SDL_KMOD_LALT, KeyboardModifier.ALT),
+        (_eplatform.SDL_KMOD_RALT, KeyboardModifier.ALT),
+        (_eplatform.SDL_KMOD_LGUI, KeyboardModifier.GUI),
+        (_eplatform.SDL_KMOD_RGUI, KeyboardModifier.GUI),
+        (_eplatform.SDL_KMOD_CAPS, KeyboardModifier.CAPS_LOCK),
+        (_eplatform.SDL_KMOD_NUM, KeyboardModifier.NUM_LOCK),
+        (
+            _eplatform.SDL_KMOD_CTRL | _eplatform.SDL_KMOD_SHIFT | _eplatform.SDL_KMOD_ALT,
+            KeyboardModifier.CONTROL | KeyboardModifier.SHIFT | KeyboardModifier.ALT,
+        ),
+    ],
+)
+def test_modifier(keyboard, sdl_keymod, expected_modifier):
     assert keyboard.modifier == KeyboardModifier.NONE
-    keyboard.get_key_by_location(KeyboardKeyLocation.LEFT_CONTROL).is_pressed = True
-    assert keyboard.modifier == KeyboardModifier.CONTROL
-    keyboard.get_key_by_location(KeyboardKeyLocation.LEFT_SHIFT).is_pressed = True
-    assert keyboard.modifier == KeyboardModifier.CONTROL | KeyboardModifier.SHIFT
-    keyboard.get_key_by_location(KeyboardKeyLocation.LEFT_ALT).is_pressed = True
-    assert (
-        keyboard.modifier
-        == KeyboardModifier.CONTROL | KeyboardModifier.SHIFT | KeyboardModifier.ALT
-    )
-    keyboard.get_key_by_location(KeyboardKeyLocation.RIGHT_CONTROL).is_pressed = True
-    assert (
-        keyboard.modifier
-        == KeyboardModifier.CONTROL | KeyboardModifier.SHIFT | KeyboardModifier.ALT
-    )
-    keyboard.get_key_by_location(KeyboardKeyLocation.RIGHT_SHIFT).is_pressed = True
-    assert (
-        keyboard.modifier
-        == KeyboardModifier.CONTROL | KeyboardModifier.SHIFT | KeyboardModifier.ALT
-    )
-    keyboard.get_key_by_location(KeyboardKeyLocation.RIGHT_ALT).is_pressed = True
-    assert (
-        keyboard.modifier
-        == KeyboardModifier.CONTROL | KeyboardModifier.SHIFT | KeyboardModifier.ALT
-    )
-    keyboard.get_key_by_location(KeyboardKeyLocation.LEFT_CONTROL).is_pressed = False
-    assert (
-        keyboard.modifier
-        == KeyboardModifier.CONTROL | KeyboardModifier.SHIFT | KeyboardModifier.ALT
-    )
-    keyboard.get_key_by_location(KeyboardKeyLocation.LEFT_SHIFT).is_pressed = False
-    assert (
-        keyboard.modifier
-        == KeyboardModifier.CONTROL | KeyboardModifier.SHIFT | KeyboardModifier.ALT
-    )
-    keyboard.get_key_by_location(KeyboardKeyLocation.LEFT_ALT).is_pressed = False
-    assert (
-        keyboard.modifier
-        == KeyboardModifier.CONTROL | KeyboardModifier.SHIFT | KeyboardModifier.ALT
-    )
-    keyboard.get_key_by_location(KeyboardKeyLocation.RIGHT_CONTROL).is_pressed = False
-    assert keyboard.modifier == KeyboardModifier.SHIFT | KeyboardModifier.ALT
-    keyboard.get_key_by_location(KeyboardKeyLocation.RIGHT_SHIFT).is_pressed = False
-    assert keyboard.modifier == KeyboardModifier.ALT
-    keyboard.get_key_by_location(KeyboardKeyLocation.RIGHT_ALT).is_pressed = False
+    change_key(keyboard, _eplatform.SDL_SCANCODE_A, True, False, sdl_keymod, 5)
+    assert keyboard.modifier == expected_modifier
+    change_key(keyboard, _eplatform.SDL_SCANCODE_A, False, False, _eplatform.SDL_KMOD_NONE, 5)
     assert keyboard.modifier == KeyboardModifier.NONE
 
 
+def test_modifier_unexpected_sdl_scancode(keyboard):
+    assert not change_key(keyboard, -1, True, False, _eplatform.SDL_KMOD_LCTRL, 5)
+    assert keyboard.modifier == KeyboardModifier.CONTROL
+    change_key(keyboard, -1, False, False, _eplatform.SDL_KMOD_NONE, 5)
+
+
 @pytest.mark.parametrize("is_pressed", [False, True])
-def test_change_key_unexpected_sdl_scancode(keyboard, is_pressed):
+@pytest.mark.parametrize("sdl_scancode", [-1, 0, 10000])
+def test_change_key_unexpected_sdl_scancode(keyboard, is_pressed, sdl_scancode):
     with (
         patch.object(KeyboardKey, "changed", new=MagicMock()) as keyboard_key_changed,
         patch.object(KeyboardKey, "pressed", new=MagicMock()) as keyboard_key_pressed,
         patch.object(KeyboardKey, "released", new=MagicMock()) as keyboard_key_released,
     ):
-        assert not change_key(keyboard, -1, is_pressed, False)
+        assert not change_key(
+            keyboard, sdl_scancode, is_pressed, False, _eplatform.SDL_KMOD_NONE, 5
+        )
     keyboard_key_changed.assert_not_called()
     keyboard_key_pressed.assert_not_called()
     keyboard_key_released.assert_not_called()
@@ -426,3 +433,372 @@ def test_key_repr(keyboard):
     for key_location in KeyboardKeyLocation:
         key = keyboard.get_key_by_location(key_location)
         assert repr(key) == f"<KeyboardKey {key_location.value!r}>"
+
+
+def test_state(keyboard):
+    state = keyboard.state
+    assert isinstance(state, KeyboardState)
+    assert keyboard.state is state
+    buffer = state.buffer
+    assert buffer.readonly
+    for sdl_scancode, key_location in SDL_SCANCODE_KEYBOARD_KEY_LOCATION:
+        assert sdl_scancode < len(buffer)
+        assert state[key_location] == bool(buffer[sdl_scancode])
+
+
+def test_snapshot(keyboard):
+    snapshot = keyboard.snapshot()
+    assert isinstance(snapshot, KeyboardState)
+    assert snapshot is not keyboard.state
+    assert snapshot.buffer.tobytes() == keyboard.state.buffer.tobytes()
+
+
+def test_state_buffer():
+    buffer = bytearray(512)
+    state = KeyboardState(buffer)
+    assert state.get_pressed() == set()
+    for sdl_scancode, key_location in SDL_SCANCODE_KEYBOARD_KEY_LOCATION:
+        assert not state[key_location]
+        buffer[sdl_scancode] = 1
+        assert state[key_location]
+        assert state.get_pressed() == {key_location}
+        buffer[sdl_scancode] = 0
+
+
+def _press(keyboard, sdl_scancode, sdl_keymod, timestamp):
+    change_key(keyboard, sdl_scancode, True, False, sdl_keymod, timestamp)
+    change_key(keyboard, sdl_scancode, False, False, sdl_keymod, timestamp)
+
+
+def test_shortcut():
+    shortcut = KeyboardShortcut((KeyboardKeyLocation.S, KeyboardModifier.CONTROL))
+    assert shortcut.strokes == ((KeyboardKeyLocation.S, KeyboardModifier.CONTROL),)
+    assert isinstance(KeyboardShortcut.activated, Event)
+    assert isinstance(shortcut.activated, Event)
+
+
+def test_shortcut_no_strokes():
+    with pytest.raises(ValueError) as excinfo:
+        KeyboardShortcut()
+    assert str(excinfo.value) == "shortcut must have at least one stroke"
+
+
+@pytest.mark.parametrize("modifier", [KeyboardModifier.CAPS_LOCK, KeyboardModifier.NUM_LOCK])
+def test_shortcut_lock_modifier(modifier):
+    with pytest.raises(ValueError) as excinfo:
+        KeyboardShortcut((KeyboardKeyLocation.S, KeyboardModifier.CONTROL | modifier))
+    assert str(excinfo.value) == "shortcut modifier may only be control, alt, shift or gui"
+
+
+def test_shortcut_timeout(keyboard):
+    assert keyboard.shortcut_timeout == 1.0
+    keyboard.shortcut_timeout = 0.5
+    assert keyboard.shortcut_timeout == 0.5
+    with pytest.raises(ValueError) as excinfo:
+        keyboard.shortcut_timeout = -1
+    assert str(excinfo.value) == "shortcut timeout must be 0 or greater"
+    assert keyboard.shortcut_timeout == 0.5
+
+
+def test_add_remove_shortcut(keyboard):
+    shortcut = KeyboardShortcut((KeyboardKeyLocation.S, KeyboardModifier.CONTROL))
+    keyboard.add_shortcut(shortcut)
+    with pytest.raises(ValueError) as excinfo:
+        keyboard.add_shortcut(KeyboardShortcut(*shortcut.strokes))
+    assert str(excinfo.value) == "shortcut strokes are already bound"
+
+    with pytest.raises(ValueError) as excinfo:
+        keyboard.remove_shortcut(KeyboardShortcut(*shortcut.strokes))
+    assert str(excinfo.value) == "shortcut is not bound"
+
+    keyboard.remove_shortcut(shortcut)
+    with pytest.raises(ValueError) as excinfo:
+        keyboard.remove_shortcut(shortcut)
+    assert str(excinfo.value) == "shortcut is not bound"
+
+    with patch.object(shortcut, "activated", new=MagicMock()) as activated:
+        _press(keyboard, _eplatform.SDL_SCANCODE_S, _eplatform.SDL_KMOD_LCTRL, 0)
+    activated.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "sdl_keymod",
+    [
+        _eplatform.SDL_KMOD_LCTRL,
+        _eplatform.SDL_KMOD_RCTRL,
+        _eplatform.SDL_KMOD_LCTRL | _eplatform.SDL_KMOD_CAPS,
+        _eplatform.SDL_KMOD_LCTRL | _eplatform.SDL_KMOD_NUM,
+    ],
+)
+def test_shortcut_activated(keyboard, sdl_keymod):
+    shortcut = KeyboardShortcut((KeyboardKeyLocation.S, KeyboardModifier.CONTROL))
+    keyboard.add_shortcut(shortcut)
+    with (
+        patch.object(KeyboardShortcut, "activated", new=MagicMock()) as keyboard_activated,
+        patch.object(shortcut, "activated", new=MagicMock()) as activated,
+    ):
+        _press(keyboard, _eplatform.SDL_SCANCODE_S, _eplatform.SDL_KMOD_NONE, 1)
+        _press(keyboard, _eplatform.SDL_SCANCODE_S, _eplatform.SDL_KMOD_LSHIFT, 2)
+        change_key(keyboard, _eplatform.SDL_SCANCODE_S, True, True, sdl_keymod, 3)
+        _press(keyboard, _eplatform.SDL_SCANCODE_S, sdl_keymod, 4)
+    keyboard_activated.assert_called_once_with({"shortcut": shortcut, "timestamp": 4})
+    activated.assert_called_once_with({"shortcut": shortcut, "timestamp": 4})
+
+
+def test_shortcut_chord(keyboard):
+    shortcut = KeyboardShortcut(
+        (KeyboardKeyLocation.K, KeyboardModifier.CONTROL),
+        (KeyboardKeyLocation.C, KeyboardModifier.CONTROL),
+    )
+    keyboard.add_shortcut(shortcut)
+    ctrl = _eplatform.SDL_KMOD_LCTRL
+    with patch.object(shortcut, "activated", new=MagicMock()) as activated:
+        _press(keyboard, _eplatform.SDL_SCANCODE_C, ctrl, 0)
+        activated.assert_not_called()
+
+        _press(keyboard, _eplatform.SDL_SCANCODE_K, ctrl, 0)
+        _press(keyboard, _eplatform.SDL_SCANCODE_LCTRL, ctrl, 1)
+        _press(keyboard, _eplatform.SDL_SCANCODE_C, ctrl, 2)
+        activated.assert_called_once_with({"shortcut": shortcut, "timestamp": 2})
+        activated.reset_mock()
+
+        _press(keyboard, _eplatform.SDL_SCANCODE_K, ctrl, 3)
+        _press(keyboard, _eplatform.SDL_SCANCODE_X, ctrl, 4)
+        _press(keyboard, _eplatform.SDL_SCANCODE_C, ctrl, 5)
+        activated.assert_not_called()
+
+        _press(keyboard, _eplatform.SDL_SCANCODE_K, ctrl, 6)
+        _press(keyboard, _eplatform.SDL_SCANCODE_K, ctrl, 7)
+        _press(keyboard, _eplatform.SDL_SCANCODE_C, ctrl, 8)
+        activated.assert_called_once_with({"shortcut": shortcut, "timestamp": 8})
+
+
+def test_shortcut_chord_timeout(keyboard):
+    shortcut = KeyboardShortcut(
+        (KeyboardKeyLocation.K, KeyboardModifier.CONTROL),
+        (KeyboardKeyLocation.C, KeyboardModifier.NONE),
+    )
+    keyboard.add_shortcut(shortcut)
+    keyboard.shortcut_timeout = 0.5
+    with patch.object(shortcut, "activated", new=MagicMock()) as activated:
+        _press(keyboard, _eplatform.SDL_SCANCODE_K, _eplatform.SDL_KMOD_LCTRL, 0)
+        _press(keyboard, _eplatform.SDL_SCANCODE_C, _eplatform.SDL_KMOD_NONE, 500_000_001)
+        activated.assert_not_called()
+
+        _press(keyboard, _eplatform.SDL_SCANCODE_K, _eplatform.SDL_KMOD_LCTRL, 0)
+        _press(keyboard, _eplatform.SDL_SCANCODE_C, _eplatform.SDL_KMOD_NONE, 500_000_000)
+        activated.assert_called_once_with({"shortcut": shortcut, "timestamp": 500_000_000})
+
+
+@pytest.mark.parametrize(
+    "key_location",
+    [
+        KeyboardKeyLocation.A,
+        KeyboardKeyLocation.Z,
+        KeyboardKeyLocation.ZERO,
+        KeyboardKeyLocation.SPACE,
+        KeyboardKeyLocation.ENTER,
+        KeyboardKeyLocation.ESCAPE,
+        KeyboardKeyLocation.LEFT_SHIFT,
+        KeyboardKeyLocation.F1,
+        KeyboardKeyLocation.NUMPAD_ENTER,
+    ],
+)
+def test_logical_location(keyboard, key_location):
+    assert keyboard.get_logical_location(key_location) == key_location
+
+
+def test_remap_keyboard(keyboard):
+    sdl_keycodes = list(_eplatform.get_sdl_keycodes())
+    # azerty
+    sdl_keycodes[_eplatform.SDL_SCANCODE_Q] = ord("a")
+    sdl_keycodes[_eplatform.SDL_SCANCODE_A] = ord("q")
+    sdl_keycodes[_eplatform.SDL_SCANCODE_M] = ord(",")
+    sdl_keycodes[_eplatform.SDL_SCANCODE_SEMICOLON] = ord("m")
+    sdl_keycodes[_eplatform.SDL_SCANCODE_2] = ord("é")
+    sdl_keycodes[_eplatform.SDL_SCANCODE_CAPSLOCK] = (
+        _eplatform.SDL_SCANCODE_LSHIFT | _eplatform.SDLK_SCANCODE_MASK
+    )
+    with patch("eplatform._keyboard.get_sdl_keycodes", return_value=tuple(sdl_keycodes)):
+        remap_keyboard(keyboard)
+    assert keyboard.get_logical_location(KeyboardKeyLocation.Q) == KeyboardKeyLocation.A
+    assert keyboard.get_logical_location(KeyboardKeyLocation.A) == KeyboardKeyLocation.Q
+    assert keyboard.get_logical_location(KeyboardKeyLocation.M) == KeyboardKeyLocation.COMMA
+    assert keyboard.get_logical_location(KeyboardKeyLocation.SEMICOLON) == KeyboardKeyLocation.M
+    assert keyboard.get_logical_location(KeyboardKeyLocation.TWO) is None
+    assert (
+        keyboard.get_logical_location(KeyboardKeyLocation.CAPSLOCK)
+        == KeyboardKeyLocation.LEFT_SHIFT
+    )
+    assert keyboard.get_logical_location(KeyboardKeyLocation.Z) == KeyboardKeyLocation.Z
+
+    with patch.object(KeyboardKey, "pressed", new=MagicMock()) as keyboard_key_pressed:
+        change_key(keyboard, _eplatform.SDL_SCANCODE_Q, True, False, _eplatform.SDL_KMOD_NONE, 5)
+    keyboard_key_pressed.assert_called_once_with(
+        {
+            "key": keyboard.get_key_by_location(KeyboardKeyLocation.Q),
+            "is_pressed": True,
+            "is_repeat": False,
+            "modifier": KeyboardModifier.NONE,
+            "logical_location": KeyboardKeyLocation.A,
+            "timestamp": 5,
+        }
+    )
+    change_key(keyboard, _eplatform.SDL_SCANCODE_Q, False, False, _eplatform.SDL_KMOD_NONE, 5)
+
+    remap_keyboard(keyboard)
+    assert keyboard.get_logical_location(KeyboardKeyLocation.Q) == KeyboardKeyLocation.Q
+
+
+def test_key_repeat_defaults(keyboard):
+    assert keyboard.key_repeat is None
+    for key_location in KeyboardKeyLocation:
+        key = keyboard.get_key_by_location(key_location)
+        assert key.repeat_delay is None
+        assert key.repeat_interval is None
+
+
+@pytest.mark.parametrize(
+    "delay, interval, expected_message",
+    [
+        (-1, 1, "key repeat delay must be 0 or greater"),
+        (0, 0, "key repeat interval must be greater than 0"),
+        (0, -1, "key repeat interval must be greater than 0"),
+    ],
+)
+def test_key_repeat_invalid(keyboard, delay, interval, expected_message):
+    with pytest.raises(ValueError) as excinfo:
+        keyboard.enable_key_repeat(delay, interval)
+    assert str(excinfo.value) == expected_message
+    assert keyboard.key_repeat is None
+
+    key = keyboard.get_key_by_location(KeyboardKeyLocation.A)
+    with pytest.raises(ValueError) as excinfo:
+        key.set_repeat(delay, interval)
+    assert str(excinfo.value) == expected_message
+    assert key.repeat_delay is None
+    assert key.repeat_interval is None
+
+
+def test_set_key_repeat(keyboard):
+    key = keyboard.get_key_by_location(KeyboardKeyLocation.A)
+    key.set_repeat(0.1, None)
+    assert key.repeat_delay == 0.1
+    assert key.repeat_interval is None
+    key.set_repeat(None, 0.2)
+    assert key.repeat_delay is None
+    assert key.repeat_interval == 0.2
+
+
+def test_enable_disable_key_repeat(keyboard):
+    with patch("eplatform._keyboard.set_sdl_key_repeat_enabled") as set_sdl_key_repeat_enabled:
+        keyboard.enable_key_repeat(0.5, 0.1)
+        assert keyboard.key_repeat == (0.5, 0.1)
+        set_sdl_key_repeat_enabled.assert_called_once_with(False)
+        set_sdl_key_repeat_enabled.reset_mock()
+
+        keyboard.disable_key_repeat()
+        assert keyboard.key_repeat is None
+        set_sdl_key_repeat_enabled.assert_called_once_with(True)
+
+
+def test_key_repeat_suppresses_sdl_repeat(keyboard):
+    sdl_keymod = _eplatform.SDL_KMOD_NONE
+    keyboard.enable_key_repeat(0.5, 0.1)
+    _eplatform.clear_sdl_events()
+    _eplatform.push_sdl_event(
+        _eplatform.SDL_EVENT_KEY_DOWN, _eplatform.SDL_SCANCODE_A, True, True, sdl_keymod
+    )
+    assert _eplatform.get_sdl_events(1) == []
+    _eplatform.push_sdl_event(
+        _eplatform.SDL_EVENT_KEY_DOWN, _eplatform.SDL_SCANCODE_A, True, False, sdl_keymod
+    )
+    assert [e[0] for e in _eplatform.get_sdl_events(1)] == [_eplatform.SDL_EVENT_KEY_DOWN]
+
+    keyboard.disable_key_repeat()
+    _eplatform.push_sdl_event(
+        _eplatform.SDL_EVENT_KEY_DOWN, _eplatform.SDL_SCANCODE_A, True, True, sdl_keymod
+    )
+    assert [e[0] for e in _eplatform.get_sdl_events(1)] == [_eplatform.SDL_EVENT_KEY_DOWN]
+
+
+@pytest.mark.parametrize("is_key_override", [False, True])
+def test_key_repeat(keyboard, is_key_override):
+    sdl_keymod = _eplatform.SDL_KMOD_NONE
+    a = keyboard.get_key_by_location(KeyboardKeyLocation.A)
+    b = keyboard.get_key_by_location(KeyboardKeyLocation.B)
+    if is_key_override:
+        keyboard.enable_key_repeat(10, 10)
+        a.set_repeat(0.05, 0.02)
+        b.set_repeat(0.05, 0.02)
+    else:
+        keyboard.enable_key_repeat(0.05, 0.02)
+
+    def get_repeats(key):
+        return [
+            c.args[0]
+            for c in keyboard_key_pressed.call_args_list
+            if c.args[0]["key"] is key and c.args[0]["is_repeat"]
+        ]
+
+    async def test():
+        change_key(keyboard, _eplatform.SDL_SCANCODE_A, True, False, sdl_keymod, 1)
+        await asyncio.sleep(0.03)
+        assert get_repeats(a) == []
+        await asyncio.sleep(0.07)
+        repeats = get_repeats(a)
+        assert repeats
+        assert all(r["timestamp"] == 99 for r in repeats)
+
+        # pressing another key takes over the repeat
+        change_key(keyboard, _eplatform.SDL_SCANCODE_B, True, False, sdl_keymod, 2)
+        a_repeat_count = len(get_repeats(a))
+        change_key(keyboard, _eplatform.SDL_SCANCODE_A, False, False, sdl_keymod, 3)
+        await asyncio.sleep(0.1)
+        assert len(get_repeats(a)) == a_repeat_count
+        assert len(get_repeats(b)) >= 1
+
+        change_key(keyboard, _eplatform.SDL_SCANCODE_B, False, False, sdl_keymod, 4)
+        b_repeat_count = len(get_repeats(b))
+        await asyncio.sleep(0.1)
+        assert len(get_repeats(b)) == b_repeat_count
+
+    with (
+        patch.object(KeyboardKey, "pressed", new=MagicMock()) as keyboard_key_pressed,
+        patch("eplatform._keyboard.get_sdl_ticks_ns", return_value=99),
+    ):
+        asyncio.run(test())
+    keyboard.disable_key_repeat()
+
+
+def test_key_repeat_filter_set_twice(keyboard):
+    sdl_keymod = _eplatform.SDL_KMOD_NONE
+    _eplatform.set_sdl_key_repeat_enabled(False)
+    _eplatform.set_sdl_key_repeat_enabled(False)
+    _eplatform.clear_sdl_events()
+    _eplatform.push_sdl_event(
+        _eplatform.SDL_EVENT_KEY_DOWN, _eplatform.SDL_SCANCODE_A, True, True, sdl_keymod
+    )
+    assert _eplatform.get_sdl_events(1) == []
+
+    # the filter is only replaced once, so a single enable restores the filter it replaced
+    _eplatform.set_sdl_key_repeat_enabled(True)
+    _eplatform.push_sdl_event(
+        _eplatform.SDL_EVENT_KEY_DOWN, _eplatform.SDL_SCANCODE_A, True, True, sdl_keymod
+    )
+    assert [e[0] for e in _eplatform.get_sdl_events(1)] == [_eplatform.SDL_EVENT_KEY_DOWN]
+
+
+def test_key_repeat_filter_removed_on_exit():
+    with Platform():
+        get_keyboard().enable_key_repeat(0.5, 0.1)
+    with Platform():
+        _eplatform.clear_sdl_events()
+        _eplatform.push_sdl_event(
+            _eplatform.SDL_EVENT_KEY_DOWN,
+            _eplatform.SDL_SCANCODE_A,
+            True,
+            True,
+            _eplatform.SDL_KMOD_NONE,
+        )
+        assert [e[0] for e in _eplatform.get_sdl_events(1)] == [_eplatform.SDL_EVENT_KEY_DOWN]
@@ -3,10 +3,17 @@ from unittest.mock import patch
 
 import pytest
 from eevent import Event
+from emath import DVector2
+from emath import DVector2Array
 from emath import IVector2
+from emath import U8Vector4
+from emath import U8Vector4Array
 
 from eplatform import MouseButton
 from eplatform import MouseButtonLocation
+from eplatform import MouseCursorImage
+from eplatform import MouseCursorShape
+from eplatform import MouseMotionHistory
 from eplatform import _eplatform
 from eplatform._mouse import Mouse
 from eplatform._mouse import change_mouse_button
@@ -15,8 +22,11 @@ from eplatform._mouse import scroll_mouse_wheel
 
 
 def test_attrs(mouse, window):
-    assert mouse.position == IVector2(0, 0)
-    mouse._position = IVector2(10, 10)
+    assert mouse.position == DVector2(0, 0)
+    mouse._position = DVector2(10, 10)
+    assert not mouse.is_relative_mode
+    assert mouse.cursor == MouseCursorShape.DEFAULT
+    assert mouse.cursor_cache_capacity == 32
 
     assert isinstance(Mouse.moved, Event)
     assert isinstance(mouse.moved, Event)
@@ -46,26 +56,136 @@ def test_attrs(mouse, window):
         assert isinstance(button, MouseButton)
         assert button.location == button_location
         assert not button.is_pressed
+        assert button.pressed_timestamp is None
         assert isinstance(button.changed, Event)
         assert isinstance(button.released, Event)
         assert isinstance(button.pressed, Event)
 
 
-@pytest.mark.parametrize("position", [IVector2(0, 0), IVector2(-1, 4)])
-@pytest.mark.parametrize("delta", [IVector2(2, -3), IVector2(-1, 4)])
+@pytest.mark.parametrize("position", [DVector2(0, 0), DVector2(-1, 4.5)])
+@pytest.mark.parametrize("delta", [DVector2(2, -3), DVector2(-0.25, 4)])
 def test_move(window, mouse, position, delta):
     with (
         patch.object(Mouse, "moved", new=MagicMock()) as mouse_moved,
         patch.object(mouse, "moved", new=MagicMock()) as moved,
     ):
-        change_mouse_position(mouse, position, delta)
-    mouse_moved.assert_called_once_with({"position": position, "delta": delta})
-    moved.assert_called_once_with({"position": position, "delta": delta})
+        change_mouse_position(mouse, position, delta, 5)
+    event_data = {"position": position, "delta": delta, "timestamp": 5}
+    mouse_moved.assert_called_once_with(event_data)
+    moved.assert_called_once_with(event_data)
     assert mouse.position == position
 
 
-@pytest.mark.parametrize("x", [-1, 0, 1])
-@pytest.mark.parametrize("y", [-1, 0, 1])
+def test_move_samples(window, mouse):
+    samples = DVector2Array(DVector2(0, 0), DVector2(1, 1))
+    with patch.object(mouse, "moved", new=MagicMock()) as moved:
+        change_mouse_position(mouse, DVector2(1, 1), DVector2(1, 1), 5, samples, (4, 5))
+    moved.assert_called_once_with(
+        {
+            "position": DVector2(1, 1),
+            "delta": DVector2(1, 1),
+            "timestamp": 5,
+            "samples": samples,
+            "sample_timestamps": (4, 5),
+        }
+    )
+    assert mouse.position == DVector2(1, 1)
+
+
+def test_relative_mode(window, mouse):
+    change_mouse_position(mouse, DVector2(1, 1), DVector2(1, 1), 5)
+    assert mouse.take_relative_delta() == DVector2(0)
+
+    mouse.enable_relative_mode()
+    assert mouse.is_relative_mode
+    change_mouse_position(mouse, DVector2(1, 1), DVector2(0.5, -1), 5)
+    change_mouse_position(mouse, DVector2(1, 1), DVector2(0.25, 3), 5)
+    assert mouse.take_relative_delta() == DVector2(0.75, 2)
+    assert mouse.take_relative_delta() == DVector2(0)
+
+    change_mouse_position(mouse, DVector2(1, 1), DVector2(1, 1), 5)
+    mouse.disable_relative_mode()
+    assert not mouse.is_relative_mode
+    assert mouse.take_relative_delta() == DVector2(0)
+    mouse.disable_relative_mode()
+
+
+@pytest.mark.parametrize("capacity", [-1, 0])
+def test_motion_history_invalid_capacity(capacity):
+    with pytest.raises(ValueError) as excinfo:
+        MouseMotionHistory(capacity)
+    assert str(excinfo.value) == "motion history capacity must be greater than 0"
+
+
+def test_motion_history(window, mouse):
+    assert mouse.motion_history is None
+    history = mouse.enable_motion_history(3)
+    assert mouse.motion_history is history
+    assert history.capacity == 3
+    assert len(history) == 0
+    assert history.get_velocity(1_000_000_000) == DVector2(0)
+    assert history.get_path(0) == DVector2Array()
+
+    change_mouse_position(mouse, DVector2(0, 0), DVector2(0, 0), 0)
+    assert len(history) == 1
+    assert history.get_velocity(1_000_000_000) == DVector2(0)
+
+    change_mouse_position(mouse, DVector2(1, 2), DVector2(1, 2), 500_000_000)
+    change_mouse_position(mouse, DVector2(2, 4), DVector2(1, 2), 1_000_000_000)
+    assert history.get_velocity(1_000_000_000) == DVector2(2, 4)
+    assert history.get_velocity(500_000_000) == DVector2(2, 4)
+    assert history.get_velocity(0) == DVector2(2, 4)
+    assert history.get_path(0) == DVector2Array(DVector2(0, 0), DVector2(1, 2), DVector2(2, 4))
+    assert history.get_path(500_000_000) == DVector2Array(DVector2(1, 2), DVector2(2, 4))
+    assert history.get_path(500_000_001) == DVector2Array(DVector2(2, 4))
+    assert history.get_path(1_000_000_001) == DVector2Array()
+
+    samples = DVector2Array(DVector2(3, 3), DVector2(4, 4))
+    change_mouse_position(
+        mouse,
+        DVector2(4, 4),
+        DVector2(2, 0),
+        1_500_000_000,
+        samples,
+        (1_250_000_000, 1_500_000_000),
+    )
+    assert len(history) == 3
+    assert history.get_path(0) == DVector2Array(DVector2(2, 4), DVector2(3, 3), DVector2(4, 4))
+    # each coalesced sample is recorded at its own time
+    assert [history._get_timestamp(i) for i in range(3)] == [
+        1_000_000_000,
+        1_250_000_000,
+        1_500_000_000,
+    ]
+    assert history.get_path(1_250_000_000) == DVector2Array(DVector2(3, 3), DVector2(4, 4))
+
+    history.clear()
+    assert len(history) == 0
+
+    mouse.disable_motion_history()
+    assert mouse.motion_history is None
+    change_mouse_position(mouse, DVector2(0, 0), DVector2(0, 0), 0)
+    assert len(history) == 0
+
+
+def test_motion_history_path_since_press(window, mouse):
+    history = mouse.enable_motion_history(10)
+    button = mouse.get_button(MouseButtonLocation.LEFT)
+    assert button.pressed_timestamp is None
+    change_mouse_position(mouse, DVector2(0, 0), DVector2(0, 0), 1)
+    change_mouse_button(mouse, _eplatform.SDL_BUTTON_LEFT, True, 2)
+    assert button.pressed_timestamp == 2
+    change_mouse_position(mouse, DVector2(1, 0), DVector2(1, 0), 3)
+    change_mouse_position(mouse, DVector2(2, 0), DVector2(1, 0), 4)
+    change_mouse_button(mouse, _eplatform.SDL_BUTTON_LEFT, False, 5)
+    assert button.pressed_timestamp == 2
+    assert history.get_path(button.pressed_timestamp) == DVector2Array(
+        DVector2(1, 0), DVector2(2, 0)
+    )
+
+
+@pytest.mark.parametrize("x", [-1, -0.25, 0, 0.25, 1])
+@pytest.mark.parametrize("y", [-1, -0.25, 0, 0.25, 1])
 def test_scroll(mouse, x, y):
     with (
         patch.object(Mouse, "scrolled", new=MagicMock()) as mouse_scrolled,
@@ -85,27 +205,35 @@ def test_scroll(mouse, x, y):
         patch.object(mouse, "scrolled_left", new=MagicMock()) as scrolled_left,
         patch.object(mouse, "scrolled_right", new=MagicMock()) as scrolled_right,
     ):
-        scroll_mouse_wheel(mouse, IVector2(x, y))
-    mouse_scrolled.assert_called_once_with({"delta": IVector2(x, y)})
-    scrolled.assert_called_once_with({"delta": IVector2(x, y)})
+        scroll_mouse_wheel(mouse, DVector2(x, y), 5)
+    mouse_scrolled.assert_called_once_with({"delta": DVector2(x, y), "timestamp": 5})
+    scrolled.assert_called_once_with({"delta": DVector2(x, y), "timestamp": 5})
     if y:
-        mouse_scrolled_vertically.assert_called_once_with({"delta": y})
-        scrolled_vertically.assert_called_once_with({"delta": y})
+        mouse_scrolled_vertically.assert_called_once_with({"delta": y, "timestamp": 5})
+        scrolled_vertically.assert_called_once_with({"delta": y, "timestamp": 5})
         if y > 0:
-            mouse_scrolled_up.assert_called_once_with({"delta": y})
-            scrolled_up.assert_called_once_with({"delta": y})
+            mouse_scrolled_up.assert_called_once_with({"delta": y, "timestamp": 5})
+            scrolled_up.assert_called_once_with({"delta": y, "timestamp": 5})
         else:
-            mouse_scrolled_down.assert_called_once_with({"delta": y})
-            scrolled_down.assert_called_once_with({"delta": y})
+            mouse_scrolled_down.assert_called_once_with({"delta": y, "timestamp": 5})
+            scrolled_down.assert_called_once_with({"delta": y, "timestamp": 5})
     if x:
-        mouse_scrolled_horizontally.assert_called_once_with({"delta": x})
-        scrolled_horizontally.assert_called_once_with({"delta": x})
+        mouse_scrolled_horizontally.assert_called_once_with({"delta": x, "timestamp": 5})
+        scrolled_horizontally.assert_called_once_with({"delta": x, "timestamp": 5})
         if x > 0:
-            mouse_scrolled_right.assert_called_once_with({"delta": x})
-            scrolled_right.assert_called_once_with({"delta": x})
+            mouse_scrolled_right.assert_called_once_with({"delta": x, "timestamp": 5})
+            scrolled_right.assert_called_once_with({"delta": x, "timestamp": 5})
         else:
-            mouse_scrolled_left.assert_called_once_with({"delta": x})
-            scrolled_left.assert_called_once_with({"delta": x})
+            mouse_scrolled_left.assert_called_once_with({"delta": x, "timestamp": 5})
+            scrolled_left.assert_called_once_with({"delta": x, "timestamp": 5})
+
+
+def test_scroll_sample_count(mouse):
+    with patch.object(mouse, "scrolled", new=MagicMock()) as scrolled:
+        scroll_mouse_wheel(mouse, DVector2(0, 1.5), 5, 3)
+    scrolled.assert_called_once_with(
+        {"delta": DVector2(0, 1.5), "timestamp": 5, "sample_count": 3}
+    )
 
 
 @pytest.mark.parametrize(
@@ -129,8 +257,13 @@ def test_change_button(mouse, sdl_button, button_location, is_pressed):
         patch.object(button, "pressed", new=MagicMock()) as button_pressed,
         patch.object(button, "released", new=MagicMock()) as button_released,
     ):
-        change_mouse_button(mouse, sdl_button, is_pressed)
-    event_data = {"button": button, "is_pressed": is_pressed, "position": mouse.position}
+        change_mouse_button(mouse, sdl_button, is_pressed, 5)
+    event_data = {
+        "button": button,
+        "is_pressed": is_pressed,
+        "position": mouse.position,
+        "timestamp": 5,
+    }
     mouse_button_changed.assert_called_once_with(event_data)
     button_changed.assert_called_once_with(event_data)
     if is_pressed:
@@ -154,3 +287,72 @@ def test_visibility(mouse):
     mouse.hide()
     mouse.show()
     mouse.show()
+
+
+def _make_cursor_image(color, hotspot=IVector2(0)):
+    return MouseCursorImage(
+        U8Vector4Array(*(U8Vector4(*color) for i in range(16 * 16))), IVector2(16, 16), hotspot
+    )
+
+
+@pytest.mark.parametrize("shape", MouseCursorShape)
+def test_set_cursor_shape(mouse, shape):
+    mouse.set_cursor(shape)
+    assert mouse.cursor == shape
+    mouse.reset_cursor()
+    assert mouse.cursor == MouseCursorShape.DEFAULT
+
+
+def test_set_cursor_image(mouse):
+    image = _make_cursor_image((255, 0, 0, 255))
+    mouse.set_cursor(image)
+    assert mouse.cursor == image
+    assert len(mouse._sdl_cursors) == 1
+
+    mouse.set_cursor(MouseCursorShape.DEFAULT)
+    mouse.set_cursor(_make_cursor_image((255, 0, 0, 255)))
+    assert len(mouse._sdl_cursors) == 1
+
+    mouse.set_cursor(_make_cursor_image((255, 0, 0, 255), IVector2(1, 1)))
+    assert len(mouse._sdl_cursors) == 2
+
+    mouse.reset_cursor()
+    assert mouse.cursor == MouseCursorShape.DEFAULT
+    assert not mouse._sdl_cursors
+
+
+@pytest.mark.parametrize("size", [IVector2(16, 15), IVector2(17, 16), IVector2(-16, -16)])
+def test_set_cursor_image_invalid_size(mouse, size):
+    image = MouseCursorImage(
+        U8Vector4Array(*(U8Vector4(255) for i in range(16 * 16))), size, IVector2(0)
+    )
+    with pytest.raises(ValueError) as excinfo:
+        mouse.set_cursor(image)
+    assert str(excinfo.value) == f"expected {size.x} x {size.y} pixels, got 256"
+    assert mouse.cursor == MouseCursorShape.DEFAULT
+    assert not mouse._sdl_cursors
+
+
+def test_cursor_cache_eviction(mouse):
+    mouse.cursor_cache_capacity = 2
+    red = _make_cursor_image((255, 0, 0, 255))
+    green = _make_cursor_image((0, 255, 0, 255))
+    blue = _make_cursor_image((0, 0, 255, 255))
+    mouse.set_cursor(red)
+    mouse.set_cursor(green)
+    mouse.set_cursor(red)
+    mouse.set_cursor(blue)
+    assert list(mouse._sdl_cursors) == [red, blue]
+    assert mouse.cursor == blue
+
+    mouse.cursor_cache_capacity = 1
+    assert list(mouse._sdl_cursors) == [blue]
+    assert mouse.cursor == blue
+
+
+@pytest.mark.parametrize("capacity", [-1, 0])
+def test_cursor_cache_invalid_capacity(mouse, capacity):
+    with pytest.raises(ValueError) as excinfo:
+        mouse.cursor_cache_capacity = capacity
+    assert str(excinfo.value) == "cursor cache capacity must be greater than 0"
+    assert mouse.cursor_cache_capacity == 32
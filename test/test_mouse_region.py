@@ -0,0 +1,276 @@
+from unittest.mock import MagicMock
+from unittest.mock import call
+from unittest.mock import patch
+
+import pytest
+from eevent import Event
+from egeometry import IRectangle
+from emath import DVector2
+from emath import IVector2
+
+from eplatform import MouseButtonLocation
+from eplatform import MouseRegion
+from eplatform import MouseRegionGrid
+from eplatform import _eplatform
+from eplatform._mouse import change_mouse_button
+from eplatform._mouse import change_mouse_position
+from eplatform._mouse_region import change_mouse_regions_button
+from eplatform._mouse_region import hover_mouse_regions
+
+
+def test_attrs():
+    assert isinstance(MouseRegion.entered, Event)
+    assert isinstance(MouseRegion.left, Event)
+    assert isinstance(MouseRegion.pressed, Event)
+    assert isinstance(MouseRegion.released, Event)
+
+    rectangle = IRectangle(IVector2(1, 2), IVector2(3, 4))
+    region = MouseRegion(rectangle)
+    assert region.rectangle == rectangle
+    assert not region.is_hovered
+    assert isinstance(region.entered, Event)
+    assert isinstance(region.left, Event)
+    assert isinstance(region.pressed, Event)
+    assert isinstance(region.released, Event)
+    assert repr(region) == f"<MouseRegion {rectangle!r}>"
+
+    grid = MouseRegionGrid()
+    assert grid.cell_size == 64
+    assert len(grid) == 0
+    assert region not in grid
+
+
+@pytest.mark.parametrize("cell_size", [-1, 0])
+def test_grid_invalid_cell_size(cell_size):
+    with pytest.raises(ValueError) as excinfo:
+        MouseRegionGrid(cell_size)
+    assert str(excinfo.value) == "cell size must be greater than 0"
+
+
+def test_grid_add_remove():
+    grid = MouseRegionGrid(10)
+    region = MouseRegion(IRectangle(IVector2(5, 5), IVector2(20, 20)))
+    grid.add(region)
+    assert len(grid) == 1
+    assert region in grid
+    assert grid._cells.keys() == {(x, y) for x in range(3) for y in range(3)}
+
+    with pytest.raises(ValueError) as excinfo:
+        grid.add(region)
+    assert str(excinfo.value) == "region is already in a grid"
+    with pytest.raises(ValueError) as excinfo:
+        MouseRegionGrid().add(region)
+    assert str(excinfo.value) == "region is already in a grid"
+    with pytest.raises(ValueError) as excinfo:
+        MouseRegionGrid().remove(region)
+    assert str(excinfo.value) == "region is not in this grid"
+
+    grid.remove(region)
+    assert len(grid) == 0
+    assert region not in grid
+    assert not grid._cells
+
+    with pytest.raises(ValueError) as excinfo:
+        grid.remove(region)
+    assert str(excinfo.value) == "region is not in this grid"
+
+
+@pytest.mark.parametrize(
+    "position, expected",
+    [
+        (DVector2(0, 0), ("a",)),
+        (DVector2(9.5, 9.5), ("a", "b")),
+        (DVector2(10, 10), ("b",)),
+        (DVector2(29.9, 5), ("b",)),
+        (DVector2(30, 5), ()),
+        (DVector2(-0.5, 0), ()),
+        (DVector2(-6, -6), ("c",)),
+        (DVector2(-5, -5), ()),
+        (DVector2(1000, 1000), ()),
+    ],
+)
+def test_grid_get_regions_at(position, expected):
+    grid = MouseRegionGrid(8)
+    regions = {
+        "a": MouseRegion(IRectangle(IVector2(0, 0), IVector2(10, 10))),
+        "b": MouseRegion(IRectangle(IVector2(5, 5), IVector2(25, 25))),
+        "c": MouseRegion(IRectangle(IVector2(-10, -10), IVector2(5, 5))),
+    }
+    for region in regions.values():
+        grid.add(region)
+    assert grid.get_regions_at(position) == tuple(regions[n] for n in expected)
+
+
+def test_region_move():
+    grid = MouseRegionGrid(10)
+    region = MouseRegion(IRectangle(IVector2(0, 0), IVector2(5, 5)))
+    region.rectangle = IRectangle(IVector2(100, 0), IVector2(5, 5))
+    grid.add(region)
+    assert grid.get_regions_at(DVector2(1, 1)) == ()
+    assert grid.get_regions_at(DVector2(101, 1)) == (region,)
+
+    region.rectangle = IRectangle(IVector2(0, 0), IVector2(5, 5))
+    assert grid.get_regions_at(DVector2(1, 1)) == (region,)
+    assert grid.get_regions_at(DVector2(101, 1)) == ()
+    assert grid._cells.keys() == {(0, 0)}
+
+
+def test_region_move_hover():
+    grid = MouseRegionGrid(10)
+    region = MouseRegion(IRectangle(IVector2(0, 0), IVector2(5, 5)))
+    grid.add(region)
+    with (
+        patch.object(region, "entered", new=MagicMock()) as entered,
+        patch.object(region, "left", new=MagicMock()) as left,
+    ):
+        # nothing is hovered until the mouse position is known
+        region.rectangle = IRectangle(IVector2(20, 20), IVector2(5, 5))
+        entered.assert_not_called()
+
+        hover_mouse_regions(grid, DVector2(1, 1), 1)
+        entered.assert_not_called()
+
+        region.rectangle = IRectangle(IVector2(0, 0), IVector2(5, 5))
+        entered.assert_called_once_with(
+            {"region": region, "position": DVector2(1, 1), "timestamp": 1}
+        )
+        assert region.is_hovered
+        left.assert_not_called()
+
+        region.rectangle = IRectangle(IVector2(2, 2), IVector2(5, 5))
+        left.assert_called_once_with(
+            {"region": region, "position": DVector2(1, 1), "timestamp": 1}
+        )
+        assert not region.is_hovered
+    assert grid.get_regions_at(DVector2(1, 1)) == ()
+
+
+def test_remove_unhovered():
+    grid = MouseRegionGrid(10)
+    region = MouseRegion(IRectangle(IVector2(0, 0), IVector2(5, 5)))
+    grid.add(region)
+    hover_mouse_regions(grid, DVector2(20, 20), 1)
+    with patch.object(region, "left", new=MagicMock()) as left:
+        grid.remove(region)
+    left.assert_not_called()
+
+
+def test_hover():
+    grid = MouseRegionGrid(10)
+    region_a = MouseRegion(IRectangle(IVector2(0, 0), IVector2(10, 10)))
+    region_b = MouseRegion(IRectangle(IVector2(5, 5), IVector2(10, 10)))
+    grid.add(region_a)
+    grid.add(region_b)
+    with (
+        patch.object(MouseRegion, "entered", new=MagicMock()) as mouse_region_entered,
+        patch.object(MouseRegion, "left", new=MagicMock()) as mouse_region_left,
+        patch.object(region_a, "entered", new=MagicMock()) as a_entered,
+        patch.object(region_a, "left", new=MagicMock()) as a_left,
+        patch.object(region_b, "entered", new=MagicMock()) as b_entered,
+        patch.object(region_b, "left", new=MagicMock()) as b_left,
+    ):
+        hover_mouse_regions(grid, DVector2(1, 1), 1)
+        a_entered.assert_called_once_with(
+            {"region": region_a, "position": DVector2(1, 1), "timestamp": 1}
+        )
+        assert region_a.is_hovered
+        assert not region_b.is_hovered
+
+        hover_mouse_regions(grid, DVector2(2, 2), 2)
+        a_entered.assert_called_once()
+
+        hover_mouse_regions(grid, DVector2(7, 7), 3)
+        b_entered.assert_called_once_with(
+            {"region": region_b, "position": DVector2(7, 7), "timestamp": 3}
+        )
+        assert region_a.is_hovered
+        assert region_b.is_hovered
+
+        hover_mouse_regions(grid, DVector2(12, 12), 4)
+        a_left.assert_called_once_with(
+            {"region": region_a, "position": DVector2(12, 12), "timestamp": 4}
+        )
+        assert not region_a.is_hovered
+        assert region_b.is_hovered
+
+        grid.remove(region_b)
+        assert not region_b.is_hovered
+        b_left.assert_called_once_with(
+            {"region": region_b, "position": DVector2(12, 12), "timestamp": 4}
+        )
+        hover_mouse_regions(grid, DVector2(100, 100), 5)
+        b_left.assert_called_once()
+
+    assert mouse_region_entered.call_args_list == [
+        call({"region": region_a, "position": DVector2(1, 1), "timestamp": 1}),
+        call({"region": region_b, "position": DVector2(7, 7), "timestamp": 3}),
+    ]
+    assert mouse_region_left.call_args_list == [
+        call({"region": region_a, "position": DVector2(12, 12), "timestamp": 4}),
+        call({"region": region_b, "position": DVector2(12, 12), "timestamp": 4}),
+    ]
+
+
+@pytest.mark.parametrize("is_pressed", [False, True])
+def test_change_button(mouse, is_pressed):
+    grid = MouseRegionGrid(10)
+    region_a = MouseRegion(IRectangle(IVector2(0, 0), IVector2(10, 10)))
+    region_b = MouseRegion(IRectangle(IVector2(20, 20), IVector2(10, 10)))
+    grid.add(region_a)
+    grid.add(region_b)
+    hover_mouse_regions(grid, DVector2(1, 1), 0)
+    button = mouse.get_button(MouseButtonLocation.LEFT)
+    with (
+        patch.object(MouseRegion, "pressed", new=MagicMock()) as mouse_region_pressed,
+        patch.object(MouseRegion, "released", new=MagicMock()) as mouse_region_released,
+        patch.object(region_a, "pressed", new=MagicMock()) as a_pressed,
+        patch.object(region_a, "released", new=MagicMock()) as a_released,
+        patch.object(region_b, "pressed", new=MagicMock()) as b_pressed,
+        patch.object(region_b, "released", new=MagicMock()) as b_released,
+    ):
+        change_mouse_regions_button(grid, button, is_pressed, DVector2(1, 1), 5)
+    event_data = {
+        "region": region_a,
+        "button": button,
+        "is_pressed": is_pressed,
+        "position": DVector2(1, 1),
+        "timestamp": 5,
+    }
+    if is_pressed:
+        mouse_region_pressed.assert_called_once_with(event_data)
+        a_pressed.assert_called_once_with(event_data)
+        mouse_region_released.assert_not_called()
+        a_released.assert_not_called()
+    else:
+        mouse_region_released.assert_called_once_with(event_data)
+        a_released.assert_called_once_with(event_data)
+        mouse_region_pressed.assert_not_called()
+        a_pressed.assert_not_called()
+    b_pressed.assert_not_called()
+    b_released.assert_not_called()
+
+
+def test_window_mouse_regions(window, mouse):
+    assert isinstance(window.mouse_regions, MouseRegionGrid)
+    region = MouseRegion(IRectangle(IVector2(0, 0), IVector2(10, 10)))
+    window.mouse_regions.add(region)
+    with (
+        patch.object(region, "entered", new=MagicMock()) as entered,
+        patch.object(region, "pressed", new=MagicMock()) as pressed,
+    ):
+        change_mouse_position(
+            mouse, DVector2(1, 1), DVector2(1, 1), 1, mouse_regions=window.mouse_regions
+        )
+        change_mouse_button(
+            mouse, _eplatform.SDL_BUTTON_LEFT, True, 2, mouse_regions=window.mouse_regions
+        )
+    entered.assert_called_once()
+    pressed.assert_called_once_with(
+        {
+            "region": region,
+            "button": mouse.get_button(MouseButtonLocation.LEFT),
+            "is_pressed": True,
+            "position": DVector2(1, 1),
+            "timestamp": 2,
+        }
+    )
@@ -0,0 +1,147 @@
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import pytest
+from eevent import Event
+from emath import DVector2
+
+from eplatform import Pen
+from eplatform import PenAxis
+from eplatform import _eplatform
+from eplatform._pen import change_pen_axis
+from eplatform._pen import change_pen_press
+from eplatform._pen import change_pen_proximity
+from eplatform._pen import move_pen
+
+
+def test_attrs(pen):
+    assert isinstance(Pen.moved, Event)
+    assert isinstance(Pen.pressed, Event)
+    assert isinstance(Pen.released, Event)
+    assert isinstance(Pen.axis_changed, Event)
+    assert isinstance(Pen.entered, Event)
+    assert isinstance(Pen.left, Event)
+
+    assert isinstance(pen.moved, Event)
+    assert isinstance(pen.pressed, Event)
+    assert isinstance(pen.released, Event)
+    assert isinstance(pen.axis_changed, Event)
+    assert isinstance(pen.entered, Event)
+    assert isinstance(pen.left, Event)
+
+    assert pen.pen_id == 0
+    assert pen.position == DVector2(0)
+    assert not pen.is_in_proximity
+    assert not pen.is_down
+    assert not pen.is_eraser
+    assert pen.pressure == 0
+    assert pen.tilt == DVector2(0)
+    for axis in PenAxis:
+        assert pen.get_axis(axis) == 0
+
+
+@pytest.mark.parametrize("is_in_proximity", [False, True])
+def test_change_proximity(pen, is_in_proximity):
+    with (
+        patch.object(Pen, "entered", new=MagicMock()) as pen_entered,
+        patch.object(Pen, "left", new=MagicMock()) as pen_left,
+        patch.object(pen, "entered", new=MagicMock()) as entered,
+        patch.object(pen, "left", new=MagicMock()) as left,
+    ):
+        change_pen_proximity(pen, 3, is_in_proximity, 5)
+    event_data = {"is_in_proximity": is_in_proximity, "timestamp": 5}
+    if is_in_proximity:
+        pen_entered.assert_called_once_with(event_data)
+        entered.assert_called_once_with(event_data)
+        pen_left.assert_not_called()
+        left.assert_not_called()
+    else:
+        pen_left.assert_called_once_with(event_data)
+        left.assert_called_once_with(event_data)
+        pen_entered.assert_not_called()
+        entered.assert_not_called()
+    assert pen.pen_id == 3
+    assert pen.is_in_proximity == is_in_proximity
+
+
+def test_move(pen):
+    with (
+        patch.object(Pen, "moved", new=MagicMock()) as pen_moved,
+        patch.object(pen, "moved", new=MagicMock()) as moved,
+    ):
+        move_pen(pen, 3, 1.5, 2.5, 5)
+    event_data = {"position": DVector2(1.5, 2.5), "timestamp": 5}
+    pen_moved.assert_called_once_with(event_data)
+    moved.assert_called_once_with(event_data)
+    assert pen.pen_id == 3
+    assert pen.position == DVector2(1.5, 2.5)
+
+
+@pytest.mark.parametrize("is_down", [False, True])
+@pytest.mark.parametrize("is_eraser", [False, True])
+def test_change_press(pen, is_down, is_eraser):
+    with (
+        patch.object(Pen, "pressed", new=MagicMock()) as pen_pressed,
+        patch.object(Pen, "released", new=MagicMock()) as pen_released,
+        patch.object(pen, "pressed", new=MagicMock()) as pressed,
+        patch.object(pen, "released", new=MagicMock()) as released,
+    ):
+        change_pen_press(pen, 3, 1.5, 2.5, is_down, is_eraser, 5)
+    event_data = {
+        "is_down": is_down,
+        "is_eraser": is_eraser,
+        "position": DVector2(1.5, 2.5),
+        "timestamp": 5,
+    }
+    if is_down:
+        pen_pressed.assert_called_once_with(event_data)
+        pressed.assert_called_once_with(event_data)
+        pen_released.assert_not_called()
+        released.assert_not_called()
+    else:
+        pen_released.assert_called_once_with(event_data)
+        released.assert_called_once_with(event_data)
+        pen_pressed.assert_not_called()
+        pressed.assert_not_called()
+    assert pen.pen_id == 3
+    assert pen.position == DVector2(1.5, 2.5)
+    assert pen.is_down == is_down
+    assert pen.is_eraser == is_eraser
+
+
+@pytest.mark.parametrize(
+    "sdl_pen_axis, axis",
+    [
+        (_eplatform.SDL_PEN_AXIS_PRESSURE, PenAxis.PRESSURE),
+        (_eplatform.SDL_PEN_AXIS_XTILT, PenAxis.X_TILT),
+        (_eplatform.SDL_PEN_AXIS_YTILT, PenAxis.Y_TILT),
+        (_eplatform.SDL_PEN_AXIS_DISTANCE, PenAxis.DISTANCE),
+        (_eplatform.SDL_PEN_AXIS_ROTATION, PenAxis.ROTATION),
+        (_eplatform.SDL_PEN_AXIS_SLIDER, PenAxis.SLIDER),
+        (_eplatform.SDL_PEN_AXIS_TANGENTIAL_PRESSURE, PenAxis.TANGENTIAL_PRESSURE),
+    ],
+)
+def test_change_axis(pen, sdl_pen_axis, axis):
+    with (
+        patch.object(Pen, "axis_changed", new=MagicMock()) as pen_axis_changed,
+        patch.object(pen, "axis_changed", new=MagicMock()) as axis_changed,
+    ):
+        assert change_pen_axis(pen, 3, 1.5, 2.5, sdl_pen_axis, 0.5, 5)
+    event_data = {"axis": axis, "value": 0.5, "timestamp": 5}
+    pen_axis_changed.assert_called_once_with(event_data)
+    axis_changed.assert_called_once_with(event_data)
+    assert pen.pen_id == 3
+    assert pen.position == DVector2(1.5, 2.5)
+    assert pen.get_axis(axis) == 0.5
+    if axis == PenAxis.PRESSURE:
+        assert pen.pressure == 0.5
+    elif axis == PenAxis.X_TILT:
+        assert pen.tilt == DVector2(0.5, 0)
+    elif axis == PenAxis.Y_TILT:
+        assert pen.tilt == DVector2(0, 0.5)
+
+
+def test_change_axis_unexpected(pen):
+    with patch.object(pen, "axis_changed", new=MagicMock()) as axis_changed:
+        assert not change_pen_axis(pen, 3, 1.5, 2.5, _eplatform.SDL_PEN_AXIS_COUNT, 0.5, 5)
+    axis_changed.assert_not_called()
@@ -4,18 +4,29 @@ from unittest.mock import patch
 
 import pytest
 
+from eplatform import InputKind
 from eplatform import Keyboard
 from eplatform import Mouse
 from eplatform import OpenGlWindow
+from eplatform import Pen
 from eplatform import Platform
+from eplatform import Touch
 from eplatform import VulkanWindow
 from eplatform import Window
+from eplatform import _eplatform
 from eplatform import get_clipboard
+from eplatform import get_disabled_input
 from eplatform import get_displays
 from eplatform import get_keyboard
 from eplatform import get_mouse
+from eplatform import get_pen
+from eplatform import get_touch
 from eplatform import get_window
 from eplatform import set_clipboard
+from eplatform import set_disabled_input
+from eplatform._eplatform import clear_sdl_events
+from eplatform._eplatform import get_sdl_events
+from eplatform._eplatform import push_sdl_event
 
 
 def test_platform_already_active(platform):
@@ -90,6 +101,28 @@ def test_get_keyboard(platform):
     assert isinstance(keyboard, Keyboard)
 
 
+def test_get_touch_no_platform():
+    with pytest.raises(RuntimeError) as excinfo:
+        get_touch()
+    assert str(excinfo.value) == "platform is not active"
+
+
+def test_get_touch(platform):
+    touch = get_touch()
+    assert isinstance(touch, Touch)
+
+
+def test_get_pen_no_platform():
+    with pytest.raises(RuntimeError) as excinfo:
+        get_pen()
+    assert str(excinfo.value) == "platform is not active"
+
+
+def test_get_pen(platform):
+    pen = get_pen()
+    assert isinstance(pen, Pen)
+
+
 def test_deactivate_callbacks():
     mock_callback = Mock()
     Platform.register_deactivate_callback(mock_callback)
@@ -109,13 +142,25 @@ def test_platform_custom_cls():
     class CustomKeyboard(Keyboard):
         pass
 
+    class CustomTouch(Touch):
+        pass
+
+    class CustomPen(Pen):
+        pass
+
     platform = Platform(
-        window_cls=CustomWindow, mouse_cls=CustomMouse, keyboard_cls=CustomKeyboard
+        window_cls=CustomWindow,
+        mouse_cls=CustomMouse,
+        keyboard_cls=CustomKeyboard,
+        touch_cls=CustomTouch,
+        pen_cls=CustomPen,
     )
     with platform:
         assert isinstance(get_window(), CustomWindow)
         assert isinstance(get_mouse(), CustomMouse)
         assert isinstance(get_keyboard(), CustomKeyboard)
+        assert isinstance(get_touch(), CustomTouch)
+        assert isinstance(get_pen(), CustomPen)
 
 
 @pytest.mark.parametrize("data", ["", "one two three"])
@@ -134,6 +179,45 @@ def test_clipboard_no_platform():
     assert str(excinfo.value) == "platform is not active"
 
 
+@pytest.mark.parametrize(
+    "disabled_input, sdl_event_type, push_args",
+    [
+        (InputKind.MOUSE_MOTION, _eplatform.SDL_EVENT_MOUSE_MOTION, (0, 0, 0, 0)),
+        (InputKind.MOUSE_WHEEL, _eplatform.SDL_EVENT_MOUSE_WHEEL, (False, 0, 1)),
+        (InputKind.MOUSE_BUTTON, _eplatform.SDL_EVENT_MOUSE_BUTTON_DOWN, (1, True)),
+        (InputKind.KEY, _eplatform.SDL_EVENT_KEY_DOWN, (4, True, False, 0)),
+        (InputKind.TOUCH, _eplatform.SDL_EVENT_FINGER_DOWN, (1, 2, 0.5, 0.5, 0, 0, 1)),
+        (InputKind.PEN, _eplatform.SDL_EVENT_PEN_MOTION, (1, 0.5, 0.5)),
+    ],
+)
+def test_disabled_input(disabled_input, sdl_event_type, push_args):
+    with Platform(disabled_input=disabled_input):
+        assert get_disabled_input() == disabled_input
+        clear_sdl_events()
+        push_sdl_event(sdl_event_type, *push_args)
+        assert get_sdl_events(1) == []
+
+        set_disabled_input(InputKind.NONE)
+        assert get_disabled_input() == InputKind.NONE
+        push_sdl_event(sdl_event_type, *push_args)
+        assert [e[0] for e in get_sdl_events(1)] == [sdl_event_type]
+
+        set_disabled_input(disabled_input)
+        push_sdl_event(sdl_event_type, *push_args)
+        assert get_sdl_events(1) == []
+    with Platform():
+        assert get_disabled_input() == InputKind.NONE
+
+
+def test_disabled_input_no_platform():
+    with pytest.raises(RuntimeError) as excinfo:
+        get_disabled_input()
+    assert str(excinfo.value) == "platform is not active"
+    with pytest.raises(RuntimeError) as excinfo:
+        set_disabled_input(InputKind.NONE)
+    assert str(excinfo.value) == "platform is not active"
+
+
 def test_get_displays(platform):
     displays = [object(), object()]
     with patch("eplatform._platform._get_displays", return_value=displays) as get_displays_mock:
@@ -0,0 +1,137 @@
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from eevent import Event
+from emath import DVector2
+
+from eplatform import Touch
+from eplatform._touch import move_touch_finger
+from eplatform._touch import press_touch_finger
+from eplatform._touch import release_touch_finger
+
+
+def test_attrs(touch):
+    assert isinstance(Touch.finger_pressed, Event)
+    assert isinstance(Touch.finger_moved, Event)
+    assert isinstance(Touch.finger_released, Event)
+
+    assert isinstance(touch.finger_pressed, Event)
+    assert isinstance(touch.finger_moved, Event)
+    assert isinstance(touch.finger_released, Event)
+
+    assert touch.finger_count == 0
+    assert touch.fingers == ()
+    assert not touch.is_finger_down(3, 1)
+
+
+def test_press_move_release(touch):
+    with (
+        patch.object(Touch, "finger_pressed", new=MagicMock()) as touch_finger_pressed,
+        patch.object(touch, "finger_pressed", new=MagicMock()) as finger_pressed,
+    ):
+        press_touch_finger(touch, 3, 1, 0.25, 0.5, 0.75, 5)
+    event_data = {
+        "touch_id": 3,
+        "finger_id": 1,
+        "position": DVector2(0.25, 0.5),
+        "delta": DVector2(0),
+        "pressure": 0.75,
+        "timestamp": 5,
+    }
+    touch_finger_pressed.assert_called_once_with(event_data)
+    finger_pressed.assert_called_once_with(event_data)
+    assert touch.finger_count == 1
+    assert touch.fingers == ((3, 1),)
+    assert touch.is_finger_down(3, 1)
+    assert touch.get_finger_position(3, 1) == DVector2(0.25, 0.5)
+    assert touch.get_finger_pressure(3, 1) == 0.75
+
+    with (
+        patch.object(Touch, "finger_moved", new=MagicMock()) as touch_finger_moved,
+        patch.object(touch, "finger_moved", new=MagicMock()) as finger_moved,
+    ):
+        move_touch_finger(touch, 3, 1, 0.5, 0.25, 0.25, -0.25, 0.5, 6)
+    event_data = {
+        "touch_id": 3,
+        "finger_id": 1,
+        "position": DVector2(0.5, 0.25),
+        "delta": DVector2(0.25, -0.25),
+        "pressure": 0.5,
+        "timestamp": 6,
+    }
+    touch_finger_moved.assert_called_once_with(event_data)
+    finger_moved.assert_called_once_with(event_data)
+    assert touch.get_finger_position(3, 1) == DVector2(0.5, 0.25)
+    assert touch.get_finger_pressure(3, 1) == 0.5
+
+    with (
+        patch.object(Touch, "finger_released", new=MagicMock()) as touch_finger_released,
+        patch.object(touch, "finger_released", new=MagicMock()) as finger_released,
+    ):
+        release_touch_finger(touch, 3, 1, 0.5, 0.25, 0, 7)
+    event_data = {
+        "touch_id": 3,
+        "finger_id": 1,
+        "position": DVector2(0.5, 0.25),
+        "delta": DVector2(0),
+        "pressure": 0,
+        "timestamp": 7,
+    }
+    touch_finger_released.assert_called_once_with(event_data)
+    finger_released.assert_called_once_with(event_data)
+    assert touch.finger_count == 0
+    assert touch.fingers == ()
+    assert not touch.is_finger_down(3, 1)
+
+
+def test_unknown_finger(touch):
+    press_touch_finger(touch, 3, 1, 0.25, 0.5, 0.75, 5)
+    with (
+        patch.object(touch, "finger_moved", new=MagicMock()) as finger_moved,
+        patch.object(touch, "finger_released", new=MagicMock()) as finger_released,
+    ):
+        move_touch_finger(touch, 4, 1, 0.5, 0.25, 0.25, -0.25, 0.5, 6)
+        release_touch_finger(touch, 4, 1, 0.5, 0.25, 0, 7)
+        move_touch_finger(touch, 3, 2, 0.5, 0.25, 0.25, -0.25, 0.5, 6)
+        release_touch_finger(touch, 3, 2, 0.5, 0.25, 0, 7)
+    finger_moved.assert_not_called()
+    finger_released.assert_not_called()
+    assert touch.fingers == ((3, 1),)
+
+
+def test_same_finger_id_on_different_devices(touch):
+    press_touch_finger(touch, 3, 1, 0.25, 0.5, 0.75, 5)
+    press_touch_finger(touch, 4, 1, 0.75, 0.5, 0.25, 5)
+    assert touch.finger_count == 2
+    assert touch.fingers == ((3, 1), (4, 1))
+    assert touch.get_finger_position(3, 1) == DVector2(0.25, 0.5)
+    assert touch.get_finger_position(4, 1) == DVector2(0.75, 0.5)
+
+    move_touch_finger(touch, 4, 1, 1, 1, 0.25, 0.5, 0.5, 6)
+    assert touch.get_finger_position(3, 1) == DVector2(0.25, 0.5)
+    assert touch.get_finger_position(4, 1) == DVector2(1, 1)
+
+    release_touch_finger(touch, 3, 1, 0.25, 0.5, 0, 7)
+    assert touch.fingers == ((4, 1),)
+    assert touch.get_finger_position(4, 1) == DVector2(1, 1)
+    assert touch.get_finger_pressure(4, 1) == 0.5
+
+
+def test_many_fingers(touch):
+    for i in range(25):
+        press_touch_finger(touch, i % 2, 100 + i, i, -i, i / 100, 0)
+    assert touch.finger_count == 25
+    assert touch.fingers == tuple((i % 2, 100 + i) for i in range(25))
+
+    for i in range(0, 25, 2):
+        release_touch_finger(touch, 0, 100 + i, i, -i, 0, 0)
+    assert touch.finger_count == 12
+    assert sorted(touch.fingers) == [(1, 100 + i) for i in range(1, 25, 2)]
+    for i in range(1, 25, 2):
+        assert touch.is_finger_down(1, 100 + i)
+        assert touch.get_finger_position(1, 100 + i) == DVector2(i, -i)
+        assert touch.get_finger_pressure(1, 100 + i) == i / 100
+
+    move_touch_finger(touch, 1, 123, 1, 2, 0, 0, 1, 0)
+    assert touch.get_finger_position(1, 123) == DVector2(1, 2)
+    assert touch.get_finger_position(1, 101) == DVector2(1, -1)
@@ -15,6 +15,7 @@ from eplatform import get_displays
 from eplatform._window import blur_window
 from eplatform._window import close_window
 from eplatform._window import delete_window
+from eplatform._window import edit_window_text
 from eplatform._window import focus_window
 from eplatform._window import hide_window
 from eplatform._window import input_window_text
@@ -48,11 +49,11 @@ def test_position(window):
         patch.object(Window, "moved", new=MagicMock()) as window_moved,
         patch.object(window, "moved", new=MagicMock()) as moved,
     ):
-        move_window(window, new_position)
+        move_window(window, new_position, 5)
 
     assert window.position == new_position
-    window_moved.assert_called_once_with({"position": new_position})
-    moved.assert_called_once_with({"position": new_position})
+    window_moved.assert_called_once_with({"position": new_position, "timestamp": 5})
+    moved.assert_called_once_with({"position": new_position, "timestamp": 5})
 
 
 @pytest.mark.disruptive
@@ -162,11 +163,12 @@ def test_size(window):
         patch.object(Window, "resized", new=MagicMock()) as window_resized,
         patch.object(window, "resized", new=MagicMock()) as resized,
     ):
-        resize_window(window, IVector2(100, 101))
+        resize_window(window, IVector2(100, 101), 5)
 
     assert window.size == IVector2(100, 101)
-    window_resized.assert_called_once_with({"size": IVector2(100, 101), "is_maximized": False})
-    resized.assert_called_once_with({"size": IVector2(100, 101), "is_maximized": False})
+    event_data = {"size": IVector2(100, 101), "is_maximized": False, "timestamp": 5}
+    window_resized.assert_called_once_with(event_data)
+    resized.assert_called_once_with(event_data)
 
 
 @pytest.mark.parametrize("event_object", [Window, None])
@@ -187,19 +189,21 @@ def test_is_maximized(window):
         patch.object(Window, "resized", new=MagicMock()) as window_resized,
         patch.object(window, "resized", new=MagicMock()) as resized,
     ):
-        maximize_window(window)
+        maximize_window(window, 5)
 
-    window_resized.assert_called_once_with({"size": window.size, "is_maximized": True})
-    resized.assert_called_once_with({"size": window.size, "is_maximized": True})
+    event_data = {"size": window.size, "is_maximized": True, "timestamp": 5}
+    window_resized.assert_called_once_with(event_data)
+    resized.assert_called_once_with(event_data)
 
     with (
         patch.object(Window, "resized", new=MagicMock()) as window_resized,
         patch.object(window, "resized", new=MagicMock()) as resized,
     ):
-        unmaximize_window(window)
+        unmaximize_window(window, 5)
 
-    window_resized.assert_called_once_with({"size": window.size, "is_maximized": False})
-    resized.assert_called_once_with({"size": window.size, "is_maximized": False})
+    event_data = {"size": window.size, "is_maximized": False, "timestamp": 5}
+    window_resized.assert_called_once_with(event_data)
+    resized.assert_called_once_with(event_data)
 
 
 @pytest.mark.disruptive
@@ -233,12 +237,12 @@ def test_is_visible(window):
         patch.object(window, "visibility_changed", new=MagicMock()) as visibility_changed,
         patch.object(window, "shown", new=MagicMock()) as shown,
     ):
-        show_window(window)
+        show_window(window, 5)
     assert window.is_visible
-    window_visibility_changed.assert_called_once_with({"is_visible": True})
-    window_shown.assert_called_once_with({"is_visible": True})
-    visibility_changed.assert_called_once_with({"is_visible": True})
-    shown.assert_called_once_with({"is_visible": True})
+    window_visibility_changed.assert_called_once_with({"is_visible": True, "timestamp": 5})
+    window_shown.assert_called_once_with({"is_visible": True, "timestamp": 5})
+    visibility_changed.assert_called_once_with({"is_visible": True, "timestamp": 5})
+    shown.assert_called_once_with({"is_visible": True, "timestamp": 5})
 
     with (
         patch.object(Window, "visibility_changed", new=MagicMock()) as window_visibility_changed,
@@ -246,12 +250,12 @@ def test_is_visible(window):
         patch.object(window, "visibility_changed", new=MagicMock()) as visibility_changed,
         patch.object(window, "hidden", new=MagicMock()) as hidden,
     ):
-        hide_window(window)
+        hide_window(window, 5)
     assert not window.is_visible
-    window_visibility_changed.assert_called_once_with({"is_visible": False})
-    window_hidden.assert_called_once_with({"is_visible": False})
-    visibility_changed.assert_called_once_with({"is_visible": False})
-    hidden.assert_called_once_with({"is_visible": False})
+    window_visibility_changed.assert_called_once_with({"is_visible": False, "timestamp": 5})
+    window_hidden.assert_called_once_with({"is_visible": False, "timestamp": 5})
+    visibility_changed.assert_called_once_with({"is_visible": False, "timestamp": 5})
+    hidden.assert_called_once_with({"is_visible": False, "timestamp": 5})
 
 
 @pytest.mark.disruptive
@@ -305,9 +309,37 @@ def test_input_text(window, text):
         patch.object(Window, "text_inputted", new=MagicMock()) as wiindow_text_inputted,
         patch.object(window, "text_inputted", new=MagicMock()) as text_inputted,
     ):
-        input_window_text(window, text)
-    wiindow_text_inputted.assert_called_once_with({"text": text})
-    text_inputted.assert_called_once_with({"text": text})
+        input_window_text(window, text, 5)
+    wiindow_text_inputted.assert_called_once_with({"text": text, "timestamp": 5})
+    text_inputted.assert_called_once_with({"text": text, "timestamp": 5})
+
+
+@pytest.mark.parametrize("text", ["", "hello", "私"])
+@pytest.mark.parametrize(
+    "cursor_position, selection_length, expected_cursor_position, expected_selection_length",
+    [(-1, -1, None, None), (0, 0, 0, 0), (1, 2, 1, 2)],
+)
+def test_edit_text(
+    window,
+    text,
+    cursor_position,
+    selection_length,
+    expected_cursor_position,
+    expected_selection_length,
+):
+    with (
+        patch.object(Window, "text_edited", new=MagicMock()) as window_text_edited,
+        patch.object(window, "text_edited", new=MagicMock()) as text_edited,
+    ):
+        edit_window_text(window, text, cursor_position, selection_length, 5)
+    data = {
+        "text": text,
+        "cursor_position": expected_cursor_position,
+        "selection_length": expected_selection_length,
+        "timestamp": 5,
+    }
+    window_text_edited.assert_called_once_with(data)
+    text_edited.assert_called_once_with(data)
 
 
 def test_start_stop_input(window):